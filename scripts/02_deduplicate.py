@@ -4,24 +4,272 @@ Stage 2: Deduplication of Papers from Multiple Databases
 
 Removes duplicate papers across Semantic Scholar, OpenAlex, and arXiv results.
 Uses multiple matching strategies: DOI exact match, title fuzzy matching, and arXiv ID.
+Optionally (--abstract-check) compares SimHash fingerprints of abstracts inside
+each title block.
 
 Usage:
     python scripts/02_deduplicate.py --project <project_path>
 
 Example:
     python scripts/02_deduplicate.py --project projects/2025-10-13_AI-Chatbots
+
+    # Corpora larger than RAM: stream the identification store in chunks
+    python scripts/02_deduplicate.py --project projects/2025-10-13_AI-Chatbots --streaming
 """
 
 import argparse
+import os
 import re
 import sys
+import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from rapidfuzz import fuzz
 
+from core.fingerprints import MISSING_FINGERPRINT, hamming_distances, simhash_fingerprints
+from core.identifiers import MISSING_HASH, identifier_hashes, normalize_title_key
+
+
+# Identification store files, in load order
+SOURCE_FILES = [
+    ('Semantic Scholar', 'semantic_scholar_results.csv'),
+    ('OpenAlex', 'openalex_results.csv'),
+    ('arXiv', 'arxiv_results.csv'),
+]
+
+# Source priority per exact-match stage (lower is kept first)
+DOI_SOURCE_PRIORITY = {'Semantic Scholar': 0, 'OpenAlex': 1, 'arXiv': 2}
+ARXIV_SOURCE_PRIORITY = {'arXiv': 0, 'Semantic Scholar': 1, 'OpenAlex': 2}
+
+
+def build_title_signature(normalized_title: str) -> str:
+    """Order-insensitive blocking key: first 8 sorted tokens, max 80 chars"""
+    if not normalized_title:
+        return ""
+    tokens = sorted(normalized_title.split())
+    signature = ' '.join(tokens[:8])
+    return signature[:80]
+
+
+class DedupProvenance:
+    """
+    Which record each removed record was merged into, and why
+
+    Rows are identified by their position in the identification store
+    (file order of SOURCE_FILES, then row order), which is the same in
+    the in-memory and streaming modes.
+    """
+
+    REASONS = ['', 'doi', 'arxiv', 'title', 'abstract']
+
+    def __init__(self, n_rows: int):
+        self.parent = np.arange(n_rows, dtype=np.int64)
+        self.reason = np.zeros(n_rows, dtype=np.int8)
+        self.similarity = np.ones(n_rows, dtype=np.float32)
+
+    def record(self, rows, targets, reason: str, similarity=1.0):
+        """
+        Record that `rows` were merged into `targets`
+
+        Args:
+            rows: Row id(s) of removed records
+            targets: Row id(s) of the records they duplicate
+            reason: One of REASONS
+            similarity: Title similarity (1.0 for exact identifier matches)
+        """
+        self.parent[rows] = targets
+        self.reason[rows] = self.REASONS.index(reason)
+        self.similarity[rows] = similarity
+
+    def cluster_roots(self) -> np.ndarray:
+        """Surviving representative row for every row (pointer jumping)"""
+        roots = self.parent.copy()
+        while True:
+            next_roots = roots[roots]
+            if np.array_equal(next_roots, roots):
+                return roots
+            roots = next_roots
+
+    def duplicate_rows(self) -> np.ndarray:
+        """Row ids of every record that belongs to a multi-record cluster"""
+        roots = self.cluster_roots()
+        merged = np.flatnonzero(roots != np.arange(len(roots)))
+        return np.union1d(merged, roots[merged])
+
+    def to_frame(self, meta: pd.DataFrame) -> pd.DataFrame:
+        """
+        One row per multi-record cluster
+
+        Args:
+            meta: `source` and `title` indexed by row id (at least for
+                duplicate_rows())
+
+        Returns:
+            DataFrame with cluster_id, size, title, members, sources,
+            match_reasons, similarities (lists aligned with members)
+        """
+        roots = self.cluster_roots()
+        rows = self.duplicate_rows()
+        if len(rows) == 0:
+            return pd.DataFrame(columns=[
+                'cluster_id', 'size', 'title', 'members', 'sources',
+                'match_reasons', 'similarities'
+            ])
+
+        members = pd.DataFrame({
+            'cluster_id': roots[rows],
+            'member': rows,
+            'source': meta['source'].reindex(rows).to_numpy() if 'source' in meta else None,
+            'match_reason': np.array(['representative'] + self.REASONS[1:], dtype=object)[self.reason[rows]],
+            'similarity': self.similarity[rows],
+        })
+        clusters = members.groupby('cluster_id', sort=True).agg(
+            size=('member', 'size'),
+            members=('member', list),
+            sources=('source', list),
+            match_reasons=('match_reason', list),
+            similarities=('similarity', list),
+        ).reset_index()
+        titles = meta['title'] if 'title' in meta else pd.Series(dtype=object)
+        clusters.insert(2, 'title', titles.reindex(clusters['cluster_id']).to_numpy())
+        return clusters
+
+
+class TitleBlockIndex:
+    """
+    Blocking index over kept (non-duplicate) titles
+
+    Candidates for a new title are the kept titles sharing its 10-char
+    prefix or its token signature; only those are compared with RapidFuzz.
+    Holds normalized titles, blocking keys and 64-bit abstract
+    fingerprints only, never full records.
+
+    With abstract_check on, SimHash fingerprints of the abstracts act as
+    a second-level check inside each block:
+        - similar titles but abstracts >= distinct_min_distance bits apart
+          are kept as distinct papers (e.g. two different "Editorial"s)
+        - dissimilar titles but abstracts <= same_max_distance bits apart
+          are merged (retitled preprint/journal pairs)
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        abstract_check: bool = False,
+        same_max_distance: int = 6,
+        distinct_min_distance: int = 20
+    ):
+        self.threshold = threshold
+        self.abstract_check = abstract_check
+        self.same_max_distance = same_max_distance
+        self.distinct_min_distance = distinct_min_distance
+
+        self.titles: List[str] = []
+        self.fingerprints = np.zeros(1024, dtype=np.uint64)
+        self.prefix_map: Dict[str, List[int]] = defaultdict(list)
+        self.signature_map: Dict[str, List[int]] = defaultdict(list)
+
+        # Second-level check outcomes
+        self.abstract_merges = 0
+        self.abstract_splits = 0
+
+        # Per-block cost: prefix key -> [lookups, comparisons, seconds]
+        self.block_stats: Dict[str, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+
+    def find_duplicate(
+        self,
+        normalized_title: str,
+        fingerprint: int = MISSING_FINGERPRINT
+    ) -> Optional[Tuple[int, str, float]]:
+        """
+        Find a kept paper that this title (and abstract) duplicates
+
+        Args:
+            normalized_title: Title normalized as in normalize_title
+            fingerprint: SimHash of the abstract (MISSING_FINGERPRINT if none)
+
+        Returns:
+            (position of the kept paper, match reason "title"/"abstract",
+            title similarity), or None
+        """
+        if not normalized_title:
+            return None
+
+        start = time.perf_counter()
+        block = normalized_title[:10]
+        candidates = set(self.prefix_map.get(block, []))
+        signature = build_title_signature(normalized_title)
+        if signature:
+            candidates.update(self.signature_map.get(signature, []))
+        if not candidates:
+            return None
+
+        candidates = sorted(candidates)
+        match = self._match_block(normalized_title, fingerprint, candidates)
+
+        stats = self.block_stats[block]
+        stats[0] += 1
+        stats[1] += len(candidates) if match is None else candidates.index(match[0]) + 1
+        stats[2] += time.perf_counter() - start
+        return match
+
+    def _match_block(
+        self,
+        normalized_title: str,
+        fingerprint: int,
+        candidates: List[int]
+    ) -> Optional[Tuple[int, str, float]]:
+        """Compare a title (and abstract fingerprint) against one block's candidates"""
+        distances = None
+        if self.abstract_check and fingerprint != MISSING_FINGERPRINT:
+            block_fingerprints = self.fingerprints[candidates]
+            distances = hamming_distances(block_fingerprints, fingerprint)
+            distances[block_fingerprints == MISSING_FINGERPRINT] = -1
+
+        for k, j in enumerate(candidates):
+            similarity = fuzz.token_set_ratio(normalized_title, self.titles[j]) / 100.0
+            if distances is not None and distances[k] >= 0:
+                if similarity >= self.threshold and distances[k] >= self.distinct_min_distance:
+                    self.abstract_splits += 1
+                    continue
+                if similarity < self.threshold and distances[k] <= self.same_max_distance:
+                    self.abstract_merges += 1
+                    return j, 'abstract', similarity
+            if similarity >= self.threshold:
+                return j, 'title', similarity
+        return None
+
+    def add(self, normalized_title: str, fingerprint: int = MISSING_FINGERPRINT) -> int:
+        """
+        Add a kept paper to the index
+
+        Args:
+            normalized_title: Title normalized as in normalize_title
+            fingerprint: SimHash of the abstract (MISSING_FINGERPRINT if none)
+
+        Returns:
+            Position of the paper in the index
+        """
+        position = len(self.titles)
+        self.titles.append(normalized_title)
+
+        if position >= len(self.fingerprints):
+            self.fingerprints = np.concatenate(
+                [self.fingerprints, np.zeros(len(self.fingerprints), dtype=np.uint64)]
+            )
+        self.fingerprints[position] = fingerprint
+
+        if normalized_title:
+            self.prefix_map[normalized_title[:10]].append(position)
+            signature = build_title_signature(normalized_title)
+            if signature:
+                self.signature_map[signature].append(position)
+        return position
+
 
 class PaperDeduplicator:
     """Remove duplicate papers across multiple database sources"""
@@ -34,6 +282,34 @@ class PaperDeduplicator:
         # Deduplication thresholds
         self.title_similarity_threshold = 0.85  # 85% title similarity = duplicate
 
+        # Set by deduplicate()/deduplicate_streaming() to record merges
+        self.provenance: Optional[DedupProvenance] = None
+        self.block_stats: Dict[str, List[float]] = {}
+
+        # Optional abstract SimHash check inside title blocks (Hamming bits)
+        self.abstract_check = False
+        self.abstract_same_max_distance = 6      # ≤ 6 bits = same abstract
+        self.abstract_distinct_min_distance = 20  # ≥ 20 bits = different paper
+
+    def source_files(self, verbose: bool = True) -> List[Tuple[str, Path]]:
+        """
+        Locate the per-database result files of the identification store
+
+        Args:
+            verbose: Print a warning for each missing file
+
+        Returns:
+            List of (source name, CSV path) for files that exist
+        """
+        files = []
+        for source_name, filename in SOURCE_FILES:
+            path = self.input_dir / filename
+            if path.exists():
+                files.append((source_name, path))
+            elif verbose:
+                print(f"   ⚠️  {source_name} results not found")
+        return files
+
     def load_results(self) -> pd.DataFrame:
         """
         Load all database results and combine into single DataFrame
@@ -45,38 +321,17 @@ class PaperDeduplicator:
 
         all_papers = []
 
-        # Load Semantic Scholar results
-        ss_file = self.input_dir / "semantic_scholar_results.csv"
-        if ss_file.exists():
-            df_ss = pd.read_csv(ss_file)
-            print(f"   ✓ Semantic Scholar: {len(df_ss)} papers")
-            all_papers.append(df_ss)
-        else:
-            print(f"   ⚠️  Semantic Scholar results not found")
-
-        # Load OpenAlex results
-        oa_file = self.input_dir / "openalex_results.csv"
-        if oa_file.exists():
-            df_oa = pd.read_csv(oa_file)
-            print(f"   ✓ OpenAlex: {len(df_oa)} papers")
-            all_papers.append(df_oa)
-        else:
-            print(f"   ⚠️  OpenAlex results not found")
-
-        # Load arXiv results
-        arxiv_file = self.input_dir / "arxiv_results.csv"
-        if arxiv_file.exists():
+        for source_name, path in self.source_files():
             try:
-                df_arxiv = pd.read_csv(arxiv_file)
-                if len(df_arxiv) > 0:
-                    print(f"   ✓ arXiv: {len(df_arxiv)} papers")
-                    all_papers.append(df_arxiv)
-                else:
-                    print(f"   ⚠️  arXiv results file is empty")
+                df_source = pd.read_csv(path)
             except pd.errors.EmptyDataError:
-                print(f"   ⚠️  arXiv results file is empty")
-        else:
-            print(f"   ⚠️  arXiv results not found")
+                print(f"   ⚠️  {source_name} results file is empty")
+                continue
+            if len(df_source) == 0:
+                print(f"   ⚠️  {source_name} results file is empty")
+                continue
+            print(f"   ✓ {source_name}: {len(df_source)} papers")
+            all_papers.append(df_source)
 
         if not all_papers:
             print("\n❌ Error: No database results found!")
@@ -132,37 +387,71 @@ class PaperDeduplicator:
 
         return fuzz.token_set_ratio(norm1, norm2) / 100.0
 
-    def deduplicate_by_doi(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    def deduplicate_by_identifier(
+        self,
+        df: pd.DataFrame,
+        kind: str,
+        source_priority: Dict[str, int]
+    ) -> Tuple[pd.DataFrame, int]:
         """
-        Remove exact duplicates based on DOI
+        Remove exact duplicates based on a canonical identifier hash
+
+        Identifiers are canonicalized (case, resolver prefixes, trailing
+        punctuation, arXiv version suffixes) and hashed to 64-bit keys,
+        so variants of the same DOI/arXiv ID match exactly here instead of
+        falling through to the fuzzy title stage.
 
         Args:
             df: DataFrame with papers
+            kind: Identifier kind ("doi", "arxiv", ...; see core.identifiers)
+            source_priority: Source name -> priority (lower is kept first)
 
         Returns:
             Tuple of (deduplicated DataFrame, number of duplicates removed)
         """
-        print("\n🔍 Stage 1: Removing DOI duplicates...")
-
         initial_count = len(df)
 
-        # Keep only papers with DOI for this stage
-        df_with_doi = df[df['doi'].notna()].copy()
-        df_without_doi = df[df['doi'].isna()].copy()
+        keys = identifier_hashes(df, kind)
+        if 'source' in df.columns:
+            priority = df['source'].map(source_priority).fillna(99).to_numpy(np.int8)
+        else:
+            priority = np.zeros(len(df), dtype=np.int8)
 
-        # Remove duplicates by DOI, keep first occurrence
-        # Prioritize: Semantic Scholar > OpenAlex > arXiv
-        source_priority = {'Semantic Scholar': 0, 'OpenAlex': 1, 'arXiv': 2}
-        df_with_doi['source_priority'] = df_with_doi['source'].map(source_priority)
-        df_with_doi = df_with_doi.sort_values('source_priority')
+        removed_rows, target_rows = self.find_exact_duplicates(
+            keys, priority, np.ones(len(df), dtype=bool)
+        )
 
-        df_with_doi_dedup = df_with_doi.drop_duplicates(subset='doi', keep='first')
-        df_with_doi_dedup = df_with_doi_dedup.drop('source_priority', axis=1)
+        if self.provenance is not None and '_row_id' in df.columns:
+            row_ids = df['_row_id'].to_numpy()
+            self.provenance.record(row_ids[removed_rows], row_ids[target_rows], kind)
 
-        # Combine back with papers without DOI
-        df_dedup = pd.concat([df_with_doi_dedup, df_without_doi], ignore_index=True)
+        # Keep load order; only duplicates are dropped
+        keep = np.ones(len(df), dtype=bool)
+        keep[removed_rows] = False
+        df_dedup = df[keep].reset_index(drop=True)
 
         removed = initial_count - len(df_dedup)
+        return df_dedup, removed
+
+    def deduplicate_by_doi(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """
+        Remove exact duplicates based on canonical DOI
+
+        Args:
+            df: DataFrame with papers
+
+        Returns:
+            Tuple of (deduplicated DataFrame, number of duplicates removed)
+        """
+        print("\n🔍 Stage 1: Removing DOI duplicates...")
+
+        if 'doi' not in df.columns:
+            print("   No DOI column found, skipping...")
+            return df, 0
+
+        # Prioritize: Semantic Scholar > OpenAlex > arXiv
+        df_dedup, removed = self.deduplicate_by_identifier(df, 'doi', DOI_SOURCE_PRIORITY)
+
         print(f"   Removed {removed} exact DOI duplicates")
         print(f"   Remaining papers: {len(df_dedup)}")
 
@@ -170,7 +459,9 @@ class PaperDeduplicator:
 
     def deduplicate_by_arxiv_id(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
         """
-        Remove duplicates based on arXiv ID
+        Remove duplicates based on canonical arXiv ID (version-insensitive)
+
+        arXiv IDs are also recovered from arXiv DOIs (10.48550/arXiv.*).
 
         Args:
             df: DataFrame with papers
@@ -180,34 +471,33 @@ class PaperDeduplicator:
         """
         print("\n🔍 Stage 2: Removing arXiv ID duplicates...")
 
-        initial_count = len(df)
-
-        # Check if arxiv_id column exists
-        if 'arxiv_id' not in df.columns:
+        # Check if any arXiv identifier source exists
+        if 'arxiv_id' not in df.columns and 'doi' not in df.columns:
             print("   No arXiv ID column found, skipping...")
             return df, 0
 
-        # Keep only papers with arXiv ID for this stage
-        df_with_arxiv = df[df['arxiv_id'].notna()].copy()
-        df_without_arxiv = df[df['arxiv_id'].isna()].copy()
-
-        # Remove duplicates by arXiv ID
-        source_priority = {'arXiv': 0, 'Semantic Scholar': 1, 'OpenAlex': 2}
-        df_with_arxiv['source_priority'] = df_with_arxiv['source'].map(source_priority)
-        df_with_arxiv = df_with_arxiv.sort_values('source_priority')
-
-        df_with_arxiv_dedup = df_with_arxiv.drop_duplicates(subset='arxiv_id', keep='first')
-        df_with_arxiv_dedup = df_with_arxiv_dedup.drop('source_priority', axis=1)
+        df_dedup, removed = self.deduplicate_by_identifier(df, 'arxiv', ARXIV_SOURCE_PRIORITY)
 
-        # Combine back
-        df_dedup = pd.concat([df_with_arxiv_dedup, df_without_arxiv], ignore_index=True)
-
-        removed = initial_count - len(df_dedup)
         print(f"   Removed {removed} arXiv ID duplicates")
         print(f"   Remaining papers: {len(df_dedup)}")
 
         return df_dedup, removed
 
+    def build_title_index(self) -> TitleBlockIndex:
+        """Create an empty title blocking index with this deduplicator's settings"""
+        return TitleBlockIndex(
+            self.title_similarity_threshold,
+            abstract_check=self.abstract_check,
+            same_max_distance=self.abstract_same_max_distance,
+            distinct_min_distance=self.abstract_distinct_min_distance
+        )
+
+    def abstract_fingerprints(self, df: pd.DataFrame) -> np.ndarray:
+        """SimHash fingerprints of abstracts, or all-missing when the check is off"""
+        if not self.abstract_check or 'abstract' not in df.columns:
+            return np.zeros(len(df), dtype=np.uint64)
+        return simhash_fingerprints(df['abstract'])
+
     def deduplicate_by_title(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
         """
         Remove fuzzy duplicates based on title similarity
@@ -227,55 +517,30 @@ class PaperDeduplicator:
             print("   No papers to process.")
             return df, 0
 
-        df = df.copy().reset_index(drop=True)
-        df['normalized_title'] = df['title'].apply(self.normalize_title)
-        df['title_prefix'] = df['normalized_title'].str[:10].fillna('')
-
-        def build_signature(text: str) -> str:
-            if not text:
-                return ""
-            tokens = sorted(text.split())
-            signature = ' '.join(tokens[:8])
-            return signature[:80]
+        df = df.reset_index(drop=True)
+        normalized_titles = df['title'].apply(self.normalize_title).tolist()
+        fingerprints = self.abstract_fingerprints(df)
+        if self.abstract_check:
+            print(f"   Abstract check: SimHash (same ≤ {self.abstract_same_max_distance} bits, "
+                  f"distinct ≥ {self.abstract_distinct_min_distance} bits)")
 
-        df['title_signature'] = df['normalized_title'].apply(build_signature)
+        track = self.provenance is not None and '_row_id' in df.columns
+        row_ids = df['_row_id'].to_numpy() if track else None
 
+        index = self.build_title_index()
         keep_indices: List[int] = []
         removed_count = 0
 
-        prefix_map: Dict[str, List[int]] = defaultdict(list)
-        signature_map: Dict[str, List[int]] = defaultdict(list)
-
-        for i in range(len(df)):
-            title_i = df.iloc[i]['title']
-            prefix_key = df.iloc[i]['title_prefix']
-            signature_key = df.iloc[i]['title_signature']
-
-            is_duplicate = False
-            candidate_indices = set()
-
-            if prefix_key:
-                candidate_indices.update(prefix_map.get(prefix_key, []))
-            if signature_key:
-                candidate_indices.update(signature_map.get(signature_key, []))
-
-            for j in candidate_indices:
-                similarity = self.calculate_title_similarity(
-                    title_i,
-                    df.iloc[j]['title']
-                )
-
-                if similarity >= self.title_similarity_threshold:
-                    is_duplicate = True
-                    removed_count += 1
-                    break
-
-            if not is_duplicate:
+        for i, normalized in enumerate(normalized_titles):
+            match = index.find_duplicate(normalized, fingerprints[i])
+            if match is not None:
+                removed_count += 1
+                if track:
+                    position, reason, similarity = match
+                    self.provenance.record(row_ids[i], row_ids[keep_indices[position]], reason, similarity)
+            else:
                 keep_indices.append(i)
-                if prefix_key:
-                    prefix_map[prefix_key].append(i)
-                if signature_key:
-                    signature_map[signature_key].append(i)
+                index.add(normalized, fingerprints[i])
 
             if (i + 1) % 500 == 0:
                 print(f"   Processed {i + 1}/{len(df)} papers...", end='\r')
@@ -284,11 +549,12 @@ class PaperDeduplicator:
 
         # Keep only non-duplicate papers
         df_dedup = df.iloc[keep_indices].copy()
-        df_dedup = df_dedup.drop(
-            columns=['normalized_title', 'title_prefix', 'title_signature']
-        )
+        self.block_stats = dict(index.block_stats)
 
         print(f"   Removed {removed_count} title fuzzy duplicates")
+        if self.abstract_check:
+            print(f"   ├─ merged by abstract (retitled): {index.abstract_merges}")
+            print(f"   └─ title matches rejected by abstract: {index.abstract_splits}")
         print(f"   Remaining papers: {len(df_dedup)}")
 
         return df_dedup, removed_count
@@ -308,6 +574,11 @@ class PaperDeduplicator:
         df = self.load_results()
         initial_count = len(df)
 
+        # Track merges by load position for the provenance report
+        self.provenance = DedupProvenance(initial_count)
+        df['_row_id'] = np.arange(initial_count)
+        meta = df[[c for c in ('source', 'title') if c in df.columns]]
+
         # Stage 1: DOI exact match
         df, doi_removed = self.deduplicate_by_doi(df)
 
@@ -332,10 +603,13 @@ class PaperDeduplicator:
         print(f"Final unique papers: {final_count}")
 
         # Save deduplicated results
+        df = df.drop(columns=['_row_id'])
         output_file = self.output_dir / "deduplicated.csv"
         df.to_csv(output_file, index=False)
         print(f"\n💾 Saved to: {output_file}")
 
+        self.save_provenance_report(meta)
+
         # Additional statistics
         print("\n" + "="*60)
         print("📈 DEDUPLICATED DATASET STATISTICS")
@@ -363,6 +637,297 @@ class PaperDeduplicator:
 
         return df
 
+    def iter_source_chunks(
+        self,
+        files: List[Tuple[str, Path]],
+        chunk_size: int,
+        usecols: Optional[List[str]] = None
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Stream the identification store chunk by chunk
+
+        Args:
+            files: (source name, path) pairs from source_files()
+            chunk_size: Rows per chunk
+            usecols: Columns to read (missing ones are skipped per file)
+
+        Yields:
+            (global row offset of the chunk, chunk DataFrame)
+        """
+        offset = 0
+        for _, path in files:
+            try:
+                header = pd.read_csv(path, nrows=0).columns
+            except pd.errors.EmptyDataError:
+                continue
+            cols = [c for c in usecols if c in header] if usecols else None
+            for chunk in pd.read_csv(path, usecols=cols, chunksize=chunk_size):
+                yield offset, chunk
+                offset += len(chunk)
+
+    @staticmethod
+    def find_exact_duplicates(
+        keys: np.ndarray,
+        priority: np.ndarray,
+        candidates: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find exact-key duplicates among candidate rows (vectorized)
+
+        Within each key, the row with the lowest source priority is kept
+        (ties: earliest row).
+
+        Args:
+            keys: uint64 identifier hashes (MISSING_HASH = no identifier)
+            priority: Source priority per row
+            candidates: Boolean mask of rows still in play
+
+        Returns:
+            Tuple of (positions of rows to remove, positions of the kept
+            row each one duplicates)
+        """
+        rows = np.flatnonzero(candidates & (keys != MISSING_HASH))
+        order = np.lexsort((rows, priority[rows], keys[rows]))
+        sorted_rows = rows[order]
+        sorted_keys = keys[sorted_rows]
+
+        is_duplicate = np.zeros(len(sorted_rows), dtype=bool)
+        is_duplicate[1:] = sorted_keys[1:] == sorted_keys[:-1]
+
+        # Each duplicate points at the first (kept) row of its key group
+        group_start = np.maximum.accumulate(
+            np.where(is_duplicate, 0, np.arange(len(sorted_rows)))
+        ) if len(sorted_rows) else np.zeros(0, dtype=np.int64)
+        return sorted_rows[is_duplicate], sorted_rows[group_start[is_duplicate]]
+
+    @staticmethod
+    def write_table(df: pd.DataFrame, path: Path) -> Path:
+        """
+        Write a report table as Parquet, falling back to CSV without pyarrow
+
+        Returns:
+            Path actually written
+        """
+        try:
+            df.to_parquet(path, index=False)
+            return path
+        except ImportError:
+            csv_path = path.with_suffix('.csv')
+            df.to_csv(csv_path, index=False)
+            return csv_path
+
+    def save_provenance_report(self, meta: pd.DataFrame, top_blocks: int = 10):
+        """
+        Write dedup cluster and block-cost reports next to deduplicated.csv
+
+        dedup_clusters.parquet: one row per merged cluster (representative
+            row id as cluster_id, members, sources, match reasons,
+            similarities)
+        dedup_blocks.parquet: per title block lookups, comparisons, seconds
+
+        Args:
+            meta: `source` and `title` indexed by row id
+            top_blocks: Number of slowest blocks to print
+        """
+        if self.provenance is None:
+            return
+
+        clusters = self.provenance.to_frame(meta)
+        clusters_file = self.write_table(clusters, self.output_dir / "dedup_clusters.parquet")
+
+        blocks = pd.DataFrame(
+            [(block, int(n), int(c), t) for block, (n, c, t) in self.block_stats.items()],
+            columns=['block', 'lookups', 'comparisons', 'seconds']
+        ).sort_values('seconds', ascending=False, ignore_index=True)
+        blocks_file = self.write_table(blocks, self.output_dir / "dedup_blocks.parquet")
+
+        print(f"\n🧾 Provenance: {len(clusters)} duplicate clusters → {clusters_file}")
+        if len(clusters):
+            reasons = pd.Series(
+                [r for rs in clusters['match_reasons'] for r in rs if r != 'representative']
+            ).value_counts()
+            for reason, count in reasons.items():
+                print(f"   {reason}: {count} merged records")
+
+        if len(blocks):
+            total = blocks['seconds'].sum()
+            print(f"\n⏱️  Title blocks: {len(blocks)} ({total:.2f}s in fuzzy matching) → {blocks_file}")
+            print(f"   Slowest {min(top_blocks, len(blocks))} blocks:")
+            for _, row in blocks.head(top_blocks).iterrows():
+                share = row['seconds'] / total * 100 if total else 0.0
+                print(f"   '{row['block']}': {row['seconds']:.3f}s ({share:.1f}%), "
+                      f"{row['lookups']} lookups, {row['comparisons']} comparisons")
+
+    def deduplicate_streaming(self, chunk_size: int = 50_000) -> Dict[str, int]:
+        """
+        Run deduplication without loading the corpus into memory
+
+        Three passes over the identification store:
+            1. Identifier hashes + source priorities → exact-match survivors
+            2. Titles of survivors → fuzzy title blocking index
+            3. Surviving rows copied chunk by chunk to deduplicated.csv
+
+        Only compact per-row arrays (two uint64 hashes, two int8
+        priorities, a keep flag) and the normalized titles of kept papers
+        are held in memory, so peak memory follows the index size rather
+        than the corpus size.
+
+        Args:
+            chunk_size: Rows per CSV chunk
+
+        Returns:
+            Dictionary with initial/removed/final counts
+        """
+        print("\n" + "="*60)
+        print("🧹 PAPER DEDUPLICATION (STREAMING)")
+        print("="*60)
+
+        print("\n📂 Indexing database results...")
+        files = self.source_files()
+        if not files:
+            print("\n❌ Error: No database results found!")
+            print(f"   Expected files in: {self.input_dir}")
+            sys.exit(1)
+
+        # Pass 1: identifier index
+        doi_keys, arxiv_keys, doi_priority, arxiv_priority = [], [], [], []
+        for _, chunk in self.iter_source_chunks(files, chunk_size, ['doi', 'arxiv_id', 'source']):
+            doi_keys.append(identifier_hashes(chunk, 'doi'))
+            arxiv_keys.append(identifier_hashes(chunk, 'arxiv'))
+            source = chunk['source'] if 'source' in chunk.columns else pd.Series('', index=chunk.index)
+            doi_priority.append(source.map(DOI_SOURCE_PRIORITY).fillna(99).to_numpy(np.int8))
+            arxiv_priority.append(source.map(ARXIV_SOURCE_PRIORITY).fillna(99).to_numpy(np.int8))
+
+        if not doi_keys:
+            print("\n❌ Error: No database results found!")
+            sys.exit(1)
+
+        doi_keys = np.concatenate(doi_keys)
+        arxiv_keys = np.concatenate(arxiv_keys)
+        doi_priority = np.concatenate(doi_priority)
+        arxiv_priority = np.concatenate(arxiv_priority)
+
+        initial_count = len(doi_keys)
+        print(f"   Total papers before deduplication: {initial_count}")
+        keep = np.ones(initial_count, dtype=bool)
+        self.provenance = DedupProvenance(initial_count)
+
+        # Stage 1 + 2: exact identifier matches
+        print("\n🔍 Stage 1: Removing DOI duplicates...")
+        removed, targets = self.find_exact_duplicates(doi_keys, doi_priority, keep)
+        keep[removed] = False
+        self.provenance.record(removed, targets, 'doi')
+        doi_removed = len(removed)
+        print(f"   Removed {doi_removed} exact DOI duplicates")
+
+        print("\n🔍 Stage 2: Removing arXiv ID duplicates...")
+        removed, targets = self.find_exact_duplicates(arxiv_keys, arxiv_priority, keep)
+        keep[removed] = False
+        self.provenance.record(removed, targets, 'arxiv')
+        arxiv_removed = len(removed)
+        print(f"   Removed {arxiv_removed} arXiv ID duplicates")
+
+        del doi_keys, arxiv_keys, doi_priority, arxiv_priority
+
+        # Stage 3: fuzzy title matches (second pass, titles only)
+        print("\n🔍 Stage 3: Removing title fuzzy duplicates...")
+        print(f"   Similarity threshold: {self.title_similarity_threshold}")
+        index = self.build_title_index()
+        kept_rows: List[int] = []
+        title_removed = 0
+        for offset, chunk in self.iter_source_chunks(files, chunk_size, ['title', 'abstract']):
+            rows = np.arange(offset, offset + len(chunk))
+            in_play = keep[rows]
+            if 'title' not in chunk.columns or not in_play.any():
+                continue
+            chunk = chunk[in_play]
+            normalized = normalize_title_key(chunk['title']).tolist()
+            fingerprints = self.abstract_fingerprints(chunk)
+            for row, title, fingerprint in zip(rows[in_play], normalized, fingerprints):
+                match = index.find_duplicate(title, fingerprint)
+                if match is not None:
+                    keep[row] = False
+                    title_removed += 1
+                    position, reason, similarity = match
+                    self.provenance.record(row, kept_rows[position], reason, similarity)
+                else:
+                    index.add(title, fingerprint)
+                    kept_rows.append(row)
+            print(f"   Processed {rows[-1] + 1}/{initial_count} papers...", end='\r')
+        print(f"   Processed {initial_count}/{initial_count} papers...     ")
+        print(f"   Removed {title_removed} title fuzzy duplicates")
+        if self.abstract_check:
+            print(f"   ├─ merged by abstract (retitled): {index.abstract_merges}")
+            print(f"   └─ title matches rejected by abstract: {index.abstract_splits}")
+
+        self.block_stats = dict(index.block_stats)
+        del index, kept_rows
+
+        # Pass 3: copy surviving rows to the output
+        columns: List[str] = []
+        for _, path in files:
+            try:
+                header = pd.read_csv(path, nrows=0).columns
+            except pd.errors.EmptyDataError:
+                continue
+            columns += [c for c in header if c not in columns]
+
+        # Source/title of clustered rows only, for the provenance report
+        in_cluster = np.zeros(initial_count, dtype=bool)
+        in_cluster[self.provenance.duplicate_rows()] = True
+        meta_parts = []
+
+        output_file = self.output_dir / "deduplicated.csv"
+        tmp_file = output_file.with_suffix('.csv.tmp')
+        final_count = 0
+        source_counts: Dict[str, int] = defaultdict(int)
+        with open(tmp_file, 'w', newline='') as f:
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+            for offset, chunk in self.iter_source_chunks(files, chunk_size):
+                clustered = in_cluster[offset:offset + len(chunk)]
+                if clustered.any():
+                    part = chunk.loc[clustered, [c for c in ('source', 'title') if c in chunk.columns]]
+                    part.index = offset + np.flatnonzero(clustered)
+                    meta_parts.append(part)
+
+                survivors = chunk[keep[offset:offset + len(chunk)]]
+                survivors.reindex(columns=columns).to_csv(f, header=False, index=False)
+                final_count += len(survivors)
+                if 'source' in survivors.columns:
+                    for source, count in survivors['source'].value_counts().items():
+                        source_counts[source] += int(count)
+        os.replace(tmp_file, output_file)
+
+        total_removed = initial_count - final_count
+
+        print("\n" + "="*60)
+        print("📊 DEDUPLICATION SUMMARY")
+        print("="*60)
+        print(f"\nInitial papers: {initial_count}")
+        print(f"Removed by DOI: {doi_removed}")
+        print(f"Removed by arXiv ID: {arxiv_removed}")
+        print(f"Removed by title similarity: {title_removed}")
+        print(f"\nTotal removed: {total_removed} ({total_removed/initial_count*100:.1f}%)")
+        print(f"Final unique papers: {final_count}")
+        print(f"\n💾 Saved to: {output_file}")
+
+        meta = pd.concat(meta_parts) if meta_parts else pd.DataFrame(columns=['source', 'title'])
+        self.save_provenance_report(meta)
+
+        if final_count:
+            print(f"\nBy Source:")
+            for source, count in sorted(source_counts.items(), key=lambda x: -x[1]):
+                print(f"  {source}: {count} ({count/final_count*100:.1f}%)")
+        print("="*60)
+
+        return {
+            'initial': initial_count,
+            'doi_removed': doi_removed,
+            'arxiv_removed': arxiv_removed,
+            'title_removed': title_removed,
+            'final': final_count,
+        }
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -379,6 +944,23 @@ def main():
         default=0.85,
         help='Title similarity threshold for fuzzy matching (default: 0.85)'
     )
+    parser.add_argument(
+        '--abstract-check',
+        action='store_true',
+        help='Compare abstract SimHash fingerprints inside title blocks '
+             '(catches retitled versions, keeps apart distinct papers with generic titles)'
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Stream the identification store in chunks (for corpora larger than RAM)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=50_000,
+        help='Rows per chunk in streaming mode (default: 50000)'
+    )
 
     args = parser.parse_args()
 
@@ -391,9 +973,13 @@ def main():
     # Initialize deduplicator
     deduplicator = PaperDeduplicator(args.project)
     deduplicator.title_similarity_threshold = args.threshold
+    deduplicator.abstract_check = args.abstract_check
 
     # Run deduplication
-    df = deduplicator.deduplicate()
+    if args.streaming:
+        deduplicator.deduplicate_streaming(chunk_size=args.chunk_size)
+    else:
+        deduplicator.deduplicate()
 
     print("\n✨ Next step: Screen papers for relevance")
     print(f"   python scripts/03_screen_papers.py --project {args.project}")
@@ -15,25 +15,137 @@ Example:
 """
 
 import argparse
+import json
+import numpy as np
 import pandas as pd
 import sys
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import anthropic
 import time
 from dotenv import load_dotenv
 import yaml
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
+
+from core.budget_governor import PRICES, BudgetGovernor, cache_hit_rate, model_prices, usage_cost
+from core.grounding import DEFAULT_MIN_GROUNDING_SCORE, GroundingValidator, split_sentences
+from core.identifiers import MISSING_HASH, abstract_hashes, paper_key_strings
+from core.prefilter import KeywordPrefilter, inclusion_terms
+from core.response_schema import ResponseSchema, compact_tool, decode_json, expand_compact, followup_prompt
+from core.screening_cache import ScreeningCache, screening_cache_key
+from core.screening_journal import ScreeningJournal
+from core.screening_service import PROJECT_HEADER
+from core.tables import TABLE_FORMATS, write_table
+from core.screening_scheduler import RELEVANT_DECISIONS, PriorityScheduler
+
+
+# Screening model (pricing in core.budget_governor.PRICES)
+SCREENING_MODEL = "claude-haiku-4-5"
+
+# Shortest prompt prefix the API will cache per model (shorter cache_control blocks are ignored)
+MIN_CACHEABLE_TOKENS = {
+    'claude-haiku-4-5': 4096,
+    'claude-sonnet-4-5': 1024,
+    'claude-opus-4-1': 1024,
+}
+
+# Output tokens of a typical single-paper response (batch-mode cost estimate)
+TYPICAL_OUTPUT_TOKENS = 200
+
+# Async engine: concurrent in-flight requests (bounded by API rate limits)
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Follow-up request asking only for fields missing from a response
+FOLLOWUP_MAX_TOKENS = 300
+
+# Compact mode: forced tool call with integer scores, short reasoning and evidence sentence numbers
+COMPACT_MAX_TOKENS = 200
+
+# Multi-paper packing: N papers per request, adapted to abstract length
+PACK_INPUT_TOKEN_BUDGET = 4000
+PACK_OUTPUT_TOKENS_PER_PAPER = 400
+MAX_OUTPUT_TOKENS = 8192
+
+# Message Batches API: 50% discount, up to 100k requests per batch
+BATCH_PRICE_MULTIPLIER = 0.5
+MAX_BATCH_REQUESTS = 10_000
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+# 3-zone output files by decision ('error' rows only go to all_screened_papers)
+ZONE_FILES = {
+    'auto-include': 'auto_included',
+    'auto-exclude': 'auto_excluded',
+    'human-review': 'human_review_queue',
+}
+
+# Extra columns of papers re-scored by the cascade model
+CASCADE_COLUMNS = ['screening_model', 'tier1_total_score', 'tier1_decision']
+
+RESULT_COLUMNS = ['paper_id', 'title', 'total_score', 'decision', 'reasoning',
+                  'domain_score', 'intervention_score', 'method_score',
+                  'outcomes_score', 'exclusion_score', 'title_bonus', 'grounding_score',
+                  'rubric_scored']
+
+NO_ABSTRACT_REASONING = 'No abstract available for screening'
 
 
 class PaperScreener:
     """AI-assisted screening of papers for relevance"""
 
-    def __init__(self, project_path: str, research_question: str):
+    def __init__(self, project_path: str, research_question: str,
+                 use_cache: bool = True, cache_path: Optional[str] = None, pack_size: int = 1,
+                 compact: bool = False, service_url: Optional[str] = None, output_format: Optional[str] = None,
+                 warm_cache: bool = False):
         self.project_path = Path(project_path)
         self.research_question = research_question
+        self.model = SCREENING_MODEL
+        self.price_multiplier = 1.0  # BATCH_PRICE_MULTIPLIER in batch mode
+
+        # Multi-paper packing (1 = one paper per request)
+        self.pack_size = pack_size
+
+        # Compact tool-use output for single-paper requests
+        self.compact = compact
+
+        # Deliberate prompt-cache warming: question + criteria in the cached
+        # prefix, one priming request per model before fanning out
+        self.warm_cache = warm_cache
+        self.primed_models = set()
+
+        # Two-tier cascade: human-review band re-scored by a stronger model
+        self.cascade_model: Optional[str] = None
+        self.cascade_papers = 0
+        self.cascade_usage = {'input': 0, 'output': 0, 'cache_write': 0, 'cache_read': 0}
+        self.packed_papers = 0
+        self.pack_fallbacks = 0
+
+        # Papers removed by the local keyword pre-filter / left unscreened
+        # by the early-stopping rule (both reported for PRISMA)
+        self.prefilter_excluded = 0
+        self.early_stopped = 0
+
+        # Papers whose result was copied from another record with the same abstract
+        self.abstract_duplicates = 0
+
+        # Response validation: glitches repaired locally / follow-ups for missing fields
+        self.response_schema = ResponseSchema()
+        self.repaired_responses = 0
+        self.followup_requests = 0
+
+        # Spend cap / live metrics (created per run in screen_all_papers)
+        self.governor: Optional[BudgetGovernor] = None
+        self.budget_unscreened = 0
+
+        # Machine-wide result cache shared across projects
+        self.cache = ScreeningCache(cache_path) if use_cache else None
         self.input_dir = self.project_path / "data" / "01_identification"
         self.output_dir = self.project_path / "data" / "02_screening"
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -43,10 +155,16 @@ class PaperScreener:
         self.total_output_tokens = 0
         self.total_cache_creation_tokens = 0
         self.total_cache_read_tokens = 0
+        self.usage_lock = threading.Lock()  # Thread-mode workers share the counters
 
         # Load project config
         self.load_config()
 
+        self.warm_cache = self.warm_cache or self.config.get('ai_prisma_rubric', {}).get('cache', {}).get('warm', False)
+
+        # Zone files: "csv" or columnar "parquet" (CLI overrides config)
+        self.output_format = output_format or self.config.get('ai_prisma_rubric', {}).get('output_format', 'csv')
+
         # Load API key from project .env file
         env_path = self.project_path / ".env"
         if env_path.exists():
@@ -60,10 +178,17 @@ class PaperScreener:
             print("   Add to .env file: ANTHROPIC_API_KEY=sk-ant-api03-xxxxx")
             sys.exit(1)
 
-        self.client = anthropic.Anthropic(
-            api_key=api_key,
-            default_headers={"anthropic-beta": "prompt-caching-2024-07-31"}
-        )
+        self.api_key = api_key
+
+        # Shared screening service (03c_screening_service.py): one rate-limit budget across projects
+        self.client_options = {
+            'api_key': api_key,
+            'default_headers': {"anthropic-beta": "prompt-caching-2024-07-31"},
+        }
+        if service_url:
+            self.client_options['base_url'] = service_url
+            self.client_options['default_headers'][PROJECT_HEADER] = quote(str(self.project_path.resolve()))
+        self.client = anthropic.Anthropic(**self.client_options)
 
     def load_config(self):
         """Load project configuration and set screening parameters based on project_type"""
@@ -90,8 +215,14 @@ class PaperScreener:
             self.require_human_review = self.config.get('ai_prisma_rubric', {}).get('human_validation', {}).get('required', False)
             print(f"   📊 Project type: Systematic Review (strict filtering)")
 
+
+        # Evidence quotes matching the abstract below this score are flagged for human review
+        self.min_grounding_score = self.config.get('ai_prisma_rubric', {}).get('evidence_grounding', {}).get(
+            'min_score', DEFAULT_MIN_GROUNDING_SCORE)
+
         print(f"   ✓ Include threshold: total_score ≥ {self.score_threshold_include}")
         print(f"   ✓ Exclude threshold: total_score < {self.score_threshold_exclude}")
+        print(f"   ✓ Evidence grounding: quotes must match the abstract ≥ {self.min_grounding_score:.0%}")
         print(f"   ✓ Human review: {'Required' if self.require_human_review else 'Not required'}")
 
     def get_cached_system_prompt(self) -> str:
@@ -99,9 +230,12 @@ class PaperScreener:
         Get static system prompt for caching (unchanged across all papers)
         This is cached by Anthropic API to reduce latency and cost
 
-        NOTE: Research question is now in user prompt to maximize caching efficiency
+        NOTE: Research question is in the user prompt unless cache warming
+        puts it into the cached prefix (see get_cached_prefix). The decision
+        thresholds are always in the user prompt, so the prefix (and the
+        result cache key) does not change when they do.
         """
-        return """You are a research assistant conducting PRISMA 2020 systematic literature review.
+        return f"""You are a research assistant conducting PRISMA 2020 systematic literature review.
 
 TASK: Score paper relevance using 6-dimension rubric. Respond in JSON only.
 
@@ -134,9 +268,9 @@ REQUIREMENTS:
 - If uncertain, use lower scores
 - Calculate total_score = sum of all 6 scores
 
-DECISION RULES:
-- total_score ≥ {self.score_threshold_include} → "auto-include"
-- total_score < {self.score_threshold_exclude} → "auto-exclude"
+DECISION RULES (thresholds are given with each paper):
+- total_score ≥ include threshold → "auto-include"
+- total_score < exclude threshold → "auto-exclude"
 - Otherwise → "human-review"
 
 JSON format:
@@ -148,55 +282,76 @@ JSON format:
   "evidence_quotes": ["quote1", "quote2", ...]
 }}"""
 
+    def get_cached_prefix(self) -> str:
+        """
+        System text sent with cache_control
+
+        With cache warming the research question and the project's
+        inclusion/exclusion criteria join the rubric in the cached prefix,
+        so per-paper requests carry only title and abstract uncached.
+        """
+        prompt = self.get_cached_system_prompt()
+        if not self.warm_cache:
+            return prompt
+
+        prisma = self.config.get('prisma', {}) or {}
+        context = [f"RESEARCH QUESTION: {self.research_question}"]
+        for label, key in (('INCLUSION CRITERIA', 'inclusion_criteria'), ('EXCLUSION CRITERIA', 'exclusion_criteria')):
+            if prisma.get(key):
+                context.append(label + ":\n" + "\n".join(f"- {criterion}" for criterion in prisma[key]))
+        if prisma.get('ai_reviewer_prompt'):
+            context.append(f"REVIEWER GUIDANCE: {prisma['ai_reviewer_prompt']}")
+        return prompt + "\n\n" + "\n\n".join(context)
+
+    def question_header(self) -> str:
+        """
+        Per-request header of the user message
+
+        The research question (unless it is in the cached prefix) and the
+        decision thresholds, which stay out of the prefix so changing them
+        neither breaks the prompt cache nor misses the result cache.
+        """
+        thresholds = (f"Decision thresholds: include ≥ {self.score_threshold_include}, "
+                      f"exclude < {self.score_threshold_exclude}\n\n")
+        if self.warm_cache:
+            return thresholds
+        return f"Research Question: {self.research_question}\n" + thresholds
+
     def build_paper_content(self, title: str, abstract: str) -> str:
         """
         Build dynamic paper content (changes for each paper)
         Includes research question for context
         """
-        return f"""Research Question: {self.research_question}
-
-Title: {title}
+        return f"""{self.question_header()}Title: {title}
 
 Abstract: {abstract}"""
 
-    def validate_evidence_grounding(self, quotes: List[str], abstract: str) -> bool:
+    def validate_evidence_grounding(self, quotes: List[str], abstract: str) -> float:
         """
-        Validate that AI evidence quotes are actually in the abstract
+        Score how well AI evidence quotes are grounded in the abstract
+
+        Quotes are matched approximately against the normalized abstract
+        (see core.grounding), so whitespace, hyphenation and Unicode
+        differences do not count as hallucinations.
 
         Args:
             quotes: List of quoted evidence from AI
             abstract: Original paper abstract
 
         Returns:
-            True if all quotes are grounded, False if hallucination detected
+            Grounding score 0.0-1.0 (score of the weakest quote; 1.0 without quotes)
         """
         if not quotes:
-            return True  # No quotes to validate
+            return 1.0  # No quotes to validate
 
+        validator = GroundingValidator(abstract)
+        score = 1.0
         for quote in quotes:
-            # Remove any labels/prefixes that Claude might add
-            # Pattern: "Label: 'actual quote'" or "Label: actual quote"
-            clean_quote = quote
-
-            # Remove patterns like "Domain alignment: ", "Evidence: ", etc.
-            if ':' in quote:
-                # Check if this looks like "Label: 'quote'" or "Label: quote"
-                parts = quote.split(':', 1)
-                if len(parts) == 2:
-                    potential_quote = parts[1].strip()
-                    # Remove surrounding quotes if present
-                    if potential_quote.startswith("'") and potential_quote.endswith("'"):
-                        clean_quote = potential_quote[1:-1]
-                    elif potential_quote.startswith('"') and potential_quote.endswith('"'):
-                        clean_quote = potential_quote[1:-1]
-                    else:
-                        clean_quote = potential_quote
-
-            # Check if cleaned quote exists in abstract (case-insensitive)
-            if clean_quote.lower().strip() not in abstract.lower():
-                print(f"   ⚠️  Hallucination detected: \"{quote[:50]}...\"")
-                return False
-        return True
+            quote_score = validator.quote_score(str(quote))
+            if quote_score < self.min_grounding_score:
+                print(f"   ⚠️  Hallucination detected ({quote_score:.0%} match): \"{str(quote)[:50]}...\"")
+            score = min(score, quote_score)
+        return score
 
     def determine_decision(self, total_score: int) -> str:
         """
@@ -220,6 +375,40 @@ Abstract: {abstract}"""
         else:
             return 'human-review'
 
+    def assign_decisions(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Decisions for all screened papers in one vectorized pass
+
+        Same rules as apply_decision (ungrounded evidence → human review,
+        else determine_decision), applied with the current thresholds, so
+        results resumed from older runs follow today's config. Rows the
+        rubric did not score (rubric_scored False: errors, no abstract)
+        and rows without a score keep their decision.
+
+        Args:
+            df: Screened papers (total_score, grounding_score, decision, rubric_scored)
+
+        Returns:
+            Array of decisions aligned with df
+        """
+        scores = pd.to_numeric(df['total_score'], errors='coerce').to_numpy(dtype=float)
+        grounding = df['grounding_score'] if 'grounding_score' in df.columns else pd.Series(1.0, index=df.index)
+        grounding = pd.to_numeric(grounding, errors='coerce').fillna(1.0).to_numpy(dtype=float)
+        current = df['decision'].to_numpy(dtype=object)
+
+        decisions = np.select(
+            [grounding < self.min_grounding_score,
+             scores >= self.score_threshold_include,
+             scores < self.score_threshold_exclude],
+            ['human-review', 'auto-include', 'auto-exclude'],
+            default='human-review'
+        ).astype(object)
+        not_scored = df['rubric_scored'].eq(False) if 'rubric_scored' in df.columns else pd.Series(False, index=df.index)
+        # Results journaled before rubric_scored existed
+        not_scored |= df['reasoning'].eq(NO_ABSTRACT_REASONING) if 'reasoning' in df.columns else False
+        keep = (current == 'error') | np.isnan(scores) | not_scored.to_numpy(dtype=bool)
+        return np.where(keep, current, decisions)
+
     def load_papers(self) -> pd.DataFrame:
         """
         Load deduplicated papers
@@ -236,103 +425,476 @@ Abstract: {abstract}"""
             sys.exit(1)
 
         df = pd.read_csv(dedup_file)
+        df['paper_id'] = self.assign_paper_ids(df)
         print(f"   ✓ Loaded {len(df)} papers")
 
         return df
 
-    def screen_paper(self, title: str, abstract: str) -> Dict[str, any]:
+    @staticmethod
+    def assign_paper_ids(df: pd.DataFrame) -> pd.Series:
         """
-        Screen a single paper using AI-PRISMA with prompt caching
+        Stable canonical paper IDs used as screening checkpoint keys
 
-        Uses Anthropic's prompt caching to cache static rubric (90% cost reduction)
-        v1.2.5.2: Added JSON mode, exponential backoff, and token tracking
+        IDs come from DOI/arXiv/PMID/OpenAlex/S2 (title + year fallback), see
+        core.identifiers.paper_keys. Rows that still share an ID (e.g. same
+        title and year, no identifiers) get "-2", "-3", ... suffixes in
+        file order, so no two papers ever share a checkpoint.
+
+        Args:
+            df: Deduplicated papers
+
+        Returns:
+            Series of unique paper IDs aligned with df
+        """
+        ids = paper_key_strings(df)
+        ids = ids.mask(ids == '', 'row' + pd.Series(range(len(df)), index=df.index).astype(str))
+        occurrence = ids.groupby(ids).cumcount()
+        return ids.where(occurrence == 0, ids + '-' + (occurrence + 1).astype(str))
+
+    def open_journal(self, df: pd.DataFrame) -> ScreeningJournal:
+        """
+        Open the screening checkpoint journal, importing a legacy progress CSV
+
+        Args:
+            df: Papers with paper_id column (to map legacy title rows)
+
+        Returns:
+            ScreeningJournal for this project
+        """
+        journal = ScreeningJournal(self.output_dir / "screening_journal.jsonl")
+        legacy_file = self.output_dir / "screening_progress.csv"
+        if len(journal) == 0 and legacy_file.exists():
+            # Title-keyed checkpoints from older versions: map to paper IDs once
+            df_legacy = pd.read_csv(legacy_file).drop_duplicates(subset='title', keep='last')
+            df_legacy = df_legacy.drop(columns=['paper_id'], errors='ignore')
+            df_legacy = df[['paper_id', 'title']].merge(df_legacy, on='title', how='inner')
+            journal.append(df_legacy.reindex(columns=RESULT_COLUMNS).to_dict('records'))
+            print(f"   ✓ Imported {len(df_legacy)} results from legacy {legacy_file.name}")
+        return journal
+
+    def prefilter_papers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remove clearly off-topic papers with the local BM25 keyword pre-filter
+
+        Settings come from ai_prisma_rubric.prefilter in config.yaml
+        (inclusion_terms, recall_target, max_exclude_fraction, min_score).
+        Papers already scored in earlier runs calibrate the threshold once;
+        it is recorded in prefilter_calibration.json and reused by later
+        runs (delete the file to recalibrate). Scored papers are never
+        excluded. Excluded papers are written to
+        prefilter_excluded.csv and counted separately in the PRISMA flow.
+
+        Args:
+            df: Deduplicated papers
+
+        Returns:
+            Papers to send to AI screening
+        """
+        print("\n🔎 Keyword pre-filter (BM25)...")
+        settings = self.config.get('ai_prisma_rubric', {}).get('prefilter', {}) or {}
+        terms = inclusion_terms(self.config, self.research_question)
+        if not terms:
+            print("   ⚠️  No inclusion terms found, skipping pre-filter")
+            return df
+
+        prefilter = KeywordPrefilter(
+            terms,
+            recall_target=settings.get('recall_target', 0.99),
+            max_exclude_fraction=settings.get('max_exclude_fraction', 0.5),
+            min_score=settings.get('min_score')
+        )
+        scores = prefilter.score(df)
+
+        journal = self.open_journal(df)
+        decisions = journal.load().reindex(df['paper_id'])
+        decisions = decisions['decision'] if 'decision' in decisions.columns else pd.Series(index=decisions.index, dtype=object)
+        screened = decisions.notna().to_numpy()
+        relevant = decisions.isin(['auto-include', 'human-review']).to_numpy()
+
+        calibration_file = self.output_dir / "prefilter_calibration.json"
+        prefilter.load_calibration(calibration_file)
+        threshold = prefilter.calibrate(scores, relevant)
+        if threshold is not None:
+            prefilter.save_calibration(calibration_file)
+        df_kept, df_excluded = prefilter.split(df, scores, protected=screened)
+        df_excluded['decision'] = 'prefilter-exclude'
+        df_excluded['reasoning'] = 'No/low match with inclusion terms (BM25 pre-filter)'
+
+        excluded_file = self.output_dir / "prefilter_excluded.csv"
+        df_excluded.to_csv(excluded_file, index=False)
+        self.prefilter_excluded = len(df_excluded)
+
+        print(f"   ✓ Inclusion terms: {len(terms)} ({', '.join(terms[:8])}{', ...' if len(terms) > 8 else ''})")
+        if threshold is not None:
+            print(f"   ✓ Threshold {threshold:.2f} calibrated on {prefilter.calibrated_on} AI-relevant papers "
+                  f"(recall target {prefilter.recall_target:.0%})")
+        elif prefilter.frozen:
+            print(f"   ✓ Threshold {prefilter.threshold:.2f} frozen from the calibration of {prefilter.calibrated_at} "
+                  f"on {prefilter.calibrated_on} AI-relevant papers (delete {calibration_file.name} to recalibrate)")
+        elif prefilter.threshold is not None:
+            print(f"   ✓ Threshold {prefilter.threshold:.2f} (config min_score)")
+        else:
+            print(f"   ✓ Threshold: no matching inclusion term (uncalibrated)")
+        print(f"   ⛔ Pre-filter excluded: {len(df_excluded)} ({len(df_excluded) / max(len(df), 1) * 100:.1f}%)")
+        print(f"   💾 {excluded_file}")
+
+        return df_kept
+
+    def error_result(self, reasoning: str, decision: str = 'error') -> Dict[str, any]:
+        """
+        Zero-score result for papers that could not be scored by the AI
+
+        Args:
+            reasoning: Explanation stored in the reasoning column
+            decision: Decision to record ("error" or "auto-exclude")
+
+        Returns:
+            Result dictionary in the screen_paper format
+        """
+        return {
+            'scores': {
+                'domain': 0,
+                'intervention': 0,
+                'method': 0,
+                'outcomes': 0,
+                'exclusion': 0,
+                'title_bonus': 0
+            },
+            'total_score': 0,
+            'decision': decision,
+            'reasoning': reasoning,
+            'evidence_quotes': [],
+            'rubric_scored': False
+        }
+
+    def cache_key(self, title: str, abstract: str, compact: Optional[bool] = None) -> str:
+        """
+        Result cache key for one paper under the current prompt, question, model and answer format
 
         Args:
             title: Paper title
             abstract: Paper abstract
+            compact: Whether the answer came from the compact tool call
+                (default: the run's mode; packs always answer in JSON)
+
+        Returns:
+            Cache key
+        """
+        compact = self.compact if compact is None else compact
+        request_format = json.dumps(compact_tool(), sort_keys=True) if compact else 'json'
+        return screening_cache_key(
+            self.get_cached_prefix(), self.research_question, title, abstract, self.model, request_format
+        )
+
+    def lookup_keys(self, title: str, abstract: str) -> List[str]:
+        """Cache keys of answers this run accepts: its own format, plus JSON when compact runs pack papers"""
+        keys = [self.cache_key(title, abstract)]
+        if self.compact and self.pack_size > 1:
+            keys.append(self.cache_key(title, abstract, compact=False))
+        return keys
+
+    def is_cached(self, title: str, abstract: str) -> bool:
+        """True if the result cache holds an acceptable answer for the paper"""
+        return self.cache is not None and any(key in self.cache for key in self.lookup_keys(title, abstract))
+
+    def cached_result(self, title: str, abstract: str) -> Optional[Dict[str, any]]:
+        """
+        Look up a previously scored paper in the result cache
+
+        The decision is re-derived with the current thresholds.
+
+        Args:
+            title: Paper title
+            abstract: Paper abstract
+
+        Returns:
+            Result dictionary, or None on a cache miss
+        """
+        if self.cache is None:
+            return None
+        for key in self.lookup_keys(title, abstract):
+            result_text = self.cache.get(key)
+            if result_text is None:
+                continue
+            try:
+                return self.parse_screening_response(result_text, abstract)
+            except Exception:
+                continue  # Unparseable entry: screen again and overwrite
+        return None
+
+    def store_result(self, title: str, abstract: str, result_text: str, compact: Optional[bool] = None):
+        """Add a successfully parsed model response to the result cache (compact: see cache_key)"""
+        if self.cache is not None:
+            self.cache.put(self.cache_key(title, abstract, compact), self.model, result_text)
+
+    def build_request_params(self, title: str, abstract: str) -> Dict[str, any]:
+        """
+        Build Messages API parameters for screening one paper
+
+        Uses prompt caching: static system prompt is cached across all papers.
+        Shared by the synchronous and the Message Batches screening modes.
+        In compact mode the answer is a forced record_screening tool call.
+
+        Args:
+            title: Paper title
+            abstract: Paper abstract
+
+        Returns:
+            Keyword arguments for messages.create / batch request params
+        """
+        # v1.2.5.2: Reduced max_tokens to 500 for cost optimization
+        params = {
+            "model": self.model,
+            "max_tokens": 500,
+            "system": [
+                {
+                    "type": "text",
+                    "text": self.get_cached_prefix(),
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self.build_paper_content(title, abstract)
+                }
+            ]
+        }
+        if self.compact:
+            params['max_tokens'] = COMPACT_MAX_TOKENS
+            params['tools'] = [compact_tool()]
+            params['tool_choice'] = {"type": "tool", "name": params['tools'][0]['name']}
+            params['messages'][0]['content'] = self.build_compact_content(title, abstract)
+        return params
+
+    def build_compact_content(self, title: str, abstract: str) -> str:
+        """Paper content with numbered abstract sentences (compact mode cites them by number)"""
+        sentences = "\n".join(f"[{i}] {sentence}" for i, sentence in enumerate(split_sentences(abstract), 1))
+        return f"""{self.question_header()}Call record_screening: s = the six rubric scores, r = reasoning in at most 25 words, e = numbers of the abstract sentences that support the scores.
+
+Title: {title}
+
+Abstract:
+{sentences}"""
+
+    def response_text(self, message, abstract: str) -> str:
+        """Result JSON of a response (compact tool calls are expanded to the regular format)"""
+        for block in message.content:
+            if block.type == 'tool_use':
+                return json.dumps(expand_compact(block.input, split_sentences(abstract)))
+        return message.content[0].text
+
+    def cached_prefix_tokens(self) -> int:
+        """Estimated tokens of the cached prefix (tools + system prompt)"""
+        params = self.build_request_params('', '')
+        text = ''.join(block['text'] for block in params['system'])
+        text += ''.join(json.dumps(tool) for tool in params.get('tools', []))
+        return estimate_tokens(text)
+
+    def prefix_cacheable(self) -> bool:
+        """True if the cached prefix reaches the model's minimum cacheable length"""
+        return self.cached_prefix_tokens() >= MIN_CACHEABLE_TOKENS.get(self.model, 1024)
+
+    def prime_cache(self):
+        """
+        Write the cached prefix once before fanning out
+
+        A one-token request with the exact tools/system prefix of the
+        screening requests, so the concurrent requests that follow all
+        read the cache instead of racing to write it. Skipped when the
+        prefix is too short for the model to cache (the call would only
+        cost money).
+        """
+        if self.model in self.primed_models:
+            return
+        self.primed_models.add(self.model)
+        if not self.prefix_cacheable():
+            return
+
+        params = self.build_request_params('', '')
+        params['max_tokens'] = 1
+        params['messages'] = [{"role": "user", "content": "Reply with OK."}]
+        try:
+            response = self.request_with_retry(params)
+        except Exception as e:
+            print(f"   ⚠️  Cache priming failed ({e}); continuing without it")
+            return
+        self.record_usage(response.usage)
+        written = getattr(response.usage, 'cache_creation_input_tokens', None) or 0
+        read = getattr(response.usage, 'cache_read_input_tokens', None) or 0
+        if written or read:
+            print(f"   🔥 Prompt cache primed for {self.model}: {written:,} tokens written, {read:,} already warm")
+        else:
+            print(f"   ⚠️  Prompt cache not engaged for {self.model}")
+
+    def estimate_request_cost(self, params: Dict[str, any]) -> float:
+        """Upper-bound dollar cost of one request (system prompt billed as uncached input)"""
+        text = ''.join(block['text'] for block in params['system'])
+        text += ''.join(message['content'] for message in params['messages'])
+        return usage_cost(estimate_tokens(text), TYPICAL_OUTPUT_TOKENS, price_multiplier=self.price_multiplier)
+
+    def record_usage(self, usage):
+        """Add one response's token usage to the running totals (thread-safe)"""
+        if self.governor is not None:
+            self.governor.record_usage(usage, self.model)
+
+        if self.cascade_model is not None and self.model == self.cascade_model:
+            with self.usage_lock:
+                self.cascade_usage['input'] += usage.input_tokens
+                self.cascade_usage['output'] += usage.output_tokens
+                self.cascade_usage['cache_write'] += getattr(usage, 'cache_creation_input_tokens', None) or 0
+                self.cascade_usage['cache_read'] += getattr(usage, 'cache_read_input_tokens', None) or 0
+            return
+
+        with self.usage_lock:
+            self.total_input_tokens += usage.input_tokens
+            self.total_output_tokens += usage.output_tokens
+
+            # Track cache usage if available
+            if getattr(usage, 'cache_creation_input_tokens', None):
+                self.total_cache_creation_tokens += usage.cache_creation_input_tokens
+            if getattr(usage, 'cache_read_input_tokens', None):
+                self.total_cache_read_tokens += usage.cache_read_input_tokens
+
+    def validate_response(self, result_text: str) -> Tuple[Dict[str, any], List[str]]:
+        """
+        Decode a single-paper response and repair it against the rubric schema
+
+        Args:
+            result_text: Text content of the model response
+
+        Returns:
+            (result, missing field paths); unparseable text counts as all fields missing
+        """
+        try:
+            item = decode_json(result_text)
+        except ValueError:
+            item = None
+        result, missing, repairs = self.response_schema.validate(item)
+        if repairs:
+            with self.usage_lock:
+                self.repaired_responses += 1
+        return result, missing
+
+    def build_followup_params(self, params: Dict[str, any], result_text: str, missing: List[str]) -> Dict[str, any]:
+        """Continue the conversation asking only for the missing fields"""
+        with self.usage_lock:
+            self.followup_requests += 1
+        followup = dict(params)
+        followup['max_tokens'] = FOLLOWUP_MAX_TOKENS
+        followup['messages'] = params['messages'] + [
+            {"role": "assistant", "content": result_text.strip() or "{}"},
+            {"role": "user", "content": followup_prompt(missing)}
+        ]
+        return followup
+
+    def complete_result(self, result: Dict[str, any], missing: List[str], followup_text: str) -> Dict[str, any]:
+        """
+        Merge a follow-up answer into a result
+
+        Raises:
+            ValueError: If fields are still missing afterwards
+        """
+        try:
+            completion = decode_json(followup_text)
+        except ValueError:
+            completion = None
+        self.response_schema.merge(result, completion, missing)
+        result, still_missing, _ = self.response_schema.validate(result)
+        if still_missing:
+            raise ValueError(f"Response missing fields after follow-up: {', '.join(still_missing)}")
+        return result
+
+    def resolve_response(self, params: Dict[str, any], result_text: str, title: str, abstract: str) -> Dict[str, any]:
+        """
+        Validate a response, re-asking only missing fields, then cache it and assign the decision
+
+        Args:
+            params: Parameters of the request that produced result_text
+            result_text: Text content of the model response
+            title: Paper title
+            abstract: Paper abstract
 
         Returns:
             Dictionary with scores, decision, and evidence
         """
-        if pd.isna(abstract) or not abstract or abstract.strip() == "":
-            return {
-                'scores': {
-                    'domain': 0,
-                    'intervention': 0,
-                    'method': 0,
-                    'outcomes': 0,
-                    'exclusion': 0,
-                    'title_bonus': 0
-                },
-                'total_score': 0,
-                'decision': 'auto-exclude',
-                'reasoning': 'No abstract available for screening',
-                'evidence_quotes': []
-            }
+        result, missing = self.validate_response(result_text)
+        if missing:
+            followup = self.request_with_retry(self.build_followup_params(params, result_text, missing))
+            self.record_usage(followup.usage)
+            result = self.complete_result(result, missing, self.response_text(followup, abstract))
+        self.store_result(title, abstract, json.dumps(result))
+        return self.apply_decision(result, abstract)
+
+    async def resolve_response_async(self, client: anthropic.AsyncAnthropic, params: Dict[str, any],
+                                     result_text: str, title: str, abstract: str) -> Dict[str, any]:
+        """Async counterpart of resolve_response"""
+        result, missing = self.validate_response(result_text)
+        if missing:
+            followup = await self.request_with_retry_async(
+                client, self.build_followup_params(params, result_text, missing)
+            )
+            self.record_usage(followup.usage)
+            result = self.complete_result(result, missing, self.response_text(followup, abstract))
+        self.store_result(title, abstract, json.dumps(result))
+        return self.apply_decision(result, abstract)
+
+    def apply_decision(self, result: Dict[str, any], abstract: str) -> Dict[str, any]:
+        """Validate evidence grounding and assign the decision for one parsed result"""
+        if 'evidence_invalid' in result:
+            # Compact mode: evidence are sentence numbers, grounded iff they exist
+            result['grounding_score'] = 0.0 if result['evidence_invalid'] else 1.0
+        else:
+            result['grounding_score'] = self.validate_evidence_grounding(result.get('evidence_quotes', []), abstract)
+        if result['grounding_score'] < self.min_grounding_score:
+            result['decision'] = 'human-review'
+            result['reasoning'] += " [FLAGGED: Potential hallucination in evidence]"
+        else:
+            result['decision'] = self.determine_decision(result['total_score'])
+
+        return result
+
+    def parse_screening_response(self, result_text: str, abstract: str) -> Dict[str, any]:
+        """
+        Parse a rubric JSON response and assign the decision
+
+        Args:
+            result_text: Text content of the model response
+            abstract: Paper abstract (for evidence grounding)
+
+        Returns:
+            Dictionary with scores, decision, and evidence
+
+        Raises:
+            ValueError: If rubric fields are missing after repair
+        """
+        result, missing = self.validate_response(result_text)
+        if missing:
+            raise ValueError(f"Response missing fields: {', '.join(missing)}")
+        return self.apply_decision(result, abstract)
+
+    def request_with_retry(self, params: Dict[str, any]):
+        """
+        messages.create with exponential backoff on 429/5xx/connection errors
+
+        Args:
+            params: Messages API parameters
+
+        Returns:
+            API response
 
+        Raises:
+            anthropic.APIError: When retries are exhausted or the error is not retryable
+        """
         # Exponential backoff retry logic (v1.2.5.2)
         max_retries = 3
         base_delay = 0.5
 
         for attempt in range(max_retries + 1):
             try:
-                # Use prompt caching: static system prompt is cached across all papers
-                # v1.2.5.2: Reduced max_tokens to 500 for cost optimization
-                response = self.client.messages.create(
-                    model="claude-haiku-4-5",
-                    max_tokens=500,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": self.get_cached_system_prompt(),
-                            "cache_control": {"type": "ephemeral"}
-                        }
-                    ],
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": self.build_paper_content(title, abstract)
-                        }
-                    ]
-                )
-
-                # Track token usage (v1.2.5.2: Real-time tracking)
-                usage = response.usage
-                self.total_input_tokens += usage.input_tokens
-                self.total_output_tokens += usage.output_tokens
-
-                # Track cache usage if available
-                if hasattr(usage, 'cache_creation_input_tokens') and usage.cache_creation_input_tokens:
-                    self.total_cache_creation_tokens += usage.cache_creation_input_tokens
-                if hasattr(usage, 'cache_read_input_tokens') and usage.cache_read_input_tokens:
-                    self.total_cache_read_tokens += usage.cache_read_input_tokens
-
-                result_text = response.content[0].text.strip()
-
-                # Remove markdown code blocks if present
-                if result_text.startswith('```'):
-                    lines = result_text.split('\n')
-                    if lines[0].startswith('```'):
-                        lines = lines[1:]
-                    if lines and lines[-1].strip() == '```':
-                        lines = lines[:-1]
-                    result_text = '\n'.join(lines)
-
-                # Parse JSON response
-                import json
-                decoder = json.JSONDecoder()
-                result, end_idx = decoder.raw_decode(result_text)
-
-                # Validate evidence grounding
-                if not self.validate_evidence_grounding(result.get('evidence_quotes', []), abstract):
-                    result['decision'] = 'human-review'
-                    result['reasoning'] += " [FLAGGED: Potential hallucination in evidence]"
-                else:
-                    result['decision'] = self.determine_decision(result['total_score'])
-
-                return result
+                return self.client.messages.create(**params)
 
-            except anthropic.RateLimitError as e:
+            except anthropic.RateLimitError:
                 # 429 Rate Limit - Apply exponential backoff
                 if attempt < max_retries:
                     delay = base_delay * (2 ** attempt)
@@ -340,14 +902,7 @@ Abstract: {abstract}"""
                     time.sleep(delay)
                 else:
                     print(f"   ❌ Rate limit exceeded after {max_retries} retries")
-                    return {
-                        'scores': {'domain': 0, 'intervention': 0, 'method': 0,
-                                  'outcomes': 0, 'exclusion': 0, 'title_bonus': 0},
-                        'total_score': 0,
-                        'decision': 'error',
-                        'reasoning': f'Rate limit error: {str(e)}',
-                        'evidence_quotes': []
-                    }
+                    raise
 
             except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
                 # 5xx Server Error or Connection Error - Apply exponential backoff
@@ -357,170 +912,1036 @@ Abstract: {abstract}"""
                     time.sleep(delay)
                 else:
                     print(f"   ❌ API error after {max_retries} retries: {str(e)}")
-                    return {
-                        'scores': {'domain': 0, 'intervention': 0, 'method': 0,
-                                  'outcomes': 0, 'exclusion': 0, 'title_bonus': 0},
-                        'total_score': 0,
-                        'decision': 'error',
-                        'reasoning': f'API error: {str(e)}',
-                        'evidence_quotes': []
-                    }
-
-            except Exception as e:
-                # Other errors - no retry
-                return {
-                    'scores': {'domain': 0, 'intervention': 0, 'method': 0,
-                              'outcomes': 0, 'exclusion': 0, 'title_bonus': 0},
-                    'total_score': 0,
-                    'decision': 'error',
-                    'reasoning': str(e),
-                    'evidence_quotes': []
-                }
+                    raise
+
+    async def request_with_retry_async(self, client: anthropic.AsyncAnthropic, params: Dict[str, any]):
+        """Async counterpart of request_with_retry (same retry policy)"""
+        max_retries = 3
+        base_delay = 0.5
+
+        for attempt in range(max_retries + 1):
+            try:
+                return await client.messages.create(**params)
 
-    def screen_all_papers(self, df: pd.DataFrame, batch_size: int = 50, max_workers: int = 8) -> pd.DataFrame:
+            except anthropic.RateLimitError:
+                if attempt < max_retries:
+                    await asyncio.sleep(base_delay * (2 ** attempt))
+                else:
+                    print(f"   ❌ Rate limit exceeded after {max_retries} retries")
+                    raise
+
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                if attempt < max_retries and (not hasattr(e, 'status_code') or e.status_code >= 500):
+                    await asyncio.sleep(base_delay * (2 ** attempt))
+                else:
+                    print(f"   ❌ API error after {max_retries} retries: {str(e)}")
+                    raise
+
+    def api_error_result(self, error: Exception) -> Dict[str, any]:
+        """Error result for a failed API call"""
+        if isinstance(error, anthropic.RateLimitError):
+            return self.error_result(f'Rate limit error: {str(error)}')
+        if isinstance(error, (anthropic.APIStatusError, anthropic.APIConnectionError)):
+            return self.error_result(f'API error: {str(error)}')
+        return self.error_result(str(error))
+
+    def screen_paper(self, title: str, abstract: str) -> Dict[str, any]:
+        """
+        Screen a single paper using AI-PRISMA with prompt caching
+
+        Uses Anthropic's prompt caching to cache static rubric (90% cost reduction)
+        v1.2.5.2: Added JSON mode, exponential backoff, and token tracking
+
+        Args:
+            title: Paper title
+            abstract: Paper abstract
+
+        Returns:
+            Dictionary with scores, decision, and evidence
+        """
+        if pd.isna(abstract) or not abstract or abstract.strip() == "":
+            return self.error_result(NO_ABSTRACT_REASONING, decision='auto-exclude')
+
+        cached = self.cached_result(title, abstract)
+        if cached is not None:
+            return cached
+
+        try:
+            params = self.build_request_params(title, abstract)
+            response = self.request_with_retry(params)
+
+            # Track token usage (v1.2.5.2: Real-time tracking)
+            self.record_usage(response.usage)
+
+            return self.resolve_response(params, self.response_text(response, abstract), title, abstract)
+
+        except Exception as e:
+            return self.api_error_result(e)
+
+    async def screen_paper_async(self, client: anthropic.AsyncAnthropic, title: str, abstract: str) -> Dict[str, any]:
+        """
+        Screen a single paper with the async client (same retry policy as screen_paper)
+
+        Args:
+            client: AsyncAnthropic client shared by all in-flight requests
+            title: Paper title
+            abstract: Paper abstract
+
+        Returns:
+            Dictionary with scores, decision, and evidence
+        """
+        if pd.isna(abstract) or not abstract or abstract.strip() == "":
+            return self.error_result(NO_ABSTRACT_REASONING, decision='auto-exclude')
+
+        cached = self.cached_result(title, abstract)
+        if cached is not None:
+            return cached
+
+        try:
+            params = self.build_request_params(title, abstract)
+            response = await self.request_with_retry_async(client, params)
+
+            # Usage is recorded on the event loop thread: no interleaving
+            self.record_usage(response.usage)
+
+            return await self.resolve_response_async(
+                client, params, self.response_text(response, abstract), title, abstract
+            )
+
+        except Exception as e:
+            return self.api_error_result(e)
+
+    def make_packs(self, papers: List[Tuple[str, str]]) -> List[List[int]]:
+        """
+        Group papers into packed screening requests
+
+        Packs grow until pack_size papers or PACK_INPUT_TOKEN_BUDGET
+        estimated input tokens, so N adapts to abstract length. Papers
+        without abstract or with a cached result stay single (no API call).
+
+        Args:
+            papers: (title, abstract) pairs
+
+        Returns:
+            List of packs as positions into papers; a pack of one is
+            screened with screen_paper
+        """
+        max_papers = min(self.pack_size, MAX_OUTPUT_TOKENS // PACK_OUTPUT_TOKENS_PER_PAPER)
+        packs = []
+        current = []
+        current_tokens = 0
+
+        for position, (title, abstract) in enumerate(papers):
+            has_abstract = not pd.isna(abstract) and str(abstract).strip() != ""
+            if max_papers <= 1 or not has_abstract or self.is_cached(title, abstract):
+                packs.append([position])
+                continue
+
+            tokens = estimate_tokens(f"{title}\n{abstract}")
+            if current and (len(current) >= max_papers or current_tokens + tokens > PACK_INPUT_TOKEN_BUDGET):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(position)
+            current_tokens += tokens
+
+        if current:
+            packs.append(current)
+        return packs
+
+    def build_pack_params(self, pack: List[Tuple[str, str]]) -> Dict[str, any]:
+        """Messages API parameters for screening several papers in one request"""
+        papers = "\n\n".join(
+            f"[Paper {i}]\nTitle: {title}\n\nAbstract: {abstract}"
+            for i, (title, abstract) in enumerate(pack, 1)
+        )
+        content = f"""{self.question_header()}Screen each of the {len(pack)} papers below independently. Respond with a JSON array of exactly {len(pack)} objects, one per paper in the order given, each in the JSON format above.
+
+{papers}"""
+
+        params = self.build_request_params('', '')
+        params.pop('tools', None)  # Packs always answer with a JSON array
+        params.pop('tool_choice', None)
+        params['max_tokens'] = min(MAX_OUTPUT_TOKENS, PACK_OUTPUT_TOKENS_PER_PAPER * len(pack))
+        params['messages'] = [{"role": "user", "content": content}]
+        return params
+
+    def parse_pack_response(self, result_text: str, pack: List[Tuple[str, str]]) -> Optional[List[Optional[Dict[str, any]]]]:
+        """
+        Parse a packed response into per-paper results (caching each one)
+
+        Each item is repaired against the rubric schema; items that still
+        miss fields come back as None and are screened individually.
+
+        Args:
+            result_text: Text content of the model response
+            pack: (title, abstract) pairs sent in the request
+
+        Returns:
+            Results in pack order (None per unusable item), or None if the
+            response is not an array of len(pack) items
+        """
+        try:
+            items = decode_json(result_text)
+        except ValueError:
+            return None
+        if not isinstance(items, list) or len(items) != len(pack):
+            return None
+
+        results = []
+        for (title, abstract), item in zip(pack, items):
+            result, missing, repairs = self.response_schema.validate(item)
+            if missing:
+                results.append(None)
+                continue
+            if repairs:
+                with self.usage_lock:
+                    self.repaired_responses += 1
+            self.store_result(title, abstract, json.dumps(result), compact=False)  # Packs answer in JSON
+            results.append(self.apply_decision(result, abstract))
+        return results
+
+    def count_pack_results(self, results: List[Optional[Dict[str, any]]]):
+        """Update packed / per-paper fallback counters (thread-safe)"""
+        fallbacks = sum(result is None for result in results)
+        with self.usage_lock:
+            self.packed_papers += len(results) - fallbacks
+            self.pack_fallbacks += fallbacks
+
+    def screen_pack(self, pack: List[Tuple[str, str]]) -> List[Dict[str, any]]:
+        """
+        Screen a pack of papers in one request
+
+        Papers are screened one request each if the packed call fails,
+        returns a malformed array, or leaves their fields incomplete.
+
+        Args:
+            pack: (title, abstract) pairs
+
+        Returns:
+            Results in pack order
+        """
+        if len(pack) == 1:
+            return [self.screen_paper(*pack[0])]
+
+        try:
+            response = self.request_with_retry(self.build_pack_params(pack))
+            self.record_usage(response.usage)
+            results = self.parse_pack_response(response.content[0].text, pack)
+        except Exception:
+            results = None
+
+        results = results or [None] * len(pack)
+        self.count_pack_results(results)
+        return [result if result is not None else self.screen_paper(title, abstract)
+                for (title, abstract), result in zip(pack, results)]
+
+    async def screen_pack_async(self, client: anthropic.AsyncAnthropic, pack: List[Tuple[str, str]]) -> List[Dict[str, any]]:
+        """Async counterpart of screen_pack"""
+        if len(pack) == 1:
+            return [await self.screen_paper_async(client, *pack[0])]
+
+        try:
+            response = await self.request_with_retry_async(client, self.build_pack_params(pack))
+            self.record_usage(response.usage)
+            results = self.parse_pack_response(response.content[0].text, pack)
+        except Exception:
+            results = None
+
+        results = results or [None] * len(pack)
+        self.count_pack_results(results)
+        fallbacks = await asyncio.gather(*(
+            self.screen_paper_async(client, title, abstract)
+            for (title, abstract), result in zip(pack, results) if result is None
+        ))
+        fallbacks = iter(fallbacks)
+        return [result if result is not None else next(fallbacks) for result in results]
+
+    async def screen_papers_async(
+        self,
+        df_to_screen: pd.DataFrame,
+        journal: ScreeningJournal,
+        total: int,
+        already_screened: int = 0,
+        batch_size: int = 50,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ):
+        """
+        Screen papers concurrently on one event loop
+
+        A semaphore bounds the number of in-flight requests (hundreds are
+        fine - the limit is the API rate limit, not threads). Finished
+        results go through a queue to a single writer coroutine, which is
+        the only code touching the journal.
+
+        Args:
+            df_to_screen: Papers not yet screened
+            journal: Checkpoint journal to append results to
+            total: Total number of papers (for progress display)
+            already_screened: Papers screened in earlier runs
+            batch_size: Report saved progress every N papers
+            max_concurrency: Maximum concurrent API requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def writer():
+            screened_count = already_screened
+            while True:
+                result = await queue.get()
+                if result is None:
+                    break
+                journal.append([result])
+                screened_count += 1
+                self.print_progress(result, screened_count, total)
+                self.governor.record_papers(1)
+                if (screened_count - already_screened) % batch_size == 0:
+                    print(f"   💾 Progress saved ({screened_count}/{total})")
+            journal.sync()
+
+        async with anthropic.AsyncAnthropic(**self.client_options) as client:
+
+            rows = df_to_screen[['paper_id', 'title', 'abstract']].to_dict('records')
+            papers = [(row['title'], row['abstract']) for row in rows]
+
+            async def screen_and_queue(pack):
+                try:
+                    await asyncio.sleep(self.governor.throttle_delay())
+                    if self.governor.exhausted():
+                        return
+                    try:
+                        results = await self.screen_pack_async(client, [papers[i] for i in pack])
+                    except Exception as e:
+                        # Journal the failure rather than letting the papers vanish
+                        print(f"   ❌ Error processing paper: {e}")
+                        results = [self.api_error_result(e) for _ in pack]
+                    for i, result in zip(pack, results):
+                        await queue.put(self.format_result(rows[i], result))
+                finally:
+                    semaphore.release()
+
+            def task_done(task: asyncio.Task):
+                tasks.discard(task)
+                if not task.cancelled() and task.exception() is not None:
+                    print(f"   ❌ Error processing paper: {task.exception()}")
+
+            writer_task = asyncio.create_task(writer())
+            tasks = set()
+            for pack in self.make_packs(papers):
+                # Acquire before creating the task so at most max_concurrency exist
+                await semaphore.acquire()
+                if self.governor.exhausted():
+                    semaphore.release()
+                    break
+                task = asyncio.create_task(screen_and_queue(pack))
+                tasks.add(task)
+                task.add_done_callback(task_done)
+
+            # Failures are reported by task_done
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            await queue.put(None)
+            await writer_task
+
+    def print_progress(self, result: Dict[str, any], screened_count: int, total: int):
+        """Print a one-line progress indicator for a screened paper"""
+        decision_emoji = {'auto-include': '✅', 'auto-exclude': '⛔', 'human-review': '⚠️', 'error': '❌'}
+        emoji = decision_emoji.get(result['decision'], '?')
+        print(f"   [{screened_count}/{total}] {result['title'][:50]}... → {emoji} {result['decision']} (score: {result['total_score']})")
+
+    def format_result(self, row, result: Dict[str, any]) -> Dict[str, any]:
+        """Flatten a screen_paper result into a journal record (row: paper with paper_id and title)"""
+        return {
+            'paper_id': row['paper_id'],
+            'title': row['title'],
+            'domain_score': result['scores']['domain'],
+            'intervention_score': result['scores']['intervention'],
+            'method_score': result['scores']['method'],
+            'outcomes_score': result['scores']['outcomes'],
+            'exclusion_score': result['scores']['exclusion'],
+            'title_bonus': result['scores']['title_bonus'],
+            'total_score': result['total_score'],
+            'decision': result['decision'],
+            'reasoning': result['reasoning'],
+            'grounding_score': result.get('grounding_score'),
+            'rubric_scored': result.get('rubric_scored', True)
+        }
+
+    def screen_papers_batch(
+        self,
+        df_to_screen: pd.DataFrame,
+        journal: ScreeningJournal,
+        wait: bool = True,
+        poll_interval: float = 60.0,
+        max_batch_requests: int = MAX_BATCH_REQUESTS,
+        state_name: str = "screening_batches.json"
+    ) -> bool:
+        """
+        Screen papers through the Message Batches API
+
+        Papers are submitted as batch jobs (50% cheaper than interactive
+        calls). Batch IDs and their custom_id → paper_id map are kept in
+        screening_batches.json, so an interrupted or --no-wait run can be
+        re-run later to collect results without re-submitting anything.
+        Results are mapped back by custom_id and appended to the journal
+        as each batch ends.
+
+        Args:
+            df_to_screen: Papers not yet screened
+            journal: Checkpoint journal to append results to
+            wait: Poll until all batches have ended (False: submit and return)
+            poll_interval: Seconds between status polls
+            max_batch_requests: Requests per submitted batch
+            state_name: Batch state file in the screening directory
+
+        Returns:
+            True when no batches are left pending
+        """
+        state_file = self.output_dir / state_name
+        if state_file.exists():
+            with open(state_file, 'r') as f:
+                state = json.load(f)
+        else:
+            state = {'batches': []}
+
+        def save_state():
+            tmp_file = state_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_file, state_file)
+
+        pending_ids = {paper_id for batch in state['batches'] for paper_id in batch['requests'].values()}
+        papers = df_to_screen.set_index('paper_id')[['title', 'abstract']]
+
+        # Build requests; papers without abstract or with a cached result are decided locally
+        local_results = []
+        requests = []
+        for idx, row in df_to_screen.iterrows():
+            if row['paper_id'] in pending_ids:
+                continue
+            if pd.isna(row['abstract']) or not str(row['abstract']).strip():
+                local_results.append(self.format_result(row, self.screen_paper(row['title'], row['abstract'])))
+                continue
+            cached = self.cached_result(row['title'], row['abstract'])
+            if cached is not None:
+                local_results.append(self.format_result(row, cached))
+                continue
+            requests.append({
+                'custom_id': f"paper-{row['paper_id']}",
+                'paper_id': row['paper_id'],
+                'params': self.build_request_params(row['title'], row['abstract'])
+            })
+        journal.append(local_results)
+        self.governor.record_papers(len(local_results))
+
+        # Spend cap: submit only the requests the remaining budget covers
+        if self.governor.max_cost is not None and requests:
+            budget = self.governor.max_cost - self.governor.cost
+            estimated = np.cumsum([self.estimate_request_cost(r['params']) for r in requests])
+            affordable = int(np.searchsorted(estimated, budget, side='right'))
+            if affordable < len(requests):
+                print(f"   🛑 Budget cap ${self.governor.max_cost:.2f}: submitting {affordable} of "
+                      f"{len(requests)} requests (re-run with a higher --max-cost for the rest)")
+                requests = requests[:affordable]
+
+        # Submit new batches
+        for start in range(0, len(requests), max_batch_requests):
+            chunk = requests[start:start + max_batch_requests]
+            batch = self.client.messages.batches.create(
+                requests=[{'custom_id': r['custom_id'], 'params': r['params']} for r in chunk]
+            )
+            state['batches'].append({
+                'id': batch.id,
+                'submitted_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'requests': {r['custom_id']: r['paper_id'] for r in chunk}
+            })
+            save_state()
+            print(f"   📤 Submitted batch {batch.id} ({len(chunk)} papers)")
+
+        if state['batches'] and not wait:
+            return False
+
+        # Poll until every batch has ended, collecting results as they finish
+        while state['batches']:
+            for batch_info in list(state['batches']):
+                batch = self.client.messages.batches.retrieve(batch_info['id'])
+                counts = batch.request_counts
+                if batch.processing_status != 'ended':
+                    print(f"   ⏳ {batch.id}: {batch.processing_status} "
+                          f"({counts.succeeded + counts.errored}/{len(batch_info['requests'])} done)")
+                    continue
+
+                results = []
+                for entry in self.client.messages.batches.results(batch.id):
+                    paper_id = batch_info['requests'].get(entry.custom_id)
+                    if paper_id not in papers.index:
+                        continue
+                    title, abstract = papers.loc[paper_id, 'title'], papers.loc[paper_id, 'abstract']
+                    if entry.result.type == 'succeeded':
+                        message = entry.result.message
+                        self.record_usage(message.usage)
+                        try:
+                            result = self.resolve_response(
+                                self.build_request_params(title, abstract), self.response_text(message, abstract),
+                                title, abstract
+                            )
+                        except Exception as e:
+                            result = self.error_result(str(e))
+                    else:
+                        result = self.error_result(f'Batch request {entry.result.type}')
+                    results.append(self.format_result({'paper_id': paper_id, 'title': title}, result))
+
+                # Persist results before forgetting the batch
+                journal.append(results)
+                journal.sync()
+                self.governor.record_papers(len(results))
+                state['batches'].remove(batch_info)
+                save_state()
+                print(f"   📥 Collected batch {batch.id}: {len(results)} results")
+
+            if state['batches']:
+                time.sleep(poll_interval)
+
+        state_file.unlink(missing_ok=True)
+        return True
+
+    def screen_all_papers(
+        self,
+        df: pd.DataFrame,
+        batch_size: int = 50,
+        max_workers: int = 8,
+        mode: str = 'async',
+        wait: bool = True,
+        poll_interval: float = 60.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        prioritize: bool = False,
+        recall_target: Optional[float] = None,
+        round_size: int = 200,
+        max_cost: Optional[float] = None,
+        max_cost_per_hour: Optional[float] = None,
+        metrics_interval: float = 10.0
+    ) -> Optional[pd.DataFrame]:
         """
         Screen all papers with parallel processing and progress tracking
 
-        Uses ThreadPoolExecutor for 6-8x speedup via concurrent API calls
+        Uses an asyncio engine with up to max_concurrency in-flight requests
+        (mode="async"), ThreadPoolExecutor (mode="sync"), or the Message
+        Batches API (mode="batch") for 50% lower cost.
 
         Args:
             df: DataFrame with papers to screen
-            batch_size: Save progress every N papers
-            max_workers: Number of parallel workers (default: 8)
+            batch_size: Report saved progress every N papers
+            max_workers: Sync mode only - number of parallel workers (default: 8)
+            mode: "async", "sync" (thread pool) or "batch" (Message Batches API)
+            wait: Batch mode only - poll until all batches have ended
+            poll_interval: Batch mode only - seconds between status polls
+            max_concurrency: Async mode only - concurrent API requests
+            prioritize: Screen most-likely-relevant papers first (active learning)
+            recall_target: Stop early once estimated recall reaches this (implies prioritize)
+            round_size: Prioritized mode only - papers per round between model updates
+            max_cost: Stop starting new requests once this many dollars are spent
+            max_cost_per_hour: Throttle requests to stay under this spend rate
+            metrics_interval: Seconds between live metrics lines (screening_metrics.jsonl)
 
         Returns:
-            DataFrame with screening results
+            DataFrame with screening results (None while batches are pending)
         """
         print("\n" + "="*60)
         print("🔍 PAPER SCREENING (OPTIMIZED)")
         print("="*60)
         print(f"\nResearch Question: {self.research_question}")
         print(f"Total papers to screen: {len(df)}")
-        print(f"⚡ Parallel workers: {max_workers}")
-        print(f"⚡ Estimated time: {len(df) / (max_workers * 20):.1f} minutes (optimized)")
+        workers = max_concurrency if mode == 'async' else max_workers
+        print(f"⚡ {'Concurrent requests' if mode == 'async' else 'Parallel workers'}: {workers}")
+        # Time estimate from the throughput measured in the previous run
+        metrics_file = self.output_dir / "screening_metrics.jsonl"
+        papers_per_s = BudgetGovernor.last_throughput(metrics_file)
+        if papers_per_s and mode != 'batch':
+            print(f"⚡ Estimated time: {len(df) / papers_per_s / 60:.1f} minutes "
+                  f"(last run: {papers_per_s:.2f} papers/s)")
+        elif mode != 'batch':
+            print(f"⚡ Estimated time: measured live (see 📈 lines)")
 
         # Cost estimation with prompt caching
-        # Haiku-4-5: Input $0.80/MTok, Output $4.00/MTok, Cached $0.08/MTok
+        # Haiku-4-5: Input $1.00/MTok, Output $5.00/MTok, Cached $0.10/MTok (PRICES)
         # ~30 cached tokens + 150 user tokens input, 200 tokens output per paper
-        cost_per_paper = 0.000944  # Optimized with caching
-        print(f"💰 Estimated cost: ${len(df) * cost_per_paper:.2f} (with 90% cache discount)")
-
-        # Check if screening already in progress
-        progress_file = self.output_dir / "screening_progress.csv"
-        if progress_file.exists():
-            print(f"\n✓ Found existing progress file")
-            df_progress = pd.read_csv(progress_file)
-
-            # Remove duplicates (keep last occurrence)
-            initial_rows = len(df_progress)
-            df_progress = df_progress.drop_duplicates(subset='title', keep='last')
-            if initial_rows > len(df_progress):
-                print(f"  ⚠️  Removed {initial_rows - len(df_progress)} duplicate rows from progress file")
-
-            print(f"  Already screened: {len(df_progress)} papers")
-
-            # Merge with original dataframe
-            df = df.merge(
-                df_progress[['title', 'total_score', 'decision', 'reasoning',
-                            'domain_score', 'intervention_score', 'method_score',
-                            'outcomes_score', 'exclusion_score', 'title_bonus']],
-                on='title',
-                how='left',
-                suffixes=('', '_screened')
-            )
-
-            # Continue from where we left off
-            df_to_screen = df[df['decision'].isna()]
-            already_screened = len(df) - len(df_to_screen)
+        cost_per_paper = usage_cost(150, 200, cache_read_tokens=30)  # Optimized with caching
+        if mode == 'batch':
+            self.price_multiplier = BATCH_PRICE_MULTIPLIER
+            print(f"📦 Mode: Message Batches API (results within 24h)")
+        print(f"💰 Estimated cost: ${len(df) * cost_per_paper * self.price_multiplier:.2f} (with 90% cache discount)")
+        if self.compact:
+            print(f"🗜️  Compact output: forced tool call, evidence as sentence numbers")
+        if self.warm_cache:
+            prefix_tokens = self.cached_prefix_tokens()
+            minimum = MIN_CACHEABLE_TOKENS.get(self.model, 1024)
+            if prefix_tokens >= minimum:
+                print(f"🔥 Cache warming: ~{prefix_tokens:,} token prefix (rubric, question, criteria), primed before fan-out")
+            else:
+                # The API ignores cache_control below the minimum: warming cannot produce cache reads
+                self.warm_cache = False
+                print(f"⚠️  --warm-cache turned off: the ~{prefix_tokens:,} token prefix is below the {minimum:,}-token "
+                      f"minimum {self.model} caches, so it cannot help this model")
+                print(f"   Use --pack-size to amortize the prefix, or warm a model with a lower minimum "
+                      f"({', '.join(f'{model}: {tokens:,}' for model, tokens in MIN_CACHEABLE_TOKENS.items() if tokens < minimum)})")
+        if max_cost is not None:
+            print(f"🛑 Budget cap: ${max_cost:.2f}")
+        if max_cost_per_hour is not None:
+            print(f"🐢 Spend rate limit: ${max_cost_per_hour:.2f}/hour")
+
+        # Resume from the checkpoint journal (keyed by paper_id)
+        if 'paper_id' not in df.columns:
+            df['paper_id'] = self.assign_paper_ids(df)
+        journal = self.open_journal(df)
+
+        # Screen each distinct abstract once; other rows sharing it get its result
+        abstract_keys = abstract_hashes(df)
+        self.fan_out_abstract_duplicates(df, abstract_keys, journal)
+        pending = ~df['paper_id'].isin(journal.done_ids()).to_numpy()
+        shared = np.zeros(len(df), dtype=bool)
+        shared[pending] = pd.Series(abstract_keys[pending]).duplicated().to_numpy()
+        shared &= abstract_keys != MISSING_HASH
+        if shared.any():
+            print(f"🔁 Shared abstracts: {shared.sum()} papers will reuse the result of an identical abstract")
+        df_pool = df[~shared]
+
+        df_to_screen = df_pool[~df_pool['paper_id'].isin(journal.done_ids())]
+        already_screened = len(df_pool) - len(df_to_screen)
+        if already_screened > 0:
+            print(f"\n✓ Found existing screening journal")
+            print(f"  Already screened: {already_screened} papers")
             print(f"  Remaining to screen: {len(df_to_screen)}")
-        else:
-            df_to_screen = df.copy()
-            already_screened = 0
+
+        self.governor = BudgetGovernor(
+            max_cost=max_cost, max_cost_per_hour=max_cost_per_hour, metrics_file=metrics_file,
+            interval=metrics_interval, price_multiplier=self.price_multiplier, total_papers=len(df_to_screen),
+            cacheable=self.prefix_cacheable()
+        )
 
         if len(df_to_screen) == 0:
             print("\n✓ All papers already screened!")
-            return df
+            return self.load_results(df, journal)
+
+        if mode == 'batch':
+            if prioritize or recall_target is not None:
+                print("   ⚠️  Prioritized screening needs interactive results; ignored in batch mode")
+            print(f"\n⏳ Submitting papers to the Message Batches API...")
+            if not self.screen_papers_batch(df_to_screen, journal, wait=wait, poll_interval=poll_interval):
+                print(f"\n⏸️  Batches submitted. Re-run the same command to collect results.")
+                return None
+            self.fan_out_abstract_duplicates(df, abstract_keys, journal)
+            return self.load_results(self.drop_budget_unscreened(df, journal), journal)
+
+        if prioritize or recall_target is not None:
+            print(f"\n⏳ Starting prioritized screening (rounds of {round_size})...")
+            df_unscreened = self.screen_prioritized(
+                df_pool, journal, recall_target=recall_target, round_size=round_size,
+                mode=mode, batch_size=batch_size, max_workers=max_workers, max_concurrency=max_concurrency
+            )
+        else:
+            print(f"\n⏳ Starting {'async' if mode == 'async' else 'parallel'} screening...")
+            self.run_engine(
+                df_to_screen, journal, mode=mode, total=len(df_pool), already_screened=already_screened,
+                batch_size=batch_size, max_workers=max_workers, max_concurrency=max_concurrency
+            )
+            df_unscreened = df.iloc[0:0]
+
+        self.fan_out_abstract_duplicates(df, abstract_keys, journal)
+
+        # Papers left unscreened by the stopping rule (and rows sharing their abstract) are recorded for PRISMA
+        early_stop_file = self.output_dir / "early_stopped.csv"
+        if len(df_unscreened) > 0:
+            unscreened_keys = abstract_hashes(df_unscreened)
+            df_unscreened = df[~df['paper_id'].isin(journal.done_ids()) & (
+                df['paper_id'].isin(df_unscreened['paper_id'])
+                | np.isin(abstract_keys, unscreened_keys[unscreened_keys != MISSING_HASH])
+            )]
+            df_unscreened = df_unscreened.assign(
+                decision='early-stop',
+                reasoning=f'Not screened: estimated recall target {recall_target:.0%} reached'
+            )
+            df_unscreened.to_csv(early_stop_file, index=False)
+            self.early_stopped = len(df_unscreened)
+            print(f"   💾 Unscreened papers: {early_stop_file}")
+            df = df[~df['paper_id'].isin(df_unscreened['paper_id'])]
+        elif early_stop_file.exists():
+            early_stop_file.unlink()
 
-        print(f"\n⏳ Starting parallel screening...")
+        return self.load_results(self.drop_budget_unscreened(df, journal), journal)
 
-        results = []
-        results_lock = asyncio.Lock()
-
-        def screen_and_format(row):
-            """Screen a paper and format result"""
-            result = self.screen_paper(row['title'], row['abstract'])
-            return {
-                'title': row['title'],
-                'domain_score': result['scores']['domain'],
-                'intervention_score': result['scores']['intervention'],
-                'method_score': result['scores']['method'],
-                'outcomes_score': result['scores']['outcomes'],
-                'exclusion_score': result['scores']['exclusion'],
-                'title_bonus': result['scores']['title_bonus'],
-                'total_score': result['total_score'],
-                'decision': result['decision'],
-                'reasoning': result['reasoning']
-            }
+    def fan_out_abstract_duplicates(self, df: pd.DataFrame, abstract_keys: np.ndarray,
+                                    journal: ScreeningJournal) -> int:
+        """
+        Copy screened results to unscreened papers with the same normalized abstract
+
+        Records that survive deduplication with re-formatted titles but an
+        identical abstract are the same work; only one of them is sent to
+        the API.
+
+        Args:
+            df: Papers with paper_id column
+            abstract_keys: abstract_hashes(df)
+            journal: Checkpoint journal
+
+        Returns:
+            Number of results copied
+        """
+        done = df['paper_id'].isin(journal.done_ids()).to_numpy()
+        has_key = abstract_keys != MISSING_HASH
+        sources = pd.Series(df['paper_id'].to_numpy()[done & has_key], index=abstract_keys[done & has_key])
+        sources = sources[~sources.index.duplicated()]
+
+        targets = ~done & has_key & np.isin(abstract_keys, sources.index.to_numpy())
+        if not targets.any():
+            return 0
+
+        source_ids = sources.reindex(abstract_keys[targets]).to_numpy()
+        source_records = {record['paper_id']: record for record in journal.read(set(source_ids))}
+        records = [
+            dict(source_records[source_id], paper_id=paper_id, title=title,
+                 reasoning=f"{source_records[source_id]['reasoning']} [Same abstract as {source_id}]")
+            for paper_id, title, source_id in zip(df['paper_id'][targets], df['title'][targets], source_ids)
+        ]
+        journal.append(records)
+        self.abstract_duplicates += len(records)
+        return len(records)
+
+    def drop_budget_unscreened(self, df: pd.DataFrame, journal: ScreeningJournal) -> pd.DataFrame:
+        """
+        Report the run's throughput and set aside papers the budget cap left unscreened
+
+        Unscreened papers stay out of the journal, so re-running with a
+        higher --max-cost screens exactly those.
+
+        Args:
+            df: Papers with paper_id column
+            journal: Checkpoint journal
+
+        Returns:
+            df without unscreened papers
+        """
+        summary = self.governor.summary()
+        print(f"\n📈 Throughput: {summary['papers_per_s']:.2f} papers/s over {summary['elapsed_s']:.0f}s, "
+              f"${summary['cost_usd']:.4f} spent (metrics: {self.governor.metrics_file})")
+
+        unscreened = ~df['paper_id'].isin(journal.done_ids())
+        self.budget_unscreened = int(unscreened.sum())
+        if self.budget_unscreened > 0:
+            print(f"   🛑 {self.budget_unscreened} papers not screened (budget cap); "
+                  f"re-run with a higher --max-cost to continue")
+        return df[~unscreened]
+
+    def run_engine(
+        self,
+        df_to_screen: pd.DataFrame,
+        journal: ScreeningJournal,
+        mode: str,
+        total: int,
+        already_screened: int = 0,
+        batch_size: int = 50,
+        max_workers: int = 8,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ):
+        """Screen papers with the async or thread-pool engine, appending to the journal"""
+        if self.warm_cache and len(df_to_screen) > 0 and not self.governor.exhausted():
+            self.prime_cache()
+        if mode == 'async':
+            asyncio.run(self.screen_papers_async(
+                df_to_screen, journal, total=total, already_screened=already_screened,
+                batch_size=batch_size, max_concurrency=max_concurrency
+            ))
+        else:
+            self.screen_papers_threaded(
+                df_to_screen, journal, total=total, already_screened=already_screened,
+                batch_size=batch_size, max_workers=max_workers
+            )
+
+    def screen_papers_threaded(
+        self,
+        df_to_screen: pd.DataFrame,
+        journal: ScreeningJournal,
+        total: int,
+        already_screened: int = 0,
+        batch_size: int = 50,
+        max_workers: int = 8
+    ):
+        """
+        Screen papers with a ThreadPoolExecutor around blocking API calls
+
+        Args:
+            df_to_screen: Papers not yet screened
+            journal: Checkpoint journal to append results to
+            total: Total number of papers (for progress display)
+            already_screened: Papers screened in earlier runs
+            batch_size: Report saved progress every N papers
+            max_workers: Number of parallel workers
+        """
+        screened_count = already_screened
+
+        rows = df_to_screen[['paper_id', 'title', 'abstract']].to_dict('records')
+        papers = [(row['title'], row['abstract']) for row in rows]
+
+        def screen_and_format(pack):
+            """Screen a pack of papers and format results"""
+            time.sleep(self.governor.throttle_delay())
+            if self.governor.exhausted():
+                return []
+            return [
+                self.format_result(rows[i], result)
+                for i, result in zip(pack, self.screen_pack([papers[i] for i in pack]))
+            ]
 
         # Use ThreadPoolExecutor for parallel API calls
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = []
-            for idx, row in df_to_screen.iterrows():
-                futures.append(executor.submit(screen_and_format, row))
+            for pack in self.make_packs(papers):
+                futures.append(executor.submit(screen_and_format, pack))
 
             # Process results as they complete
-            from concurrent.futures import as_completed
             for i, future in enumerate(as_completed(futures), 1):
                 try:
-                    result = future.result()
-                    results.append(result)
-
-                    # Progress indicator
-                    screened_count = len(results) + already_screened
-                    decision_emoji = {'auto-include': '✅', 'auto-exclude': '⛔', 'human-review': '⚠️', 'error': '❌'}
-                    emoji = decision_emoji.get(result['decision'], '?')
-                    print(f"   [{screened_count}/{len(df)}] {result['title'][:50]}... → {emoji} {result['decision']} (score: {result['total_score']})")
-
-                    # Save progress periodically (OPTIMIZED: append only new batch)
-                    if len(results) % batch_size == 0:
-                        # Only save the last batch_size results
-                        df_batch = pd.DataFrame(results[-batch_size:])
-
-                        # Use append mode to avoid reading entire file
-                        mode = 'a' if progress_file.exists() else 'w'
-                        header = not progress_file.exists()
-                        df_batch.to_csv(progress_file, mode=mode, header=header, index=False)
-                        print(f"   💾 Progress saved ({screened_count}/{len(df)})")
+                    for result in future.result():
+                        # Journal every result as it completes (fsync is group-committed)
+                        journal.append([result])
+
+                        # Progress indicator
+                        screened_count += 1
+                        self.print_progress(result, screened_count, total)
+                        self.governor.record_papers(1)
+                        if (screened_count - already_screened) % batch_size == 0:
+                            print(f"   💾 Progress saved ({screened_count}/{total})")
 
                 except Exception as e:
                     print(f"   ❌ Error processing paper: {e}")
 
-        # Save final results (remaining items not yet saved)
-        remaining = len(results) % batch_size
-        if remaining > 0:
-            df_batch = pd.DataFrame(results[-remaining:])
-            mode = 'a' if progress_file.exists() else 'w'
-            header = not progress_file.exists()
-            df_batch.to_csv(progress_file, mode=mode, header=header, index=False)
-
-        # Load all screened results from file (avoiding memory overhead)
-        df_all_screened = pd.read_csv(progress_file)
-
-        # Remove any duplicates that might have accumulated
-        df_all_screened = df_all_screened.drop_duplicates(subset='title', keep='last')
-
-        # Merge with original dataframe
-        df = df.merge(
-            df_all_screened[['title', 'total_score', 'decision', 'reasoning',
-                       'domain_score', 'intervention_score', 'method_score',
-                       'outcomes_score', 'exclusion_score', 'title_bonus']],
-            on='title',
-            how='left',
-            suffixes=('', '_screened')
-        )
+        journal.sync()
+
+    def screen_prioritized(
+        self,
+        df: pd.DataFrame,
+        journal: ScreeningJournal,
+        recall_target: Optional[float] = None,
+        round_size: int = 200,
+        **engine_args
+    ) -> pd.DataFrame:
+        """
+        Screen in rounds, most-likely-relevant papers first (active learning)
+
+        The queue starts in BM25 order against the inclusion terms and is
+        re-ranked after every round by a model refit on the AI decisions.
+        With recall_target set, screening stops once the estimated recall
+        of relevant (auto-include/human-review) papers reaches it.
+
+        Args:
+            df: All papers (with paper_id)
+            journal: Checkpoint journal
+            recall_target: Stop at this estimated recall (None: screen everything)
+            round_size: Papers per round between model updates
+            **engine_args: mode, batch_size, max_workers, max_concurrency for run_engine
 
+        Returns:
+            Papers left unscreened by the stopping rule
+        """
+        terms = inclusion_terms(self.config, self.research_question)
+        texts = KeywordPrefilter.paper_texts(df)
+        prior = KeywordPrefilter(terms).score(df) if terms else np.zeros(len(df))
+        scheduler = PriorityScheduler(texts, prior, recall_target=recall_target, round_size=round_size)
+
+        position_of = pd.Series(np.arange(len(df)), index=df['paper_id'].to_numpy())
+
+        def record(paper_ids, prioritized):
+            records = journal.read(paper_ids)
+            positions = position_of.reindex([r['paper_id'] for r in records]).to_numpy()
+            relevant = np.array([r.get('decision') in RELEVANT_DECISIONS for r in records], dtype=bool)
+            scheduler.record(positions, relevant, prioritized=prioritized)
+
+        # Results from earlier runs train the model but say nothing about the tail
+        record(df['paper_id'][df['paper_id'].isin(journal.done_ids())], prioritized=False)
+
+        while not scheduler.should_stop() and not self.governor.exhausted():
+            positions = scheduler.next_round()
+            df_round = df.iloc[positions]
+            self.run_engine(
+                df_round, journal, total=len(df), already_screened=int(scheduler.screened.sum()), **engine_args
+            )
+            record(df_round['paper_id'], prioritized=True)
+
+            recall = scheduler.estimated_recall()
+            print(f"   🎯 Round {scheduler.rounds}: {scheduler.last_round_rate:.0%} relevant | "
+                  f"found {scheduler.found} | screened {int(scheduler.screened.sum())}/{len(df)} | "
+                  f"est. recall {recall:.1%}")
+
+        if scheduler.remaining > 0 and scheduler.should_stop():
+            print(f"\n⏹️  Early stop: estimated recall {scheduler.estimated_recall():.1%} ≥ {recall_target:.0%}")
+            print(f"   LLM calls saved: {scheduler.remaining} papers not screened")
+        if not scheduler.should_stop():
+            # Stopped by the budget cap: the rest stays pending for the next run
+            return df.iloc[0:0]
+        return df[~scheduler.screened]
+
+    def load_results(self, df: pd.DataFrame, journal: ScreeningJournal) -> pd.DataFrame:
+        """
+        Attach the latest journal result to every paper (aligned on paper_id)
+
+        Args:
+            df: Papers with paper_id column
+            journal: Checkpoint journal
+
+        Returns:
+            df with score, decision and reasoning columns
+        """
+        results = journal.load().reindex(df['paper_id'])
+        columns = RESULT_COLUMNS[2:] + [c for c in CASCADE_COLUMNS if c in results.columns]
+        df = df.drop(columns=columns, errors='ignore').copy()
+        for column in columns:
+            df[column] = results[column].to_numpy() if column in results.columns else np.nan
         return df
 
+    def cascade_screen(
+        self,
+        df: pd.DataFrame,
+        cascade_model: str,
+        mode: str = 'async',
+        batch_size: int = 50,
+        max_workers: int = 8,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        wait: bool = True,
+        poll_interval: float = 60.0
+    ) -> Optional[pd.DataFrame]:
+        """
+        Re-score the human-review band with a stronger model (two-tier cascade)
+
+        Papers the first-tier model left in human review (score between
+        the exclude and include thresholds, or flagged evidence) are
+        screened again by cascade_model into screening_cascade.jsonl. The
+        second-tier result replaces the first in the main journal, keeping
+        tier1_total_score / tier1_decision; agreement statistics go to
+        cascade_stats.json.
+
+        Args:
+            df: Screened papers (from screen_all_papers)
+            cascade_model: Second-tier model
+            mode: "async", "sync" or "batch"
+            batch_size: Report saved progress every N papers
+            max_workers: Sync mode only - number of parallel workers
+            max_concurrency: Async mode only - concurrent API requests
+            wait: Batch mode only - poll until all batches have ended
+            poll_interval: Batch mode only - seconds between status polls
+
+        Returns:
+            DataFrame with cascade results (None while batches are pending)
+        """
+        journal = self.open_journal(df)
+        cascade_journal = ScreeningJournal(self.output_dir / "screening_cascade.jsonl")
+        self.cascade_model = cascade_model
+
+        # Failed tier-2 requests ('error' records) are escalated again, including
+        # errors an earlier version merged over the tier-1 result
+        rescored = self.cascade_rescored_ids(cascade_journal)
+        if 'screening_model' in df.columns:
+            cascaded = df['screening_model'] == cascade_model
+            merged_errors = cascaded & (df['decision'] == 'error')
+        else:
+            cascaded = merged_errors = pd.Series(False, index=df.index)
+        tier1 = df[(((df['decision'] == 'human-review') & ~cascaded) | merged_errors)
+                   & ~df['paper_id'].isin(rescored)]
+        print("\n" + "="*60)
+        print(f"🪜 CASCADE: re-scoring the human-review band with {cascade_model}")
+        print("="*60)
+        print(f"   Papers in human-review band: {len(tier1)} of {len(df)} "
+              f"({len(rescored)} re-scored in earlier runs)")
+
+        if len(tier1) > 0:
+            if self.governor is None:
+                self.governor = BudgetGovernor(price_multiplier=self.price_multiplier)
+            self.governor.total_papers += len(tier1)
+            self.model = cascade_model
+            try:
+                if mode == 'batch':
+                    done = self.screen_papers_batch(tier1, cascade_journal, wait=wait, poll_interval=poll_interval,
+                                                    state_name="screening_cascade_batches.json")
+                    if not done:
+                        print(f"\n⏸️  Cascade batches submitted. Re-run the same command to collect results.")
+                        return None
+                else:
+                    self.run_engine(tier1, cascade_journal, mode=mode, total=len(tier1), batch_size=batch_size,
+                                    max_workers=max_workers, max_concurrency=max_concurrency)
+            finally:
+                self.model = SCREENING_MODEL
+
+        # Replace tier-1 results in the main journal (idempotent: skips papers already merged).
+        # Errors are not merged: the tier-1 result stays and the next run retries the paper.
+        tier1_by_id = df.set_index('paper_id')
+        merged = set(df['paper_id'][cascaded & ~merged_errors])
+        records = []
+        failed = 0
+        for record in cascade_journal.read(cascade_journal.done_ids()):
+            paper_id = record['paper_id']
+            if record.get('decision') == 'error':
+                failed += 1
+                continue
+            if paper_id in merged or paper_id not in tier1_by_id.index:
+                continue
+            tier1_row = tier1_by_id.loc[paper_id]
+            if tier1_row.get('screening_model') == cascade_model:
+                tier1_score, tier1_decision = tier1_row['tier1_total_score'], tier1_row['tier1_decision']
+            else:
+                tier1_score, tier1_decision = tier1_row['total_score'], tier1_row['decision']
+            records.append(dict(record,
+                                screening_model=cascade_model,
+                                tier1_total_score=tier1_score,
+                                tier1_decision=tier1_decision))
+        journal.append(records)
+        self.cascade_papers = len(cascade_journal) - failed
+        if failed:
+            print(f"   ❌ {failed} cascade requests failed - tier-1 results kept, re-run to retry them")
+
+        df = self.load_results(df, journal)
+        self.report_cascade_agreement(df, cascade_model)
+        return df
+
+    @staticmethod
+    def cascade_rescored_ids(cascade_journal: ScreeningJournal) -> set:
+        """Papers with a successful (non-error) latest result in the cascade journal"""
+        return {record['paper_id'] for record in cascade_journal.read(cascade_journal.done_ids())
+                if record.get('decision') != 'error'}
+
+    def report_cascade_agreement(self, df: pd.DataFrame, cascade_model: str):
+        """Print and save tier-1 vs tier-2 agreement on the cascaded papers"""
+        if 'screening_model' not in df.columns:
+            return
+        cascaded = df[df['screening_model'] == cascade_model]
+        if len(cascaded) == 0:
+            return
+
+        tier1 = cascaded['tier1_total_score'].astype(float)
+        tier2 = cascaded['total_score'].astype(float)
+        difference = (tier2 - tier1).abs()
+        decisions = cascaded['decision'].value_counts()
+        stats = {
+            'cascade_model': cascade_model,
+            'papers': int(len(cascaded)),
+            'resolved_include': int(decisions.get('auto-include', 0)),
+            'resolved_exclude': int(decisions.get('auto-exclude', 0)),
+            'still_human_review': int(decisions.get('human-review', 0)),
+            'errors': int(decisions.get('error', 0)),
+            'decision_agreement': float((cascaded['decision'] == cascaded['tier1_decision']).mean()),
+            'mean_abs_score_difference': float(difference.mean()),
+            'within_5_points': float((difference <= 5).mean()),
+            'score_correlation': float(tier1.corr(tier2)) if len(cascaded) > 2 else None,
+            'mean_score_shift': float((tier2 - tier1).mean()),
+        }
+        stats_file = self.output_dir / "cascade_stats.json"
+        with open(stats_file, 'w') as f:
+            json.dump(stats, f, indent=2)
+
+        print(f"\n📐 Cascade agreement ({stats['papers']} papers):")
+        print(f"   Resolved by {cascade_model}: {stats['resolved_include']} include, "
+              f"{stats['resolved_exclude']} exclude, {stats['still_human_review']} still human review")
+        print(f"   Same decision as tier 1: {stats['decision_agreement']:.1%} | "
+              f"mean |Δscore| {stats['mean_abs_score_difference']:.1f} | "
+              f"within 5 points {stats['within_5_points']:.1%} | mean shift {stats['mean_score_shift']:+.1f}")
+        print(f"   💾 Cascade statistics: {stats_file}")
+
     def save_results(self, df: pd.DataFrame):
         """
         Save screening results with AI-PRISMA 3-zone separation
@@ -533,19 +1954,36 @@ Abstract: {abstract}"""
         print("📊 AI-PRISMA SCREENING RESULTS")
         print("="*60)
 
+        # One pass: decisions under the current thresholds, then zone row positions
+        decisions = self.assign_decisions(df)
+        changed = int((decisions != df['decision'].to_numpy(dtype=object)).sum())
+        df = df.assign(decision=decisions)
+        zone_codes = pd.Index(list(ZONE_FILES)).get_indexer(decisions)
+        order = np.argsort(zone_codes, kind='stable')
+        bounds = np.searchsorted(zone_codes[order], np.arange(len(ZONE_FILES) + 1))
+        zone_rows = {decision: order[bounds[i]:bounds[i + 1]] for i, decision in enumerate(ZONE_FILES)}
+
         # Calculate statistics by decision
         total = len(df)
-        auto_included = (df['decision'] == 'auto-include').sum()
-        auto_excluded = (df['decision'] == 'auto-exclude').sum()
-        human_review = (df['decision'] == 'human-review').sum()
-        errors = (df['decision'] == 'error').sum()
+        auto_included = len(zone_rows['auto-include'])
+        auto_excluded = len(zone_rows['auto-exclude'])
+        human_review = len(zone_rows['human-review'])
+        errors = total - int(bounds[-1] - bounds[0])
 
         print(f"\nTotal papers: {total}")
+        if self.prefilter_excluded > 0:
+            print(f"🔎 Excluded by keyword pre-filter before AI screening: {self.prefilter_excluded} (prefilter_excluded.csv)")
+        if self.early_stopped > 0:
+            print(f"⏹️  Not screened (early stop at recall target): {self.early_stopped} (early_stopped.csv)")
+        if self.budget_unscreened > 0:
+            print(f"🛑 Not screened yet (budget cap, pending next run): {self.budget_unscreened}")
         print(f"✅ Auto-include (score ≥ {self.score_threshold_include}): {auto_included} ({auto_included/total*100:.1f}%)")
         print(f"⛔ Auto-exclude (score < {self.score_threshold_exclude}): {auto_excluded} ({auto_excluded/total*100:.1f}%)")
         print(f"⚠️  Human review required ({self.score_threshold_exclude} ≤ score < {self.score_threshold_include}): {human_review} ({human_review/total*100:.1f}%)")
         if errors > 0:
             print(f"❌ Errors: {errors} ({errors/total*100:.1f}%)")
+        if changed > 0:
+            print(f"🔁 Decisions updated to the current thresholds: {changed}")
 
         # Score distribution
         print(f"\nTotal Score Distribution:")
@@ -557,11 +1995,13 @@ Abstract: {abstract}"""
         print(f"\n💰 TOKEN USAGE & COST (v1.2.5.2)")
         print("="*60)
 
-        # Pricing (Haiku-4-5 as of Nov 2025)
-        price_input = 0.80  # per MTok
-        price_output = 4.00  # per MTok
-        price_cache_write = 1.00  # per MTok (same as input)
-        price_cache_read = 0.08  # per MTok (90% discount)
+        # Pricing (Haiku-4-5, PRICES; batch mode is billed at 50%)
+        price_input = PRICES['input'] * self.price_multiplier
+        price_output = PRICES['output'] * self.price_multiplier
+        price_cache_write = PRICES['cache_write'] * self.price_multiplier
+        price_cache_read = PRICES['cache_read'] * self.price_multiplier
+        if self.price_multiplier != 1.0:
+            print(f"\n📦 Message Batches pricing: {self.price_multiplier:.0%} of standard rates")
 
         # Calculate costs
         cost_input = (self.total_input_tokens / 1_000_000) * price_input
@@ -571,6 +2011,14 @@ Abstract: {abstract}"""
 
         total_cost = cost_input + cost_output + cost_cache_write + cost_cache_read
 
+        # Second-tier model of the cascade, priced separately
+        cascade_cost = 0.0
+        if self.cascade_model is not None and any(self.cascade_usage.values()):
+            cascade_cost = usage_cost(
+                self.cascade_usage['input'], self.cascade_usage['output'], self.cascade_usage['cache_write'],
+                self.cascade_usage['cache_read'], self.price_multiplier, model_prices(self.cascade_model)
+            )
+
         print(f"\nToken Usage:")
         print(f"  Input tokens: {self.total_input_tokens:,} (${cost_input:.2f})")
         print(f"  Output tokens: {self.total_output_tokens:,} (${cost_output:.2f})")
@@ -579,42 +2027,66 @@ Abstract: {abstract}"""
         if self.total_cache_read_tokens > 0:
             print(f"  Cache reads: {self.total_cache_read_tokens:,} (${cost_cache_read:.2f})")
 
+        if cascade_cost > 0:
+            print(f"  Cascade tier ({self.cascade_model}): {self.cascade_usage['input']:,} input / "
+                  f"{self.cascade_usage['output']:,} output / {self.cascade_usage['cache_read']:,} cache-read tokens "
+                  f"(${cascade_cost:.2f}) for {self.cascade_papers:,} human-review papers")
+            total_cost += cascade_cost
+
+        if self.packed_papers > 0 or self.pack_fallbacks > 0:
+            print(f"  Packed screening: {self.packed_papers:,} papers in multi-paper requests"
+                  f" ({self.pack_fallbacks} papers fell back to per-paper calls)")
+        if self.cache is not None and self.cache.hits > 0:
+            print(f"  Result cache: {self.cache.hits:,} papers reused (no API call)")
+        if self.repaired_responses > 0 or self.followup_requests > 0:
+            print(f"  Response repair: {self.repaired_responses:,} responses fixed locally, "
+                  f"{self.followup_requests:,} follow-ups for missing fields")
+        if self.abstract_duplicates > 0:
+            screened = self.governor.papers if self.governor is not None else 0
+            saved = total_cost / screened * self.abstract_duplicates if screened > 0 else 0.0
+            print(f"  Shared abstracts: {self.abstract_duplicates:,} papers reused an identical abstract's result"
+                  f" (no API call, ~${saved:.2f} saved)")
+
         print(f"\nTotal Cost: ${total_cost:.2f}")
         print(f"Cost per paper: ${total_cost/total:.4f}")
 
         # Cache efficiency
-        if self.total_cache_read_tokens > 0:
-            cache_hit_rate = self.total_cache_read_tokens / (self.total_cache_read_tokens + self.total_input_tokens) * 100
+        if self.governor is not None and not self.governor.cacheable:
+            minimum = MIN_CACHEABLE_TOKENS.get(self.model, 1024)
+            print(f"\nCache Efficiency:")
+            print(f"  Cache hit rate: not cacheable (~{self.cached_prefix_tokens():,} token prefix, "
+                  f"{self.model} caches from {minimum:,})")
+        elif self.total_cache_read_tokens > 0:
+            hit_rate = cache_hit_rate(self.total_input_tokens, self.total_cache_creation_tokens,
+                                      self.total_cache_read_tokens)
             savings = (self.total_cache_read_tokens / 1_000_000) * (price_input - price_cache_read)
             print(f"\nCache Efficiency:")
-            print(f"  Cache hit rate: {cache_hit_rate:.1f}%")
+            print(f"  Cache hit rate: {hit_rate:.1%} of input tokens read from cache")
             print(f"  Savings from caching: ${savings:.2f}")
+            if self.governor is not None:
+                per_minute = self.governor.cache_hit_rates()
+                if len(per_minute) > 1:
+                    rates = ' '.join(f"{rate:.0%}" if rate is not None else '-' for rate in per_minute[:30])
+                    more = f" (+{len(per_minute) - 30} min)" if len(per_minute) > 30 else ""
+                    print(f"  Per minute: {rates}{more}")
 
         print("="*60)
 
-        # Save by decision type (3-Zone Model)
+        # Save by decision type (3-Zone Model): Zone 2 auto-include / auto-exclude
+        # (high confidence), Zone 3 human review queue (medium confidence)
+        df_auto_include = df.iloc[zone_rows['auto-include']]
+        df_auto_exclude = df.iloc[zone_rows['auto-exclude']]
+        df_human_review = df.iloc[zone_rows['human-review']]
 
-        # Zone 2: Auto-include (high confidence)
-        df_auto_include = df[df['decision'] == 'auto-include'].copy()
-        auto_include_file = self.output_dir / "auto_included.csv"
-        df_auto_include.to_csv(auto_include_file, index=False)
+        auto_include_file = write_table(df_auto_include, self.output_dir / "auto_included", self.output_format)
         print(f"\n💾 Auto-included papers: {auto_include_file}")
-
-        # Zone 2: Auto-exclude (high confidence)
-        df_auto_exclude = df[df['decision'] == 'auto-exclude'].copy()
-        auto_exclude_file = self.output_dir / "auto_excluded.csv"
-        df_auto_exclude.to_csv(auto_exclude_file, index=False)
+        auto_exclude_file = write_table(df_auto_exclude, self.output_dir / "auto_excluded", self.output_format)
         print(f"💾 Auto-excluded papers: {auto_exclude_file}")
-
-        # Zone 3: Human review queue (medium confidence)
-        df_human_review = df[df['decision'] == 'human-review'].copy()
-        human_review_file = self.output_dir / "human_review_queue.csv"
-        df_human_review.to_csv(human_review_file, index=False)
+        human_review_file = write_table(df_human_review, self.output_dir / "human_review_queue", self.output_format)
         print(f"💾 Human review queue: {human_review_file}")
 
         # Save all with full details
-        all_file = self.output_dir / "all_screened_papers.csv"
-        df.to_csv(all_file, index=False)
+        all_file = write_table(df, self.output_dir / "all_screened_papers", self.output_format)
         print(f"💾 All papers with AI-PRISMA scores: {all_file}")
 
         print("="*60)
@@ -675,13 +2147,117 @@ def main():
         '--batch-size',
         type=int,
         default=50,
-        help='Save progress every N papers (default: 50)'
+        help='Report saved progress every N papers (default: 50; every result is journaled as it completes)'
     )
     parser.add_argument(
         '--max-workers',
         type=int,
         default=8,
-        help='Number of parallel workers (default: 8, max: 10)'
+        help='Sync mode: number of parallel workers (default: 8, max: 10)'
+    )
+    parser.add_argument(
+        '--mode',
+        choices=['async', 'sync', 'batch'],
+        default='async',
+        help='async: asyncio engine; sync: thread pool; batch: Message Batches API, 50%% cheaper (default: async)'
+    )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f'Async mode: maximum concurrent API requests (default: {DEFAULT_MAX_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--pack-size',
+        type=int,
+        default=1,
+        help='Async/sync mode: screen up to N papers per request, adapted to abstract length (default: 1)'
+    )
+    parser.add_argument(
+        '--prioritize',
+        action='store_true',
+        help='Screen most-likely-relevant papers first, re-ranking after each round from the AI scores'
+    )
+    parser.add_argument(
+        '--stop-at-recall',
+        type=float,
+        help='Stop once estimated recall of relevant papers reaches this target, e.g. 0.95 (implies --prioritize)'
+    )
+    parser.add_argument(
+        '--round-size',
+        type=int,
+        default=200,
+        help='Prioritized mode: papers screened between re-rankings (default: 200)'
+    )
+    parser.add_argument(
+        '--prefilter',
+        action='store_true',
+        help='Auto-exclude clearly off-topic papers with a local BM25 keyword filter before AI screening '
+             '(also enabled by ai_prisma_rubric.prefilter.enabled in config.yaml)'
+    )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Compact output: forced tool call with integer scores, short reasoning and evidence '
+             'sentence numbers instead of quotes (fewer output tokens; single-paper requests)'
+    )
+    parser.add_argument(
+        '--service',
+        help='Send API requests through a shared screening service (03c_screening_service.py), '
+             'e.g. http://127.0.0.1:8790'
+    )
+    parser.add_argument(
+        '--output-format',
+        choices=TABLE_FORMATS,
+        help='Zone file format: csv (default) or columnar parquet (also ai_prisma_rubric.output_format)'
+    )
+    parser.add_argument(
+        '--warm-cache',
+        action='store_true',
+        help='Put the question and criteria in the cached prompt prefix and prime the cache '
+             'before fanning out (also ai_prisma_rubric.cache.warm). Turned off with a warning when '
+             'the prefix is shorter than the model caches (claude-haiku-4-5: 4,096 tokens)'
+    )
+    parser.add_argument(
+        '--cascade-model',
+        help='Two-tier cascade: re-score the human-review band with this stronger model '
+             '(e.g. claude-sonnet-4-5; also ai_prisma_rubric.cascade.model in config.yaml)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the machine-wide screening result cache'
+    )
+    parser.add_argument(
+        '--cache-path',
+        help='Screening result cache file (default: $SCHOLARAG_CACHE_DIR or ~/.cache/scholarag)'
+    )
+    parser.add_argument(
+        '--no-wait',
+        action='store_true',
+        help='Batch mode: submit batches and exit; re-run later to collect results'
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=60.0,
+        help='Batch mode: seconds between batch status polls (default: 60)'
+    )
+    parser.add_argument(
+        '--max-cost',
+        type=float,
+        help='Hard spend cap in dollars: no new requests once reached; re-run to continue'
+    )
+    parser.add_argument(
+        '--max-cost-per-hour',
+        type=float,
+        help='Throttle requests to stay under this spend rate ($/hour)'
+    )
+    parser.add_argument(
+        '--metrics-interval',
+        type=float,
+        default=10.0,
+        help='Seconds between live cost/throughput lines in screening_metrics.jsonl (default: 10)'
     )
 
     args = parser.parse_args()
@@ -693,13 +2269,53 @@ def main():
         sys.exit(1)
 
     # Initialize screener
-    screener = PaperScreener(args.project, args.question)
+    screener = PaperScreener(args.project, args.question,
+                             use_cache=not args.no_cache, cache_path=args.cache_path,
+                             pack_size=args.pack_size, compact=args.compact, service_url=args.service,
+                             output_format=args.output_format, warm_cache=args.warm_cache)
 
     # Load papers
     df = screener.load_papers()
 
+    # Optional local pre-filter (no API calls)
+    prefilter_settings = screener.config.get('ai_prisma_rubric', {}).get('prefilter', {}) or {}
+    if args.prefilter or prefilter_settings.get('enabled', False):
+        df = screener.prefilter_papers(df)
+
     # Screen papers with parallel processing
-    df = screener.screen_all_papers(df, batch_size=args.batch_size, max_workers=args.max_workers)
+    df = screener.screen_all_papers(
+        df,
+        batch_size=args.batch_size,
+        max_workers=args.max_workers,
+        mode=args.mode,
+        wait=not args.no_wait,
+        poll_interval=args.poll_interval,
+        max_concurrency=args.max_concurrency,
+        prioritize=args.prioritize,
+        recall_target=args.stop_at_recall,
+        round_size=args.round_size,
+        max_cost=args.max_cost,
+        max_cost_per_hour=args.max_cost_per_hour,
+        metrics_interval=args.metrics_interval
+    )
+    if df is None:
+        # Batches still processing (--no-wait)
+        return
+
+    # Optional second tier for the human-review band
+    cascade_model = args.cascade_model or screener.config.get('ai_prisma_rubric', {}).get('cascade', {}).get('model')
+    if cascade_model:
+        df = screener.cascade_screen(
+            df, cascade_model,
+            mode=args.mode,
+            batch_size=args.batch_size,
+            max_workers=args.max_workers,
+            max_concurrency=args.max_concurrency,
+            wait=not args.no_wait,
+            poll_interval=args.poll_interval
+        )
+        if df is None:
+            return
 
     # Save results
     screener.save_results(df)
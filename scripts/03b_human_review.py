@@ -9,17 +9,34 @@ This implements human review for papers that fall between auto-include
 and auto-exclude thresholds based on total_score from 6-dimension rubric.
 
 Usage:
-    python scripts/03b_human_review.py --project <project_path>
+    python scripts/03b_human_review.py --project <project_path> [--reviewer <name>] [--dual-review]
+    python scripts/03b_human_review.py --project <project_path> --status
+    python scripts/03b_human_review.py --project <project_path> --export
 
 Example:
     python scripts/03b_human_review.py --project projects/2025-10-13_AI-Chatbots
 
+    # Two reviewers at the same time, every paper screened by both
+    python scripts/03b_human_review.py --project projects/2025-10-13_AI-Chatbots --reviewer alice --dual-review
+    python scripts/03b_human_review.py --project projects/2025-10-13_AI-Chatbots --reviewer bob --dual-review
+
 Features:
     - Interactive terminal interface for reviewing borderline papers
     - Display AI scores + reasoning + evidence quotes
     - Collect human decisions (include/exclude + reason)
-    - Resume functionality (tracks progress)
+    - Resume functionality (every decision is committed to a SQLite store)
+    - Parallel reviewers: each session claims disjoint batches from a shared queue
+    - Dual review: two independent decisions per paper, ties go to a third reviewer
     - Export results to CSV for Cohen's Kappa validation
+
+Decisions are stored in data/02_screening/human_review.sqlite3, one row per
+paper and reviewer, so recording a decision costs the same on paper 5 and
+paper 5000. Concurrent sessions share this database: papers are claimed in
+batches (--batch-size) with an atomic claim, and a session that dies gives
+its claims back after --claim-minutes. human_review_decisions.csv holds one
+merged row per paper (majority decision) and is exported from the store when
+a session ends (or with --export); human_review_by_reviewer.csv keeps every
+reviewer's decision for inter-rater agreement.
 """
 
 import pandas as pd
@@ -27,22 +44,41 @@ import argparse
 from pathlib import Path
 import sys
 import os
+import getpass
 from datetime import datetime
-import json
+from typing import Optional
+
+from core.identifiers import review_paper_ids, title_year_ids
+from core.review_store import DEFAULT_CLAIM_SECONDS, ReviewStore
+from core.tables import read_table, table_path
 
 
 class HumanReviewer:
     """Interactive human review interface for borderline papers"""
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, reviewer: str = None, dual_review: bool = False,
+                 batch_size: int = 10, claim_seconds: float = DEFAULT_CLAIM_SECONDS):
+        """
+        Args:
+            project_path: Project directory
+            reviewer: Reviewer name (default: login name)
+            dual_review: Require two independent decisions per paper
+            batch_size: Papers claimed from the shared queue at a time
+            claim_seconds: How long claimed papers stay reserved without activity
+        """
         self.project_path = Path(project_path)
+        self.reviewer = reviewer or getpass.getuser()
+        self.reviews_needed = 2 if dual_review else 1
+        self.batch_size = batch_size
+        self.claim_seconds = claim_seconds
         self.input_dir = self.project_path / "data" / "02_screening"
         self.review_file = self.input_dir / "human_review_queue.csv"
-        self.progress_file = self.input_dir / "human_review_progress.json"
+        self.store_file = self.input_dir / "human_review.sqlite3"
         self.output_file = self.input_dir / "human_review_decisions.csv"
+        self.by_reviewer_file = self.input_dir / "human_review_by_reviewer.csv"
 
-        # Validate files exist
-        if not self.review_file.exists():
+        # Validate files exist (CSV or Parquet, see --output-format of 03_screen_papers.py)
+        if table_path(self.review_file) is None:
             print("❌ Error: Human review queue not found")
             print(f"   Expected: {self.review_file}")
             print("   Run screening first: python scripts/03_screen_papers.py")
@@ -50,28 +86,45 @@ class HumanReviewer:
 
     def load_papers(self) -> pd.DataFrame:
         """Load papers requiring human review"""
-        df = pd.read_csv(self.review_file)
+        df = read_table(self.review_file)
         print(f"\n📋 Human Review Queue: {len(df)} papers requiring expert validation")
         print("="*70)
         return df
 
-    def load_progress(self) -> dict:
-        """Load review progress if exists"""
-        if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                progress = json.load(f)
-            print(f"\n✓ Found existing progress: {progress['reviewed_count']}/{progress['total_count']} papers reviewed")
-
-            resume = input("Resume from last session? (y/n): ").lower()
-            if resume == 'y':
-                return progress
-
-        return {'reviewed_papers': [], 'reviewed_count': 0, 'total_count': 0}
-
-    def save_progress(self, progress: dict):
-        """Save current review progress"""
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
+    def open_store(self, df: Optional[pd.DataFrame] = None) -> ReviewStore:
+        """
+        Open the review store
+
+        Decisions from an earlier CSV-only session are imported once, and
+        decisions keyed by title_year (before the queue carried paper_id)
+        are renamed to the queue's paper_id.
+
+        Args:
+            df: Review queue (only its key columns are read if None)
+        """
+        store = ReviewStore(self.store_file)
+        if len(store) == 0 and self.output_file.exists():
+            imported = store.import_records(pd.read_csv(self.output_file))
+            print(f"   Imported {imported} previous decisions from {self.output_file.name}")
+        if df is None:
+            df = read_table(self.review_file, columns=['paper_id', 'title', 'year'])
+        if 'paper_id' in df.columns:
+            renamed = store.rekey(dict(zip(title_year_ids(df), review_paper_ids(df))))
+            if renamed:
+                print(f"   Re-keyed {renamed} previous decisions by paper_id")
+        return store
+
+    def print_status(self, store: ReviewStore):
+        """Print shared queue progress and what each reviewer has done"""
+        status = store.status()
+        queued = max(status['queued'], 1)
+        print(f"\n👥 Review queue: {status['completed']}/{status['queued']} papers complete "
+              f"({status['completed']/queued*100:.1f}%)")
+        if status['awaiting_tie_break']:
+            print(f"   ⚖️  {status['awaiting_tie_break']} split decisions waiting for a tie-breaking review")
+        for reviewer, counts in status['reviewers'].items():
+            name = reviewer or '(single-reviewer sessions)'
+            print(f"   ├─ {name}: {counts['decisions']} decisions, {counts['claimed']} papers claimed")
 
     def display_paper(self, row: pd.Series, idx: int, total: int):
         """Display paper information for review"""
@@ -194,154 +247,203 @@ class HumanReviewer:
     def review_papers(self):
         """Main review loop"""
 
-        # Load papers and progress
+        # Load papers and join the shared queue
         df = self.load_papers()
-        progress = self.load_progress()
+        store = self.open_store(df)
+        store.enqueue(review_paper_ids(df), self.reviews_needed)
 
-        # Track which papers have been reviewed
-        reviewed_papers = set(progress.get('reviewed_papers', []))
-        results = []
+        print(f"\n🎯 Starting review session as '{self.reviewer}'")
+        if self.reviews_needed > 1:
+            print(f"   Dual review: {self.reviews_needed} independent decisions per paper")
+        self.print_status(store)
 
-        # Load existing decisions if resuming
-        if self.output_file.exists():
-            existing_results = pd.read_csv(self.output_file)
-            results = existing_results.to_dict('records')
-            print(f"   Loaded {len(results)} previous decisions")
-
-        print(f"\n🎯 Starting review session")
-        print(f"   Papers to review: {len(df) - len(reviewed_papers)}")
-        print(f"   Progress: {len(reviewed_papers)}/{len(df)} ({len(reviewed_papers)/len(df)*100:.1f}%)")
+        session_start = datetime.now().isoformat()
 
+        try:
+            self.review_loop(df, store)
+        except KeyboardInterrupt:
+            print("\n\n⚠️  Review interrupted. All recorded decisions are saved.")
+        finally:
+            store.release(self.reviewer)
+
+        # Export all decisions (all reviewers, all sessions) for validation
+        self.save_results(store)
+        df_decisions = store.decisions()
+        session_count = 0
+        if not df_decisions.empty:
+            mine = df_decisions[df_decisions['reviewer'] == self.reviewer]
+            session_count = int((mine['reviewed_at'] >= session_start).sum())
+        self.display_summary(store.merged_decisions(df_decisions), df, session_count, len(store.incomplete_ids()))
+        self.print_status(store)
+        store.close()
+
+    def review_loop(self, df: pd.DataFrame, store: ReviewStore) -> int:
+        """
+        Review papers claimed from the shared queue until none are left for this reviewer
+
+        Args:
+            df: Review queue
+            store: Review store
+
+        Returns:
+            Number of papers decided in this session
+        """
         papers_reviewed_this_session = 0
+        positions = {paper_id: i for i, paper_id in enumerate(review_paper_ids(df))}
+        skipped = set()
 
-        # Review each paper
-        for idx, row in df.iterrows():
-            # Skip already reviewed papers
-            paper_id = f"{row['title']}_{row.get('year', 'unknown')}"
-            if paper_id in reviewed_papers:
-                continue
-
-            # Display paper
-            self.display_paper(row, idx, len(df))
-
-            # Get human decision
-            while True:
-                decision_result = self.get_human_decision(idx, len(df))
-
-                if decision_result['action'] == 'view':
-                    self.display_paper(row, idx, len(df))
-                    continue
-                elif decision_result['action'] == 'skip':
-                    print("⏭️  Skipped - will review later")
-                    break
-                elif decision_result['action'] == 'quit':
-                    print("\n⚠️  Review interrupted. Progress saved.")
-                    self.save_results(results)
-                    self.save_progress({
-                        'reviewed_papers': list(reviewed_papers),
-                        'reviewed_count': len(reviewed_papers),
-                        'total_count': len(df),
-                        'last_updated': datetime.now().isoformat()
-                    })
-                    return
-                elif decision_result['action'] == 'decide':
-                    # Record decision
-                    result = {
-                        'paper_id': paper_id,
-                        'title': row['title'],
-                        'authors': row.get('authors', 'N/A'),
-                        'year': row.get('year', 'N/A'),
-                        'doi': row.get('doi', 'N/A'),
-                        'ai_decision': row['decision'],
-                        'ai_total_score': row['total_score'],
-                        'ai_domain': row.get('domain_score', 0),
-                        'ai_intervention': row.get('intervention_score', 0),
-                        'ai_method': row.get('method_score', 0),
-                        'ai_outcomes': row.get('outcomes_score', 0),
-                        'ai_exclusion': row.get('exclusion_score', 0),
-                        'ai_title_bonus': row.get('title_bonus', 0),
-                        'ai_reasoning': row.get('reasoning', ''),
-                        'human_decision': decision_result['decision'],
-                        'human_total_score': decision_result['total_score'],
-                        'human_domain': decision_result['scores']['domain'],
-                        'human_intervention': decision_result['scores']['intervention'],
-                        'human_method': decision_result['scores']['method'],
-                        'human_outcomes': decision_result['scores']['outcomes'],
-                        'human_exclusion': decision_result['scores']['exclusion'],
-                        'human_title_bonus': decision_result['scores']['title_bonus'],
-                        'human_reasoning': decision_result['reasoning'],
-                        'score_difference': abs(decision_result['total_score'] - row['total_score']),
-                        'agreement': (decision_result['decision'] == 'include' and
-                                    row['decision'] == 'auto-include') or \
-                                   (decision_result['decision'] == 'exclude' and
-                                    row['decision'] == 'auto-exclude'),
-                        'reviewed_at': datetime.now().isoformat()
-                    }
-
-                    results.append(result)
-                    reviewed_papers.add(paper_id)
+        while True:
+            # Skipped papers stay claimed until the session ends, so each claim brings new ones
+            claimed = store.claim(self.reviewer, self.batch_size, self.claim_seconds)
+            batch = [paper_id for paper_id in claimed if paper_id not in skipped]
+            skipped.update(paper_id for paper_id in batch if paper_id not in positions)
+            batch = [paper_id for paper_id in batch if paper_id in positions]
+            if not batch:
+                return papers_reviewed_this_session
+
+            for paper_id in batch:
+                idx = positions[paper_id]
+                row = df.iloc[idx]
+                if self.review_paper(store, paper_id, row, idx, len(df), skipped):
                     papers_reviewed_this_session += 1
+                elif paper_id not in skipped:
+                    return papers_reviewed_this_session
+
+    def review_paper(self, store: ReviewStore, paper_id: str, row: pd.Series, idx: int, total: int,
+                     skipped: set) -> bool:
+        """
+        Show one paper and record the reviewer's decision
+
+        Args:
+            store: Review store
+            paper_id: Paper key
+            row: Paper row from the review queue
+            idx: Position in the queue
+            total: Queue length
+            skipped: Papers skipped in this session (updated)
+
+        Returns:
+            True if a decision was recorded (False on skip or quit)
+        """
+        # Display paper
+        self.display_paper(row, idx, total)
+
+        # Get human decision
+        while True:
+            decision_result = self.get_human_decision(idx, total)
 
-                    print(f"✓ Recorded: {decision_result['decision'].upper()} (score: {decision_result['total_score']})")
-
-                    # Save progress periodically (every 5 papers)
-                    if papers_reviewed_this_session % 5 == 0:
-                        self.save_results(results)
-                        self.save_progress({
-                            'reviewed_papers': list(reviewed_papers),
-                            'reviewed_count': len(reviewed_papers),
-                            'total_count': len(df),
-                            'last_updated': datetime.now().isoformat()
-                        })
-                        print(f"\n💾 Progress saved ({len(reviewed_papers)}/{len(df)})")
-
-                    break
-
-        # Save final results
-        self.save_results(results)
-        self.save_progress({
-            'reviewed_papers': list(reviewed_papers),
-            'reviewed_count': len(reviewed_papers),
-            'total_count': len(df),
-            'last_updated': datetime.now().isoformat(),
-            'completed': len(reviewed_papers) == len(df)
-        })
-
-        # Display summary
-        self.display_summary(results, df)
-
-    def save_results(self, results: list):
-        """Save review results to CSV"""
-        if not results:
-            return
-
-        df_results = pd.DataFrame(results)
-        df_results.to_csv(self.output_file, index=False)
-        print(f"\n💾 Saved {len(results)} decisions to: {self.output_file}")
-
-    def display_summary(self, results: list, df_original: pd.DataFrame):
-        """Display review session summary"""
-
-        if not results:
+            if decision_result['action'] == 'view':
+                self.display_paper(row, idx, total)
+                continue
+            elif decision_result['action'] == 'skip':
+                print("⏭️  Skipped - will review later")
+                skipped.add(paper_id)
+                return False
+            elif decision_result['action'] == 'quit':
+                print("\n⚠️  Review interrupted. Progress saved.")
+                return False
+            elif decision_result['action'] == 'decide':
+                # Record decision
+                result = {
+                    'paper_id': paper_id,
+                    'title': row['title'],
+                    'authors': row.get('authors', 'N/A'),
+                    'year': row.get('year', 'N/A'),
+                    'doi': row.get('doi', 'N/A'),
+                    'ai_decision': row['decision'],
+                    'ai_total_score': row['total_score'],
+                    'ai_domain': row.get('domain_score', 0),
+                    'ai_intervention': row.get('intervention_score', 0),
+                    'ai_method': row.get('method_score', 0),
+                    'ai_outcomes': row.get('outcomes_score', 0),
+                    'ai_exclusion': row.get('exclusion_score', 0),
+                    'ai_title_bonus': row.get('title_bonus', 0),
+                    'ai_reasoning': row.get('reasoning', ''),
+                    'human_decision': decision_result['decision'],
+                    'human_total_score': decision_result['total_score'],
+                    'human_domain': decision_result['scores']['domain'],
+                    'human_intervention': decision_result['scores']['intervention'],
+                    'human_method': decision_result['scores']['method'],
+                    'human_outcomes': decision_result['scores']['outcomes'],
+                    'human_exclusion': decision_result['scores']['exclusion'],
+                    'human_title_bonus': decision_result['scores']['title_bonus'],
+                    'human_reasoning': decision_result['reasoning'],
+                    'score_difference': abs(decision_result['total_score'] - row['total_score']),
+                    'agreement': (decision_result['decision'] == 'include' and
+                                row['decision'] == 'auto-include') or \
+                               (decision_result['decision'] == 'exclude' and
+                                row['decision'] == 'auto-exclude'),
+                    'reviewed_at': datetime.now().isoformat()
+                }
+
+                # Committed immediately: one row, independent of queue size
+                store.record(paper_id, self.reviewer, result, self.claim_seconds)
+
+                print(f"✓ Recorded: {decision_result['decision'].upper()} (score: {decision_result['total_score']})")
+
+                return True
+
+    def save_results(self, store: ReviewStore):
+        """Export merged and per-reviewer decisions in the store to CSV"""
+        count = store.export_csv(self.output_file, self.by_reviewer_file)
+        if count:
+            print(f"\n💾 Saved {count} decisions to: {self.output_file}")
+            print(f"   Per-reviewer decisions: {self.by_reviewer_file}")
+
+    def export(self):
+        """Export the review store to CSV without starting a session"""
+        store = self.open_store()
+        if len(store) == 0:
+            print("⚠️  No review decisions recorded yet")
+        self.save_results(store)
+        store.close()
+
+    def status(self):
+        """Show shared queue progress without starting a session"""
+        store = self.open_store()
+        self.print_status(store)
+        store.close()
+
+    def display_summary(self, df_results: pd.DataFrame, df_original: pd.DataFrame, session_count: int,
+                        awaiting: int = 0):
+        """
+        Display review summary
+
+        Args:
+            df_results: Merged decisions (one row per paper with all its reviews)
+            df_original: Review queue
+            session_count: Papers decided in this session
+            awaiting: Papers still waiting for a second or tie-breaking review
+        """
+
+        if session_count == 0:
             print("\n⚠️  No papers reviewed in this session")
+        if df_results.empty:
             return
 
-        df_results = pd.DataFrame(results)
-
         print("\n" + "="*70)
         print("📊 HUMAN REVIEW SUMMARY")
         print("="*70)
 
         print(f"\n📋 Coverage:")
         print(f"   Total papers in queue: {len(df_original)}")
-        print(f"   Reviewed this session: {len(results)}")
-        print(f"   Remaining: {len(df_original) - len(results)}")
+        print(f"   Reviewed this session: {session_count}")
+        print(f"   Decided in total (all reviewers): {len(df_results)}")
+        if awaiting:
+            print(f"   Awaiting another review (not final yet): {awaiting}")
+        print(f"   Remaining: {len(df_original) - len(df_results)}")
 
-        print(f"\n✅ Your Decisions:")
+        print(f"\n✅ Final Decisions:")
         included = (df_results['human_decision'] == 'include').sum()
         excluded = (df_results['human_decision'] == 'exclude').sum()
-        print(f"   Include: {included} ({included/len(results)*100:.1f}%)")
-        print(f"   Exclude: {excluded} ({excluded/len(results)*100:.1f}%)")
+        print(f"   Include: {included} ({included/len(df_results)*100:.1f}%)")
+        print(f"   Exclude: {excluded} ({excluded/len(df_results)*100:.1f}%)")
+
+        multi = df_results[df_results['n_reviews'] > 1] if 'n_reviews' in df_results.columns else df_results.iloc[:0]
+        if len(multi):
+            agree = int(multi['reviewers_agree'].sum())
+            print(f"\n👥 Reviewer Agreement:")
+            print(f"   {agree}/{len(multi)} multi-reviewed papers decided alike ({agree/len(multi)*100:.1f}%)")
 
         print(f"\n📊 Score Statistics:")
         print(f"   AI mean score: {df_results['ai_total_score'].mean():.1f}")
@@ -350,8 +452,8 @@ class HumanReviewer:
 
         print(f"\n🤝 Agreement with AI:")
         agreement = df_results['agreement'].sum()
-        disagreement = len(results) - agreement
-        agreement_rate = agreement / len(results) * 100
+        disagreement = len(df_results) - agreement
+        agreement_rate = agreement / len(df_results) * 100
         print(f"   Agree: {agreement} ({agreement_rate:.1f}%)")
         print(f"   Disagree: {disagreement} ({100-agreement_rate:.1f}%)")
 
@@ -369,15 +471,15 @@ class HumanReviewer:
         print(f"✨ Next Steps:")
         print(f"="*70)
 
-        if len(results) < len(df_original):
+        if len(df_results) < len(df_original):
             print(f"\n⏭️  Continue Review:")
-            print(f"   Run this script again to review remaining {len(df_original) - len(results)} papers")
+            print(f"   Run this script again to review remaining {len(df_original) - len(df_results)} papers")
         else:
             print(f"\n✅ All papers reviewed! Ready for validation.")
 
         print(f"\n📊 Calculate Cohen's Kappa:")
         print(f"   python scripts/validate_human_ai_agreement.py \\")
-        print(f"       --ai-decisions {self.input_dir / 'all_screened_papers.csv'} \\")
+        print(f"       --ai-decisions {table_path(self.input_dir / 'all_screened_papers.csv')} \\")
         print(f"       --human-decisions {self.output_file} \\")
         print(f"       --output {self.input_dir / 'kappa_report.md'}")
 
@@ -394,6 +496,37 @@ def main():
         required=True,
         help='Path to project directory'
     )
+    parser.add_argument(
+        '--export',
+        action='store_true',
+        help='Export recorded decisions to human_review_decisions.csv and exit'
+    )
+    parser.add_argument(
+        '--status',
+        action='store_true',
+        help='Show progress of all reviewers and exit'
+    )
+    parser.add_argument(
+        '--reviewer',
+        help='Reviewer name for concurrent sessions (default: login name)'
+    )
+    parser.add_argument(
+        '--dual-review',
+        action='store_true',
+        help='Require two independent decisions per paper (split decisions get a third)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=10,
+        help='Papers claimed from the shared queue at a time (default: 10)'
+    )
+    parser.add_argument(
+        '--claim-minutes',
+        type=float,
+        default=DEFAULT_CLAIM_SECONDS / 60,
+        help=f'Minutes without a decision before claimed papers return to the queue (default: {DEFAULT_CLAIM_SECONDS // 60})'
+    )
 
     args = parser.parse_args()
 
@@ -404,7 +537,16 @@ def main():
         sys.exit(1)
 
     # Initialize and run reviewer
-    reviewer = HumanReviewer(args.project)
+    reviewer = HumanReviewer(
+        args.project, reviewer=args.reviewer, dual_review=args.dual_review,
+        batch_size=args.batch_size, claim_seconds=args.claim_minutes * 60
+    )
+    if args.export:
+        reviewer.export()
+        return
+    if args.status:
+        reviewer.status()
+        return
     reviewer.review_papers()
 
     print("\n✨ Human review session complete!")
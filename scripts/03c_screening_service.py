@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Stage 3c: Shared Screening Service for Parallel Projects
+
+Long-running local service that all screening runs on this machine send
+their API requests through, so parallel projects share one rate-limit
+budget instead of each hitting 429s. Requests are scheduled round-robin
+across projects; a 429/529 pauses everyone for the retry-after time and
+is retried by the service (see core/screening_service.py).
+
+Results are written by each screening run into its own project's
+data/02_screening directory, exactly as in a stand-alone run.
+
+Usage:
+    # Start the service (keeps running)
+    python scripts/03c_screening_service.py serve [--port 8790] [--max-concurrency 32]
+
+    # Screen a project through it: either run 03 with --service ...
+    python scripts/03_screen_papers.py --project <project_path> --question <q> \\
+        --service http://127.0.0.1:8790
+
+    # ... or let the service run it as a job
+    python scripts/03c_screening_service.py submit --project <project_path> --question <q>
+    python scripts/03c_screening_service.py status
+
+Example:
+    python scripts/03c_screening_service.py serve --max-concurrency 48 --max-rpm 3000
+    python scripts/03c_screening_service.py submit \\
+        --project projects/2025-10-13_AI-Chatbots \\
+        --question "How do AI chatbots improve speaking skills in language learning?" \\
+        -- --mode async --max-cost 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from core.screening_service import ScreeningService
+
+
+DEFAULT_PORT = 8790
+
+
+def service_request(url: str, payload=None):
+    """GET (payload None) or POST JSON to the service"""
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        print(f"❌ Service error {e.code}: {e.read().decode('utf-8', 'replace')}")
+        sys.exit(1)
+    except urllib.error.URLError as e:
+        print(f"❌ Screening service not reachable at {url}: {e.reason}")
+        print(f"   Start it with: python scripts/03c_screening_service.py serve")
+        sys.exit(1)
+
+
+def serve(args: argparse.Namespace):
+    load_dotenv()
+    upstream = args.upstream or os.getenv('ANTHROPIC_BASE_URL') or 'https://api.anthropic.com'
+    service = ScreeningService(
+        args.host, args.port, upstream=upstream, max_concurrency=args.max_concurrency,
+        max_requests_per_minute=args.max_rpm, max_retries=args.max_retries
+    )
+
+    print("\n" + "="*60)
+    print("🛰️  SHARED SCREENING SERVICE")
+    print("="*60)
+    print(f"   Listening on: {service.base_url}")
+    print(f"   Upstream: {upstream}")
+    rpm = f", {args.max_rpm:g} requests/min" if args.max_rpm else ""
+    print(f"   Global budget: {args.max_concurrency} concurrent requests{rpm}")
+    print(f"\n   Screen a project through it:")
+    print(f"   python scripts/03_screen_papers.py --project <path> --question <q> --service {service.base_url}")
+    try:
+        service.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping screening service")
+        service.stop()
+
+
+def submit(args: argparse.Namespace):
+    project_path = Path(args.project)
+    if not project_path.exists():
+        print(f"❌ Error: Project path does not exist: {project_path}")
+        sys.exit(1)
+
+    extra_args = [a for a in args.screen_args if a != '--']
+    job = service_request(f"{args.url}/v1/jobs", {
+        'project': str(project_path.resolve()), 'question': args.question, 'args': extra_args,
+    })
+    print(f"✅ Submitted {job['id']} for {job['project']}")
+    print(f"   Log: {job['log']}")
+    print(f"   Results: {Path(job['project']) / 'data' / '02_screening'}")
+
+
+def status(args: argparse.Namespace):
+    stats = service_request(f"{args.url}/v1/service/stats")
+    jobs = service_request(f"{args.url}/v1/jobs")
+
+    print(f"\n🛰️  {args.url}: {stats['active']}/{stats['max_concurrency']} requests in flight")
+    for project, counters in stats['projects'].items():
+        waiting = stats['waiting'].get(project, 0)
+        print(f"   📁 {project}: {counters['requests']} requests, {counters['retried']} retried after 429/529, "
+              f"{counters['failed']} failed, {waiting} waiting")
+
+    icons = {'running': '⏳', 'finished': '✅', 'failed': '❌'}
+    for job in jobs:
+        print(f"   {icons[job['status']]} {job['id']} {job['status']}: {job['project']} "
+              f"(submitted {job['submitted_at']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Shared screening service: one API rate-limit budget for parallel projects"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='Run the service')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Bind port (default: {DEFAULT_PORT})')
+    serve_parser.add_argument(
+        '--upstream',
+        help='Anthropic API base URL (default: $ANTHROPIC_BASE_URL or https://api.anthropic.com)'
+    )
+    serve_parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=32,
+        help='Requests in flight across all projects (default: 32)'
+    )
+    serve_parser.add_argument(
+        '--max-rpm',
+        type=float,
+        help='Requests per minute across all projects (default: unlimited)'
+    )
+    serve_parser.add_argument(
+        '--max-retries',
+        type=int,
+        default=6,
+        help='Service-side retries of a 429/529 before returning it (default: 6)'
+    )
+    serve_parser.set_defaults(func=serve)
+
+    url_help = f'Service URL (default: http://127.0.0.1:{DEFAULT_PORT})'
+    submit_parser = subparsers.add_parser('submit', help='Screen a project through the service')
+    submit_parser.add_argument('--url', default=f'http://127.0.0.1:{DEFAULT_PORT}', help=url_help)
+    submit_parser.add_argument('--project', required=True, help='Path to project directory')
+    submit_parser.add_argument('--question', required=True, help='Research question for screening')
+    submit_parser.add_argument(
+        'screen_args',
+        nargs=argparse.REMAINDER,
+        help='Extra 03_screen_papers.py arguments after "--"'
+    )
+    submit_parser.set_defaults(func=submit)
+
+    status_parser = subparsers.add_parser('status', help='Show per-project counters and jobs')
+    status_parser.add_argument('--url', default=f'http://127.0.0.1:{DEFAULT_PORT}', help=url_help)
+    status_parser.set_defaults(func=status)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
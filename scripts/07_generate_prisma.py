@@ -106,6 +106,18 @@ class PRISMAGenerator:
             stats['relevant'] = stats['after_deduplication']
             stats['excluded_screening'] = 0
 
+        # Records removed by the keyword pre-filter before AI screening
+        prefilter_file = screening_dir / "prefilter_excluded.csv"
+        stats['excluded_prefilter'] = len(pd.read_csv(prefilter_file)) if prefilter_file.exists() else 0
+        if stats['excluded_prefilter'] > 0:
+            print(f"   Excluded by keyword pre-filter: {stats['excluded_prefilter']}")
+
+        # Records left unscreened by the early-stopping rule (prioritized screening)
+        early_stop_file = screening_dir / "early_stopped.csv"
+        stats['not_screened_early_stop'] = len(pd.read_csv(early_stop_file)) if early_stop_file.exists() else 0
+        if stats['not_screened_early_stop'] > 0:
+            print(f"   Not screened (early stop): {stats['not_screened_early_stop']}")
+
         # Stage 3: PDF Download
         pdf_dir = self.project_path / "data" / "03_pdfs"
         metadata_file = pdf_dir / "papers_metadata.csv"
@@ -395,6 +407,8 @@ class PRISMAGenerator:
 - Records screened: **{stats['after_deduplication']}**
 - Relevant papers: **{stats['relevant']}** ({stats['relevant']/stats['after_deduplication']*100:.1f}%)
 - Excluded papers: **{stats['excluded_screening']}** ({stats['excluded_screening']/stats['after_deduplication']*100:.1f}%)
+- Excluded by keyword pre-filter (before AI screening): **{stats['excluded_prefilter']}**
+- Not screened (stopped at estimated recall target): **{stats['not_screened_early_stop']}**
 
 ### Stage 4: Eligibility (PDF Retrieval)
 
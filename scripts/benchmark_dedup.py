@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Deduplication Benchmark with Synthetic Noisy Corpora
+
+Generates synthetic identification sets with a known duplicate structure
+and measures each PaperDeduplicator strategy on them: runtime, peak
+memory, precision and recall.
+
+Noise applied to duplicate records:
+    - Title casing (UPPER / Title Case)
+    - Punctuation changes (":" → " -", trailing period, stray commas)
+    - Subtitle truncation ("Main title: subtitle" → "Main title")
+    - Retitling (subtitle replaced, as between preprint and journal version)
+    - Abstract edits (a few words dropped)
+    - Missing DOI, DOI formatting variants (resolver prefix, upper case)
+    - arXiv version suffixes (v1, v2, ...)
+
+A small share of distinct works get generic titles ("Editorial",
+"Introduction", ...) so that false merges show up in precision.
+
+Usage:
+    python scripts/benchmark_dedup.py [--sizes 10000 100000 1000000]
+
+Example:
+    python scripts/benchmark_dedup.py \\
+        --sizes 10000 100000 \\
+        --duplicate-rate 0.3 \\
+        --strategies doi arxiv title full abstract streaming \\
+        --output bench_dedup.csv
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+SCRIPTS_DIR = Path(__file__).parent
+
+VOCABULARY = (
+    "learning language students artificial intelligence chatbot speaking "
+    "proficiency assessment feedback writing classroom teacher online "
+    "digital technology mobile adaptive model neural network deep "
+    "reinforcement analysis study effects impact evaluation approach "
+    "framework system design development performance education higher "
+    "secondary primary university outcomes motivation anxiety engagement "
+    "collaborative interactive virtual reality augmented simulation game "
+    "based gamification automated scoring natural processing generation "
+    "large models transformer attention multimodal speech recognition "
+    "pronunciation vocabulary grammar reading comprehension listening "
+    "second foreign english learners children adults elderly clinical "
+    "health medical patients intervention randomized controlled trial "
+    "meta systematic review survey qualitative mixed methods experimental "
+    "quasi longitudinal cross sectional evidence synthesis policy "
+    "implications practice towards understanding exploring investigating "
+    "comparing predicting improving enhancing supporting measuring"
+).split()
+
+GENERIC_TITLES = [
+    "Editorial", "Introduction", "Preface", "Book review",
+    "Erratum", "Letter to the editor", "Commentary", "Foreword",
+]
+
+SOURCES = ['Semantic Scholar', 'OpenAlex', 'arXiv']
+
+
+def _random_phrases(rng: np.random.Generator, n: int, min_words: int, max_words: int) -> List[str]:
+    """Draw n random phrases from the vocabulary"""
+    lengths = rng.integers(min_words, max_words + 1, n)
+    words = rng.integers(0, len(VOCABULARY), (n, max_words))
+    vocab = np.array(VOCABULARY, dtype=object)
+    return [' '.join(vocab[row[:k]]) for row, k in zip(words, lengths)]
+
+
+def generate_corpus(
+    n_records: int,
+    duplicate_rate: float = 0.3,
+    noise_rate: float = 0.5,
+    generic_title_rate: float = 0.01,
+    seed: int = 42
+) -> pd.DataFrame:
+    """
+    Generate a synthetic identification set with known duplicates
+
+    Args:
+        n_records: Total number of records (works + duplicates)
+        duplicate_rate: Share of records that duplicate another record
+        noise_rate: Probability scale for each kind of noise on a duplicate
+        generic_title_rate: Share of distinct works with a generic title
+        seed: Random seed
+
+    Returns:
+        DataFrame in the 01_identification layout plus a ground-truth
+        `work_id` column (records sharing a work_id are duplicates)
+    """
+    rng = np.random.default_rng(seed)
+    n_dups = int(n_records * duplicate_rate)
+    n_works = n_records - n_dups
+
+    # Distinct works
+    titles = _random_phrases(rng, n_works, 4, 10)
+    has_subtitle = rng.random(n_works) < 0.4
+    subtitles = _random_phrases(rng, int(has_subtitle.sum()), 3, 6)
+    sub_iter = iter(subtitles)
+    titles = [
+        f"{t}: {next(sub_iter)}" if sub else t
+        for t, sub in zip(titles, has_subtitle)
+    ]
+    titles = [t[0].upper() + t[1:] for t in titles]
+
+    generic = np.flatnonzero(rng.random(n_works) < generic_title_rate)
+    for i in generic:
+        titles[i] = GENERIC_TITLES[i % len(GENERIC_TITLES)]
+
+    work_ids = np.arange(n_works)
+    has_doi = rng.random(n_works) < 0.7
+    has_arxiv = rng.random(n_works) < 0.15
+
+    works = pd.DataFrame({
+        'title': titles,
+        'abstract': _random_phrases(rng, n_works, 40, 80),
+        'authors': _random_phrases(rng, n_works, 2, 4),
+        'year': rng.integers(2015, 2025, n_works),
+        'citations': rng.poisson(5, n_works),
+        'doi': pd.Series([f"10.{1000 + i % 9000}/synth.{i}" for i in work_ids]).where(has_doi),
+        'pdf_url': None,
+        'source': rng.choice(SOURCES, n_works, p=[0.5, 0.4, 0.1]),
+        'arxiv_id': pd.Series(
+            [f"{1501 + i // 100000}.{i % 100000:05d}" for i in work_ids]
+        ).where(has_arxiv),
+        'work_id': work_ids,
+    })
+
+    if n_dups == 0:
+        return works
+
+    # Duplicates of randomly chosen works, from a different source
+    base = rng.integers(0, n_works, n_dups)
+    dups = works.iloc[base].reset_index(drop=True)
+    shift = rng.integers(1, len(SOURCES), n_dups)
+    source_idx = dups['source'].map({s: i for i, s in enumerate(SOURCES)}).to_numpy()
+    dups['source'] = np.array(SOURCES, dtype=object)[(source_idx + shift) % len(SOURCES)]
+
+    def pick(p: float) -> np.ndarray:
+        return rng.random(n_dups) < p * noise_rate
+
+    dup_titles = dups['title'].tolist()
+    upper, title_case = pick(0.2), pick(0.2)
+    punct, truncate, retitle = pick(0.4), pick(0.3), pick(0.1)
+    new_subtitles = iter(_random_phrases(rng, int(retitle.sum()), 4, 7))
+    for i in range(n_dups):
+        t = dup_titles[i]
+        if retitle[i]:
+            t = f"{t.split(':', 1)[0]}: {next(new_subtitles)}"
+        elif truncate[i] and ':' in t:
+            t = t.split(':', 1)[0]
+        if punct[i]:
+            t = t.replace(':', ' -').replace(' ', ', ', 1) + '.'
+        if upper[i]:
+            t = t.upper()
+        elif title_case[i]:
+            t = t.title()
+        dup_titles[i] = t
+    dups['title'] = dup_titles
+
+    edited = np.flatnonzero(pick(0.5))
+    abstracts = dups['abstract'].to_numpy(dtype=object)
+    for i, cut in zip(edited, rng.integers(0, 30, len(edited))):
+        words = abstracts[i].split()
+        abstracts[i] = ' '.join(words[:cut] + words[cut + 2:])
+    dups['abstract'] = abstracts
+
+    doi = dups['doi'].astype(object)
+    prefixed, upper_doi = pick(0.4), pick(0.3)
+    doi = doi.where(~prefixed | doi.isna(), 'https://doi.org/' + doi.astype(str))
+    doi = doi.where(~upper_doi | doi.isna(), doi.astype(str).str.upper())
+    dups['doi'] = doi.where(~pick(0.5))
+
+    arxiv = dups['arxiv_id'].astype(object)
+    versioned = pick(0.8) & arxiv.notna().to_numpy()
+    versions = pd.Series(rng.integers(1, 4, n_dups)).astype(str)
+    dups['arxiv_id'] = arxiv.where(~versioned, arxiv.astype(str) + 'v' + versions)
+
+    corpus = pd.concat([works, dups], ignore_index=True)
+    return corpus.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def write_identification_store(df: pd.DataFrame, output_dir: Path):
+    """
+    Write a corpus as per-source CSVs (01_identification layout)
+
+    Args:
+        df: Corpus from generate_corpus
+        output_dir: Target data/01_identification directory
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = {
+        'Semantic Scholar': 'semantic_scholar_results.csv',
+        'OpenAlex': 'openalex_results.csv',
+        'arXiv': 'arxiv_results.csv',
+    }
+    for source, filename in files.items():
+        df[df['source'] == source].to_csv(output_dir / filename, index=False)
+
+
+def score_dedup(original: pd.DataFrame, deduplicated: pd.DataFrame) -> Dict[str, float]:
+    """
+    Precision/recall of duplicate removal against ground-truth work_id
+
+    A removed record is a true positive if its work still has another
+    surviving record; removals that wipe out a work entirely are false
+    merges.
+
+    Args:
+        original: Corpus before deduplication
+        deduplicated: Corpus after deduplication
+
+    Returns:
+        Dictionary with removed, true_duplicates, precision, recall
+    """
+    before = original['work_id'].value_counts()
+    after = deduplicated['work_id'].value_counts().reindex(before.index, fill_value=0)
+    removed_per_work = before - after
+
+    true_duplicates = int((before - 1).sum())
+    removed = int(removed_per_work.sum())
+    true_positives = int(np.minimum(removed_per_work, before - 1).sum())
+
+    return {
+        'removed': removed,
+        'true_duplicates': true_duplicates,
+        'precision': true_positives / removed if removed else 1.0,
+        'recall': true_positives / true_duplicates if true_duplicates else 1.0,
+    }
+
+
+def load_deduplicator_class():
+    """Import PaperDeduplicator from scripts/02_deduplicate.py"""
+    spec = importlib.util.spec_from_file_location(
+        'deduplicate', SCRIPTS_DIR / '02_deduplicate.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.PaperDeduplicator
+
+
+def build_strategies(deduplicator, chunk_size: int = 50_000) -> Dict[str, Callable]:
+    """
+    Strategy name → function(df) -> deduplicated df
+
+    The streaming strategy ignores df and reads the identification store
+    under deduplicator.project_path (see write_identification_store); it
+    returns the path of the CSV it wrote.
+    """
+    def doi(df):
+        return deduplicator.deduplicate_by_doi(df)[0]
+
+    def arxiv(df):
+        return deduplicator.deduplicate_by_arxiv_id(df)[0]
+
+    def title(df):
+        return deduplicator.deduplicate_by_title(df)[0]
+
+    def full(df):
+        return title(arxiv(doi(df)))
+
+    def abstract(df):
+        deduplicator.abstract_check = True
+        try:
+            return full(df)
+        finally:
+            deduplicator.abstract_check = False
+
+    def streaming(df):
+        deduplicator.deduplicate_streaming(chunk_size=chunk_size)
+        return deduplicator.output_dir / "deduplicated.csv"
+
+    return {
+        'doi': doi, 'arxiv': arxiv, 'title': title, 'full': full,
+        'abstract': abstract, 'streaming': streaming,
+    }
+
+
+def run_strategy(
+    func: Callable,
+    df: pd.DataFrame,
+    trace_memory: bool = True
+) -> Dict[str, float]:
+    """
+    Run one strategy with stdout silenced; measure runtime and peak memory
+
+    Args:
+        func: Strategy function
+        df: Corpus (not modified)
+        trace_memory: Track peak memory with tracemalloc (slows
+            Python-heavy stages such as title matching ~4x)
+
+    Returns:
+        Dictionary with runtime_s, peak_memory_mb and accuracy metrics
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(df)
+    runtime = time.perf_counter() - start
+    peak = float('nan')
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    # Streaming strategies return the CSV they wrote; load it untimed
+    if isinstance(result, Path):
+        result = pd.read_csv(result, usecols=['work_id'])
+
+    metrics = {'runtime_s': runtime, 'peak_memory_mb': peak / 1024 / 1024}
+    metrics.update(score_dedup(df, result))
+    return metrics
+
+
+def run_benchmark(
+    sizes: List[int],
+    strategies: List[str],
+    duplicate_rate: float,
+    noise_rate: float,
+    seed: int,
+    threshold: Optional[float] = None,
+    trace_memory: bool = True
+) -> pd.DataFrame:
+    """
+    Run every strategy on every corpus size
+
+    Returns:
+        DataFrame with one row per (size, strategy)
+    """
+    PaperDeduplicator = load_deduplicator_class()
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix='scholarag_bench_') as project_dir:
+        deduplicator = PaperDeduplicator(project_dir)
+        if threshold is not None:
+            deduplicator.title_similarity_threshold = threshold
+        available = build_strategies(deduplicator)
+
+        for size in sizes:
+            print(f"\n📦 Generating corpus: {size:,} records (duplicate rate {duplicate_rate:.0%})")
+            df = generate_corpus(size, duplicate_rate=duplicate_rate, noise_rate=noise_rate, seed=seed)
+            if 'streaming' in strategies:
+                write_identification_store(df, deduplicator.input_dir)
+
+            for name in strategies:
+                print(f"   ⏱️  {name}...", end=' ', flush=True)
+                metrics = run_strategy(available[name], df, trace_memory)
+                print(f"{metrics['runtime_s']:.2f}s, "
+                      f"peak {metrics['peak_memory_mb']:.0f} MB, "
+                      f"P={metrics['precision']:.3f} R={metrics['recall']:.3f}")
+                rows.append({'records': size, 'strategy': name, **metrics})
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark deduplication strategies on synthetic noisy corpora"
+    )
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10_000, 100_000, 1_000_000],
+        help='Corpus sizes in records (default: 10000 100000 1000000)'
+    )
+    parser.add_argument(
+        '--strategies',
+        nargs='+',
+        choices=['doi', 'arxiv', 'title', 'full', 'abstract', 'streaming'],
+        default=['doi', 'arxiv', 'title', 'full', 'abstract'],
+        help='Strategies to run (default: doi arxiv title full abstract; also: streaming)'
+    )
+    parser.add_argument(
+        '--duplicate-rate',
+        type=float,
+        default=0.3,
+        help='Share of records that are duplicates (default: 0.3)'
+    )
+    parser.add_argument(
+        '--noise-rate',
+        type=float,
+        default=0.5,
+        help='Noise intensity applied to duplicates, 0-1 (default: 0.5)'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=None,
+        help='Title similarity threshold (default: deduplicator default)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='Random seed (default: 42)'
+    )
+    parser.add_argument(
+        '--no-memory',
+        action='store_true',
+        help='Skip peak-memory tracing (faster runtime numbers)'
+    )
+    parser.add_argument(
+        '--output',
+        help='Write results table to this CSV file'
+    )
+    parser.add_argument(
+        '--write-corpus',
+        help='Only generate the first size and write it as an identification '
+             'store into this project directory (data/01_identification)'
+    )
+
+    args = parser.parse_args()
+
+    if args.write_corpus:
+        df = generate_corpus(args.sizes[0], args.duplicate_rate, args.noise_rate, seed=args.seed)
+        output_dir = Path(args.write_corpus) / "data" / "01_identification"
+        write_identification_store(df, output_dir)
+        print(f"💾 Wrote {len(df):,} records to: {output_dir}")
+        return
+
+    print("\n" + "="*60)
+    print("🧪 DEDUPLICATION BENCHMARK")
+    print("="*60)
+
+    results = run_benchmark(
+        args.sizes, args.strategies, args.duplicate_rate,
+        args.noise_rate, args.seed, args.threshold,
+        trace_memory=not args.no_memory
+    )
+
+    print("\n" + "="*60)
+    print("📊 RESULTS")
+    print("="*60)
+    print(results.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f"\n💾 Saved to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Screening Throughput Benchmark against a Local Mock API
+
+Runs PaperScreener.screen_all_papers on a synthetic corpus against
+core/mock_anthropic_server.py (started as a separate process, so its
+CPU time is not counted as client overhead) at several concurrency
+levels. No API key or spend is needed.
+
+Reported per level:
+    - papers/s (wall clock, end to end)
+    - p50/p95 request latency as seen by the screener (incl. retries)
+    - retries (429/529 injected by the mock)
+    - glitches (malformed responses injected by the mock)
+    - prompt-cache hit rate (share of input tokens read from the cache)
+    - client CPU ms per paper (process time of the screening run)
+    - error decisions (requests that failed after all retries)
+
+Usage:
+    python scripts/benchmark_screening.py [--concurrency 8 32 64 128]
+
+Example:
+    python scripts/benchmark_screening.py \\
+        --papers 2000 \\
+        --concurrency 16 64 256 \\
+        --latency 0.8 --jitter 0.3 \\
+        --rate-limit-rate 0.02 --overload-rate 0.01 \\
+        --output bench_screening.csv
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from benchmark_dedup import generate_corpus
+
+
+SCRIPTS_DIR = Path(__file__).parent
+
+RESEARCH_QUESTION = "How do AI chatbots affect second language speaking proficiency?"
+
+
+def load_screener_class():
+    """Import PaperScreener from scripts/03_screen_papers.py"""
+    spec = importlib.util.spec_from_file_location(
+        'screen_papers', SCRIPTS_DIR / '03_screen_papers.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.PaperScreener
+
+
+def mock_stats(base_url: str, reset: bool = False) -> Dict[str, int]:
+    """Request/error counters of the mock server (optionally reset)"""
+    if reset:
+        request = urllib.request.Request(f"{base_url}/v1/mock/reset", data=b'{}', method='POST')
+    else:
+        request = urllib.request.Request(f"{base_url}/v1/mock/stats")
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+@contextlib.contextmanager
+def mock_server_process(args: argparse.Namespace):
+    """
+    Run the mock API in a child process
+
+    Yields:
+        Base URL of the server
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    command = [
+        sys.executable, str(SCRIPTS_DIR / 'core' / 'mock_anthropic_server.py'),
+        '--port', str(port),
+        '--latency', str(args.latency),
+        '--latency-per-token', str(args.latency_per_token),
+        '--jitter', str(args.jitter),
+        '--rate-limit-rate', str(args.rate_limit_rate),
+        '--overload-rate', str(args.overload_rate),
+        '--retry-after', str(args.retry_after),
+        '--glitch-rate', str(args.glitch_rate),
+        '--seed', str(args.seed),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                mock_stats(base_url)
+                break
+            except OSError:
+                time.sleep(0.1)
+        else:
+            raise RuntimeError(f"Mock server did not start on port {port}")
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def write_project(project_dir: Path, n_papers: int, seed: int) -> Path:
+    """
+    Write a synthetic deduplicated corpus (02 output layout)
+
+    Args:
+        project_dir: Project directory to create
+        n_papers: Number of papers
+        seed: Random seed
+
+    Returns:
+        Project directory
+    """
+    df = generate_corpus(n_papers, duplicate_rate=0.0, seed=seed).drop(columns=['work_id'])
+    input_dir = project_dir / "data" / "01_identification"
+    input_dir.mkdir(parents=True, exist_ok=True)
+    df.to_csv(input_dir / "deduplicated.csv", index=False)
+    return project_dir
+
+
+def run_level(PaperScreener, project_dir: Path, base_url: str, mode: str,
+              concurrency: int, pack_size: int, compact: bool = False,
+              warm_cache: bool = False) -> Dict[str, float]:
+    """
+    Screen the whole corpus once from scratch at one concurrency level
+
+    Args:
+        PaperScreener: Screener class
+        project_dir: Project with data/01_identification/deduplicated.csv
+        base_url: Mock server URL
+        mode: "async" or "sync"
+        concurrency: max_concurrency (async) / max_workers (sync)
+        pack_size: Papers per request
+        compact: Compact tool-use output
+        warm_cache: Prime the prompt cache before fanning out
+
+    Returns:
+        Dictionary of throughput metrics
+    """
+    shutil.rmtree(project_dir / "data" / "02_screening", ignore_errors=True)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        screener = PaperScreener(str(project_dir), RESEARCH_QUESTION, use_cache=False, pack_size=pack_size,
+                                 compact=compact, warm_cache=warm_cache)
+        df = screener.load_papers()
+
+    # Time every request as the screener sees it (SDK and screener retries included)
+    latencies: List[float] = []
+    request_sync, request_async = screener.request_with_retry, screener.request_with_retry_async
+
+    def timed_request(params):
+        start = time.perf_counter()
+        try:
+            return request_sync(params)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    async def timed_request_async(client, params):
+        start = time.perf_counter()
+        try:
+            return await request_async(client, params)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    screener.request_with_retry = timed_request
+    screener.request_with_retry_async = timed_request_async
+
+    mock_stats(base_url, reset=True)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = screener.screen_all_papers(
+            df, mode=mode, max_concurrency=concurrency, max_workers=concurrency,
+            batch_size=max(50, concurrency), metrics_interval=float('inf')
+        )
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    stats = mock_stats(base_url)
+
+    latency_ms = np.array(latencies) * 1000 if latencies else np.array([np.nan])
+    return {
+        'papers': len(df),
+        'requests': len(latencies),
+        'wall_s': wall,
+        'papers_per_s': len(df) / wall,
+        'p50_latency_ms': float(np.percentile(latency_ms, 50)),
+        'p95_latency_ms': float(np.percentile(latency_ms, 95)),
+        'retries': stats['rate_limited'] + stats['overloaded'],
+        'glitches': stats['glitched'],
+        'output_tokens_per_paper': stats['output_tokens'] / len(df),
+        'cache_hit_rate': stats['cache_read_input_tokens'] / max(
+            stats['input_tokens'] + stats['cache_creation_input_tokens'] + stats['cache_read_input_tokens'], 1),
+        'client_cpu_ms_per_paper': cpu / len(df) * 1000,
+        'errors': int((results['decision'] == 'error').sum()),
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> pd.DataFrame:
+    """
+    Run every (mode, concurrency) combination
+
+    Returns:
+        DataFrame with one row per combination
+    """
+    PaperScreener = load_screener_class()
+    os.environ['ANTHROPIC_API_KEY'] = 'mock-key'
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix='scholarag_bench_') as project_dir, \
+            mock_server_process(args) as base_url:
+        os.environ['ANTHROPIC_BASE_URL'] = base_url
+        project_dir = write_project(Path(project_dir), args.papers, args.seed)
+        print(f"\n📦 Corpus: {args.papers:,} papers | mock latency {args.latency * 1000:.0f} ms "
+              f"±{args.jitter:.0%} | 429 {args.rate_limit_rate:.1%} | 529 {args.overload_rate:.1%}")
+
+        for mode in args.modes:
+            for concurrency in args.concurrency:
+                print(f"   ⏱️  {mode} × {concurrency}...", end=' ', flush=True)
+                metrics = run_level(PaperScreener, project_dir, base_url, mode, concurrency,
+                                    args.pack_size, args.compact, args.warm_cache)
+                print(f"{metrics['papers_per_s']:.1f} papers/s, "
+                      f"p50 {metrics['p50_latency_ms']:.0f} ms, p95 {metrics['p95_latency_ms']:.0f} ms, "
+                      f"{metrics['retries']} retries, cache {metrics['cache_hit_rate']:.0%}, "
+                      f"{metrics['client_cpu_ms_per_paper']:.2f} CPU ms/paper")
+                rows.append({'mode': mode, 'concurrency': concurrency, 'pack_size': args.pack_size,
+                             'compact': args.compact, 'warm_cache': args.warm_cache, **metrics})
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark screening throughput against a local mock Messages API"
+    )
+    parser.add_argument(
+        '--papers',
+        type=int,
+        default=1000,
+        help='Synthetic papers to screen per level (default: 1000)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        nargs='+',
+        default=[8, 32, 64, 128],
+        help='Concurrency levels (default: 8 32 64 128)'
+    )
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=['async', 'sync'],
+        default=['async'],
+        help='Screening engines to run (default: async; also: sync)'
+    )
+    parser.add_argument(
+        '--pack-size',
+        type=int,
+        default=1,
+        help='Papers per request (default: 1)'
+    )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Use compact tool-use output'
+    )
+    parser.add_argument(
+        '--warm-cache',
+        action='store_true',
+        help='Prime the prompt cache before fanning out (no effect when the prefix is below '
+             'the model\'s minimum cacheable length, as with claude-haiku-4-5)'
+    )
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.5,
+        help='Mock seconds per response (default: 0.5)'
+    )
+    parser.add_argument(
+        '--latency-per-token',
+        type=float,
+        default=0.0,
+        help='Mock additional seconds per output token (default: 0)'
+    )
+    parser.add_argument(
+        '--jitter',
+        type=float,
+        default=0.3,
+        help='Relative latency noise (default: 0.3)'
+    )
+    parser.add_argument(
+        '--rate-limit-rate',
+        type=float,
+        default=0.01,
+        help='Share of requests answered with 429 (default: 0.01)'
+    )
+    parser.add_argument(
+        '--overload-rate',
+        type=float,
+        default=0.005,
+        help='Share of requests answered with 529 (default: 0.005)'
+    )
+    parser.add_argument(
+        '--retry-after',
+        type=float,
+        default=0.5,
+        help='retry-after seconds sent with injected errors (default: 0.5)'
+    )
+    parser.add_argument(
+        '--glitch-rate',
+        type=float,
+        default=0.0,
+        help='Share of responses with a formatting glitch, e.g. missing score (default: 0)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='Random seed (default: 42)'
+    )
+    parser.add_argument(
+        '--output',
+        help='Write results table to this CSV file'
+    )
+
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("🧪 SCREENING THROUGHPUT BENCHMARK")
+    print("="*60)
+
+    results = run_benchmark(args)
+
+    print("\n" + "="*60)
+    print("📊 RESULTS")
+    print("="*60)
+    print(results.to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f"\n💾 Saved to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
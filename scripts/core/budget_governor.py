@@ -0,0 +1,253 @@
+# scripts/core/budget_governor.py
+
+"""
+Token budget governor and live cost/throughput metrics for screening
+
+Tracks tokens, dollars and papers/s while screening runs, enforces a
+hard spend cap (no new requests once reached - the checkpoint journal
+lets a later run continue), throttles to a maximum spend rate, and
+appends a metrics snapshot to a JSONL file every few seconds.
+
+The prompt-cache hit rate (share of input tokens read from the cache)
+is also kept per minute of the run, so a cold start or a cache that
+expired mid-run shows up in the report. When the prompt prefix is too
+short for the model to cache, the hit rate is reported as "not
+cacheable" instead of 0%.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Haiku-4-5 pricing ($ per MTok; cache writes 1.25x input, cache reads 0.1x input)
+PRICES = {
+    'input': 1.00,
+    'output': 5.00,
+    'cache_write': 1.25,
+    'cache_read': 0.10,
+}
+
+# Per-model pricing for cascade screening (unknown models are priced as PRICES)
+MODEL_PRICES = {
+    'claude-haiku-4-5': PRICES,
+    'claude-sonnet-4-5': {'input': 3.00, 'output': 15.00, 'cache_write': 3.75, 'cache_read': 0.30},
+    'claude-opus-4-1': {'input': 15.00, 'output': 75.00, 'cache_write': 18.75, 'cache_read': 1.50},
+}
+
+
+def cache_hit_rate(input_tokens: int, cache_write_tokens: int, cache_read_tokens: int) -> Optional[float]:
+    """Share of input tokens read from the prompt cache (None without input)"""
+    total = input_tokens + cache_write_tokens + cache_read_tokens
+    return cache_read_tokens / total if total else None
+
+
+def model_prices(model: Optional[str]) -> Dict[str, float]:
+    """$ per MTok for a model (PRICES when unknown)"""
+    return MODEL_PRICES.get(model, PRICES)
+
+
+def usage_cost(input_tokens: int, output_tokens: int, cache_write_tokens: int = 0,
+               cache_read_tokens: int = 0, price_multiplier: float = 1.0,
+               prices: Dict[str, float] = PRICES) -> float:
+    """
+    Dollar cost of token usage
+
+    Args:
+        input_tokens: Uncached input tokens
+        output_tokens: Output tokens
+        cache_write_tokens: Prompt-cache creation tokens
+        cache_read_tokens: Prompt-cache read tokens
+        price_multiplier: 0.5 for the Message Batches API
+        prices: $ per MTok (see model_prices)
+
+    Returns:
+        Cost in dollars
+    """
+    cost = (input_tokens * prices['input'] + output_tokens * prices['output']
+            + cache_write_tokens * prices['cache_write'] + cache_read_tokens * prices['cache_read'])
+    return cost / 1_000_000 * price_multiplier
+
+
+class BudgetGovernor:
+    """Thread-safe spend tracker with hard cap, spend-rate throttle and rolling metrics"""
+
+    def __init__(self, max_cost: Optional[float] = None, max_cost_per_hour: Optional[float] = None,
+                 metrics_file: Optional[Path] = None, interval: float = 10.0,
+                 price_multiplier: float = 1.0, total_papers: int = 0, cacheable: bool = True):
+        """
+        Args:
+            max_cost: Hard cap in dollars (None = unlimited)
+            max_cost_per_hour: Throttle new requests above this spend rate
+            metrics_file: JSONL file receiving a snapshot every interval seconds
+            interval: Seconds between snapshots / dashboard lines
+            price_multiplier: 0.5 for the Message Batches API
+            total_papers: Papers to screen in this run (for ETA)
+            cacheable: False when the prompt prefix is below the model's cacheable minimum
+        """
+        self.max_cost = max_cost
+        self.max_cost_per_hour = max_cost_per_hour
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        self.interval = interval
+        self.price_multiplier = price_multiplier
+        self.total_papers = total_papers
+        self.cacheable = cacheable
+
+        self.lock = threading.Lock()
+        self.start_time = time.monotonic()
+        self.last_report = self.start_time
+        self.requests = 0
+        self.papers = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_write_tokens = 0
+        self.cache_read_tokens = 0
+        self.spent = 0.0
+        self.cap_announced = False
+        self.cache_minutes: Dict[int, List[int]] = {}  # minute → [input, cache write, cache read]
+
+    @property
+    def cost(self) -> float:
+        return self.spent
+
+    def record_usage(self, usage, model: Optional[str] = None):
+        """
+        Add one API response's usage
+
+        Args:
+            usage: Response usage
+            model: Model that produced it (for pricing)
+        """
+        cache_write = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cost = usage_cost(usage.input_tokens, usage.output_tokens, cache_write, cache_read,
+                          self.price_multiplier, model_prices(model))
+        minute = int((time.monotonic() - self.start_time) // 60)
+        with self.lock:
+            self.requests += 1
+            self.input_tokens += usage.input_tokens
+            self.output_tokens += usage.output_tokens
+            self.cache_write_tokens += cache_write
+            self.cache_read_tokens += cache_read
+            self.spent += cost
+            bucket = self.cache_minutes.setdefault(minute, [0, 0, 0])
+            bucket[0] += usage.input_tokens
+            bucket[1] += cache_write
+            bucket[2] += cache_read
+
+    def cache_hit_rates(self) -> List[Optional[float]]:
+        """Prompt-cache hit rate for each minute of the run so far (None = no requests)"""
+        with self.lock:
+            minutes = dict(self.cache_minutes)
+        if not minutes:
+            return []
+        return [cache_hit_rate(*minutes[m]) if m in minutes else None for m in range(max(minutes) + 1)]
+
+    def record_papers(self, n: int = 1):
+        """Count finished papers and emit a snapshot when the interval has passed"""
+        with self.lock:
+            self.papers += n
+            now = time.monotonic()
+            if now - self.last_report < self.interval:
+                return
+            self.last_report = now
+            snapshot = self._snapshot(now)
+        self._emit(snapshot)
+
+    def exhausted(self) -> bool:
+        """True once the hard spend cap is reached (no new requests should start)"""
+        if self.max_cost is None:
+            return False
+        with self.lock:
+            reached = self.cost >= self.max_cost
+            announce = reached and not self.cap_announced
+            self.cap_announced |= reached
+        if announce:
+            print(f"\n   🛑 Budget cap ${self.max_cost:.2f} reached - no new requests "
+                  f"(re-run with a higher --max-cost to continue)")
+        return reached
+
+    def throttle_delay(self) -> float:
+        """Seconds to wait before the next request to stay under max_cost_per_hour"""
+        if self.max_cost_per_hour is None:
+            return 0.0
+        with self.lock:
+            elapsed = time.monotonic() - self.start_time
+            allowed_elapsed = self.cost / self.max_cost_per_hour * 3600
+        return max(0.0, allowed_elapsed - elapsed)
+
+    def _snapshot(self, now: float) -> Dict:
+        elapsed = max(now - self.start_time, 1e-9)
+        cost = self.cost
+        papers_per_s = self.papers / elapsed
+        remaining = max(self.total_papers - self.papers, 0)
+        cost_per_paper = cost / self.papers if self.papers else 0.0
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'elapsed_s': round(elapsed, 1),
+            'papers': self.papers,
+            'requests': self.requests,
+            'papers_per_s': round(papers_per_s, 3),
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'cache_write_tokens': self.cache_write_tokens,
+            'cache_read_tokens': self.cache_read_tokens,
+            'cache_hit_rate': cache_hit_rate(self.input_tokens, self.cache_write_tokens, self.cache_read_tokens),
+            'cost_usd': round(cost, 4),
+            'cost_per_hour_usd': round(cost / elapsed * 3600, 4),
+            'cost_per_paper_usd': round(cost_per_paper, 6),
+            'projected_cost_usd': round(cost + cost_per_paper * remaining, 4),
+            'eta_s': round(remaining / papers_per_s, 1) if papers_per_s > 0 else None,
+            'max_cost_usd': self.max_cost,
+        }
+
+    def _emit(self, snapshot: Dict):
+        eta = f"{snapshot['eta_s'] / 60:.1f} min" if snapshot['eta_s'] is not None else "?"
+        cap = f" / cap ${self.max_cost:.2f}" if self.max_cost is not None else ""
+        if not self.cacheable:
+            cache = " | cache: not cacheable"
+        elif snapshot['cache_hit_rate'] is not None:
+            cache = f" | cache {snapshot['cache_hit_rate']:.0%}"
+        else:
+            cache = ""
+        print(f"   📈 {snapshot['papers']} papers | {snapshot['papers_per_s']:.2f} papers/s | "
+              f"${snapshot['cost_usd']:.4f}{cap} (${snapshot['cost_per_hour_usd']:.2f}/h){cache} | "
+              f"projected ${snapshot['projected_cost_usd']:.2f} | ETA {eta}")
+        if self.metrics_file:
+            with open(self.metrics_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(snapshot) + '\n')
+
+    def summary(self) -> Dict:
+        """Write and return a final snapshot"""
+        with self.lock:
+            snapshot = self._snapshot(time.monotonic())
+        if self.cacheable:
+            snapshot['cache_hit_rate_per_minute'] = [
+                round(rate, 4) if rate is not None else None for rate in self.cache_hit_rates()
+            ]
+        else:
+            snapshot['cache_hit_rate'] = snapshot['cache_hit_rate_per_minute'] = 'not cacheable'
+
+        if self.metrics_file:
+            with open(self.metrics_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(dict(snapshot, final=True)) + '\n')
+        return snapshot
+
+    @staticmethod
+    def last_throughput(metrics_file: Path) -> Optional[float]:
+        """papers/s of the last snapshot in a previous run's metrics file"""
+        if not Path(metrics_file).exists():
+            return None
+        last = None
+        with open(metrics_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    last = line
+        if last is None:
+            return None
+        try:
+            return json.loads(last)['papers_per_s'] or None
+        except (ValueError, KeyError):
+            return None
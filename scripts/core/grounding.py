@@ -0,0 +1,121 @@
+# scripts/core/grounding.py
+
+"""
+Evidence-grounding check for AI screening quotes
+
+The abstract is normalized once (Unicode NFKC, case folding, typographic
+quotes/dashes, hyphenated line breaks, punctuation and whitespace), then
+each quote is matched approximately with rapidfuzz partial_ratio, i.e.
+the best-aligned abstract substring of the quote's length. Exact
+substring hits short-circuit the fuzzy match.
+
+The grounding score of a response is the score of its weakest quote
+(0.0-1.0), so one invented quote still flags the paper while harmless
+differences (whitespace, "e-learning" vs "e learning", curly quotes,
+a dropped word) no longer do.
+"""
+
+import re
+import unicodedata
+from typing import List
+
+from rapidfuzz import fuzz
+
+
+# Responses whose weakest quote scores below this go to human review
+DEFAULT_MIN_GROUNDING_SCORE = 0.90
+
+# Quotes shorter than this (after normalization) carry no evidence and are ignored
+MIN_QUOTE_CHARS = 8
+
+_HYPHEN_BREAK = re.compile(r'(\w)[-\u00ad\u2010\u2011]\s*\n\s*(\w)')
+_NON_WORD = re.compile(r'[\W_]+')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9(\[])')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form for grounding comparisons
+
+    Args:
+        text: Abstract or quote
+
+    Returns:
+        Case-folded alphanumeric words separated by single spaces
+    """
+    if not isinstance(text, str):
+        return ''
+    text = unicodedata.normalize('NFKC', text)
+    text = _HYPHEN_BREAK.sub(r'\1\2', text).replace('\u00ad', '')
+    return _NON_WORD.sub(' ', text.casefold()).strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split an abstract into sentences (compact screening cites them by number)
+
+    Args:
+        text: Abstract
+
+    Returns:
+        Non-empty sentences in order
+    """
+    if not isinstance(text, str):
+        return []
+    return [part.strip() for part in _SENTENCE_BREAK.split(text.strip()) if part.strip()]
+
+
+def strip_quote_label(quote: str) -> str:
+    """Remove a "Label: 'quote'" prefix the model sometimes adds"""
+    if ':' not in quote:
+        return quote
+    potential_quote = quote.split(':', 1)[1].strip()
+    if len(potential_quote) >= 2 and potential_quote[0] == potential_quote[-1] and potential_quote[0] in '\'"':
+        return potential_quote[1:-1]
+    return potential_quote
+
+
+class GroundingValidator:
+    """Scores AI evidence quotes against one abstract (normalized once)"""
+
+    def __init__(self, abstract: str):
+        """
+        Args:
+            abstract: Original paper abstract
+        """
+        self.abstract = normalize_text(abstract)
+
+    def quote_score(self, quote: str) -> float:
+        """
+        Similarity of a quote to its best-matching abstract span
+
+        A label prefix is tolerated: the score is the better of the raw
+        quote and the quote without its "Label:" prefix.
+
+        Args:
+            quote: Evidence quote from the model
+
+        Returns:
+            Score in 0.0-1.0 (1.0 = verbatim after normalization)
+        """
+        best = 0.0
+        for candidate in dict.fromkeys((quote, strip_quote_label(quote))):
+            candidate = normalize_text(candidate)
+            if len(candidate) < MIN_QUOTE_CHARS or candidate in self.abstract:
+                return 1.0
+            best = max(best, fuzz.partial_ratio(candidate, self.abstract, score_cutoff=best * 100) / 100)
+        return best
+
+    def score(self, quotes: List[str]) -> float:
+        """
+        Grounding score of a response: the weakest quote's score
+
+        Args:
+            quotes: Evidence quotes from the model
+
+        Returns:
+            Score in 0.0-1.0 (1.0 when there are no quotes)
+        """
+        if not quotes:
+            return 1.0
+        return min(self.quote_score(str(quote)) for quote in quotes)
@@ -0,0 +1,320 @@
+# scripts/core/identifiers.py
+
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Sentinel hash for "no identifier"
+MISSING_HASH = np.uint64(0)
+
+_DOI_PREFIX = r'^(?:https?://)?(?:dx\.)?doi\.org/|^doi:\s*'
+_DOI_VALID = r'^10\.\d{4,9}/\S+$'
+_ARXIV_DOI = r'^10\.48550/arxiv\.(.+)$'
+_ARXIV_DOI_PREFIX = '10.48550/arxiv.'
+_ARXIV_PREFIX = r'^(?:https?://)?(?:export\.)?arxiv\.org/(?:abs|pdf)/|^arxiv:\s*'
+_ARXIV_VALID = r'^(?:\d{4}\.\d{4,5}|[a-z\-]+(?:\.[a-z]{2})?/\d{7})$'
+_OPENALEX_PREFIX = r'^(?:https?://)?(?:api\.)?openalex\.org/(?:works/)?'
+_S2_VALID = r'^[0-9a-f]{40}$'
+
+
+def _as_clean_strings(values: pd.Series) -> pd.Series:
+    """Convert a column to trimmed pandas strings, mapping blanks to NA"""
+    s = values.astype('string').str.strip()
+    return s.mask(s.isin(['', 'nan', 'None', 'N/A']))
+
+
+def canonicalize_doi(values: pd.Series) -> pd.Series:
+    """
+    Canonicalize DOIs (vectorized)
+
+    Lowercases, strips resolver prefixes (https://doi.org/, doi:) and
+    trailing punctuation left over from citation text.
+
+    Args:
+        values: Series of raw DOI strings
+
+    Returns:
+        Series of canonical DOIs (NA where the value is not a DOI)
+    """
+    s = _as_clean_strings(values).str.lower().str.lstrip('(')
+    s = s.str.replace(_DOI_PREFIX, '', regex=True)
+    s = s.str.rstrip(' .,;:\'"')
+
+    # Drop a trailing ")" only when it is unbalanced (e.g. "(doi: 10.1/x)")
+    unbalanced = s.str.endswith(')') & (s.str.count(r'\(') < s.str.count(r'\)'))
+    s = s.mask(unbalanced.fillna(False), s.str[:-1])
+
+    return s.where(s.str.match(_DOI_VALID).fillna(False))
+
+
+def canonicalize_arxiv_id(values: pd.Series) -> pd.Series:
+    """
+    Canonicalize arXiv identifiers (vectorized)
+
+    Strips URL/"arXiv:" prefixes, ".pdf" suffixes and version suffixes
+    (v1, v2, ...) so that all versions of a preprint share one key.
+    arXiv DOIs (10.48550/arXiv.XXXX) are also accepted.
+
+    Args:
+        values: Series of raw arXiv IDs
+
+    Returns:
+        Series of canonical arXiv IDs (NA where the value is not an arXiv ID)
+    """
+    s = _as_clean_strings(values).str.lower()
+    s = s.str.replace(_ARXIV_PREFIX, '', regex=True)
+    s = s.str.replace(_ARXIV_DOI, r'\1', regex=True)
+    s = s.str.replace(r'\.pdf$', '', regex=True)
+    s = s.str.replace(r'v\d+$', '', regex=True)
+
+    return s.where(s.str.match(_ARXIV_VALID).fillna(False))
+
+
+def canonicalize_pmid(values: pd.Series) -> pd.Series:
+    """
+    Canonicalize PubMed IDs (vectorized)
+
+    Args:
+        values: Series of raw PMIDs (strings, ints or floats from CSV)
+
+    Returns:
+        Series of canonical PMIDs without prefix or leading zeros
+    """
+    s = _as_clean_strings(values).str.lower()
+    s = s.str.replace(r'^pmid:\s*', '', regex=True)
+    s = s.str.replace(r'\.0$', '', regex=True)  # float round-trip through CSV
+    s = s.where(s.str.fullmatch(r'\d+').fillna(False))
+    return s.str.lstrip('0').mask(lambda x: x == '')
+
+
+def canonicalize_openalex_id(values: pd.Series) -> pd.Series:
+    """
+    Canonicalize OpenAlex work IDs (vectorized)
+
+    Args:
+        values: Series of raw OpenAlex IDs (URL or bare "W123" form)
+
+    Returns:
+        Series of canonical IDs such as "W2741809807"
+    """
+    s = _as_clean_strings(values)
+    s = s.str.replace(_OPENALEX_PREFIX, '', regex=True).str.upper()
+    return s.where(s.str.fullmatch(r'W\d+').fillna(False))
+
+
+def canonicalize_s2_id(values: pd.Series) -> pd.Series:
+    """
+    Canonicalize Semantic Scholar paperIds (vectorized)
+
+    Args:
+        values: Series of raw S2 paperIds
+
+    Returns:
+        Series of lowercase 40-character hex paperIds
+    """
+    s = _as_clean_strings(values).str.lower()
+    return s.where(s.str.fullmatch(_S2_VALID).fillna(False))
+
+
+# Identifier kind -> (source column, canonicalizer)
+IDENTIFIER_COLUMNS: Dict[str, Tuple[str, Callable[[pd.Series], pd.Series]]] = {
+    'doi': ('doi', canonicalize_doi),
+    'arxiv': ('arxiv_id', canonicalize_arxiv_id),
+    'pmid': ('pmid', canonicalize_pmid),
+    'openalex': ('openalex_id', canonicalize_openalex_id),
+    's2': ('paperId', canonicalize_s2_id),
+}
+
+
+def hash_identifiers(canonical: pd.Series, namespace: str) -> np.ndarray:
+    """
+    Hash canonical identifiers to 64-bit integers
+
+    The namespace is mixed into each key so that e.g. a PMID and an
+    OpenAlex number never collide.
+
+    Args:
+        canonical: Series of canonical identifiers (NA for missing)
+        namespace: Identifier kind ("doi", "arxiv", ...)
+
+    Returns:
+        uint64 array aligned with `canonical`; MISSING_HASH where NA
+    """
+    missing = canonical.isna().to_numpy()
+    keyed = (namespace + ':' + canonical.fillna('')).astype(object)
+    hashes = pd.util.hash_pandas_object(keyed, index=False).to_numpy(dtype=np.uint64, copy=True)
+    hashes[missing] = MISSING_HASH
+    return hashes
+
+
+def canonical_identifiers(df: pd.DataFrame, kind: str) -> pd.Series:
+    """
+    Canonical identifiers of one kind for every row of a paper DataFrame
+
+    arXiv IDs are also recovered from arXiv DOIs, so a Semantic Scholar
+    record carrying only "10.48550/arXiv.2101.00001" still matches the
+    arXiv record.
+
+    Args:
+        df: Paper DataFrame (columns as written by 01_fetch_papers.py)
+        kind: One of IDENTIFIER_COLUMNS
+
+    Returns:
+        Series of canonical identifiers aligned with df (NA for missing)
+    """
+    column, canonicalize = IDENTIFIER_COLUMNS[kind]
+    if column in df.columns:
+        canonical = canonicalize(df[column])
+    else:
+        canonical = pd.Series(pd.NA, index=df.index, dtype='string')
+
+    if kind == 'arxiv' and 'doi' in df.columns:
+        # Non-arXiv DOIs fail the arXiv pattern and come back as NA
+        canonical = canonical.fillna(canonicalize_arxiv_id(canonicalize_doi(df['doi'])))
+
+    return canonical
+
+
+def identifier_hashes(df: pd.DataFrame, kind: str) -> np.ndarray:
+    """
+    64-bit hashes of one identifier kind for every row
+
+    Args:
+        df: Paper DataFrame
+        kind: One of IDENTIFIER_COLUMNS
+
+    Returns:
+        uint64 array aligned with df; MISSING_HASH where the row has none
+    """
+    return hash_identifiers(canonical_identifiers(df, kind), kind)
+
+
+def normalize_title_key(values: pd.Series) -> pd.Series:
+    """Lowercase, punctuation-free, whitespace-collapsed titles (vectorized)"""
+    s = values.astype('string').fillna('').str.lower()
+    s = s.str.replace(r'[^\w\s]', ' ', regex=True)
+    return s.str.split().str.join(' ').fillna('')
+
+
+def abstract_hashes(df: pd.DataFrame, min_chars: int = 200) -> np.ndarray:
+    """
+    64-bit hashes of normalized abstracts
+
+    Short abstracts are left unhashed so placeholders such as "No abstract
+    available" never make unrelated papers look identical.
+
+    Args:
+        df: Paper DataFrame
+        min_chars: Minimum normalized abstract length to hash
+
+    Returns:
+        uint64 array aligned with df; MISSING_HASH where the abstract is missing or short
+    """
+    if 'abstract' not in df.columns:
+        return np.zeros(len(df), dtype=np.uint64)
+    normalized = normalize_title_key(df['abstract'])
+    return hash_identifiers(normalized.mask(normalized.str.len() < min_chars), 'abstract')
+
+
+def paper_keys(df: pd.DataFrame, fallback_to_title: bool = True) -> np.ndarray:
+    """
+    Stable 64-bit paper key for every row
+
+    Uses the first available identifier in priority order
+    DOI > arXiv > PMID > OpenAlex > S2 paperId. arXiv DOIs are keyed as
+    arXiv IDs so that the preprint gets the same key from every source.
+    Rows without any identifier fall back to a hash of normalized
+    title + year.
+
+    Args:
+        df: Paper DataFrame
+        fallback_to_title: Hash title + year when no identifier exists
+
+    Returns:
+        uint64 array aligned with df (MISSING_HASH only if no fallback)
+    """
+    keys = np.zeros(len(df), dtype=np.uint64)
+    for kind in IDENTIFIER_COLUMNS:
+        unresolved = keys == MISSING_HASH
+        if not unresolved.any():
+            break
+        canonical = canonical_identifiers(df, kind)
+        if kind == 'doi':
+            canonical = canonical.mask(canonical.str.startswith(_ARXIV_DOI_PREFIX).fillna(False))
+        hashes = hash_identifiers(canonical, kind)
+        keys[unresolved] = hashes[unresolved]
+
+    if fallback_to_title and 'title' in df.columns:
+        unresolved = keys == MISSING_HASH
+        if unresolved.any():
+            year = df['year'] if 'year' in df.columns else pd.Series('', index=df.index)
+            year = pd.to_numeric(year, errors='coerce').astype('Int64').astype('string').fillna('')
+            title_key = normalize_title_key(df['title']) + '|' + year
+            title_key = title_key.mask(normalize_title_key(df['title']) == '')
+            hashes = hash_identifiers(title_key, 'title')
+            keys[unresolved] = hashes[unresolved]
+
+    return keys
+
+
+def format_paper_key(key: Optional[int]) -> str:
+    """Render a 64-bit paper key as a fixed-width hex string (for CSV/JSON)"""
+    if key is None or int(key) == 0:
+        return ''
+    return f"{int(key):016x}"
+
+
+def paper_key_strings(df: pd.DataFrame) -> pd.Series:
+    """
+    Paper keys rendered as 16-character hex strings
+
+    Hex strings survive CSV round-trips (pandas would otherwise read
+    uint64 values above 2**63 back as floats).
+
+    Args:
+        df: Paper DataFrame
+
+    Returns:
+        Series of hex paper keys aligned with df
+    """
+    keys = paper_keys(df)
+    return pd.Series([format_paper_key(k) for k in keys], index=df.index, dtype=object)
+
+
+def title_year_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Legacy "title_year" paper keys of human review files
+
+    Rows sharing a title and year get "-2", "-3", ... suffixes in file
+    order, so no two papers collapse into one key.
+
+    Args:
+        df: Paper DataFrame with title (and year) columns
+
+    Returns:
+        Series of unique keys aligned with df
+    """
+    year = df['year'].astype(str) if 'year' in df.columns else 'unknown'
+    ids = df['title'].astype(str) + '_' + year
+    occurrence = ids.groupby(ids).cumcount()
+    return ids.where(occurrence == 0, ids + '-' + (occurrence + 1).astype(str))
+
+
+def review_paper_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Paper keys for human review and Cohen's Kappa
+
+    The screening paper_id column written by 03_screen_papers.py, or
+    title_year_ids for files from before it existed.
+
+    Args:
+        df: Screened papers (zone file, review queue or decisions)
+
+    Returns:
+        Series of string keys aligned with df
+    """
+    if 'paper_id' in df.columns:
+        return df['paper_id'].astype(str)
+    return title_year_ids(df)
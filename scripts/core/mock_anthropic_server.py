@@ -0,0 +1,410 @@
+# scripts/core/mock_anthropic_server.py
+
+"""
+Local stand-in for the Anthropic Messages and Message Batches APIs
+
+Returns deterministic AI-PRISMA rubric JSON so screening code paths can
+be exercised without an API key or spend. Point the client at it with
+`anthropic.Anthropic(api_key="test", base_url=server.base_url)`.
+
+For load tests it can simulate latency (fixed + per output token, with
+jitter), inject 429 rate-limit and 529 overloaded errors, and reports
+prompt-cache usage like the real API: the first request with a given
+cache_control system prompt writes the cache, later ones within the TTL
+read it - once the writing response has been delivered, so requests
+racing in concurrently with a cold cache all write it. GET /v1/mock/stats returns request/error counters and
+POST /v1/mock/reset clears them.
+
+Usage:
+    with MockAnthropicServer(batch_delay=0.5) as server:
+        screener.client = anthropic.Anthropic(api_key="test", base_url=server.base_url)
+        ...
+
+    # Standalone, 300 ms latency and 2% of requests rejected with 429
+    python scripts/core/mock_anthropic_server.py --port 8765 --latency 0.3 --rate-limit-rate 0.02
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _content_text(content) -> str:
+    """Flatten a message content field (string or list of blocks) to text"""
+    if isinstance(content, str):
+        return content
+    return '\n'.join(block.get('text', '') for block in content if isinstance(block, dict))
+
+
+def score_paper(title: str, abstract: str) -> Dict:
+    """
+    Deterministic rubric result for one paper
+
+    Scores are derived from a hash of title + abstract, so the same paper
+    always gets the same answer. Evidence quotes are taken verbatim from
+    the abstract so grounding validation passes.
+    """
+    digest = hashlib.sha256(f"{title}\n{abstract}".encode('utf-8')).digest()
+    scores = {
+        'domain': digest[0] % 11,
+        'intervention': digest[1] % 11,
+        'method': digest[2] % 6,
+        'outcomes': digest[3] % 11,
+        'exclusion': -5 * (digest[4] % 5),
+        'title_bonus': 10 if digest[5] % 4 == 0 else 0,
+    }
+    words = abstract.split()
+    quotes = [' '.join(words[:8])] if words else []
+    return {
+        'scores': scores,
+        'total_score': sum(scores.values()),
+        'decision': 'human-review',
+        'reasoning': 'Deterministic mock assessment.',
+        'evidence_quotes': quotes,
+    }
+
+
+def glitch_response(result: Dict, kind: str) -> str:
+    """
+    Render a rubric result with a typical LLM formatting glitch
+
+    Args:
+        result: Result from score_paper
+        kind: "fence", "string_scores", "trailing_comma" or "missing_field"
+
+    Returns:
+        Response text
+    """
+    result = json.loads(json.dumps(result))
+    if kind == 'fence':
+        return f"Here is my assessment:\n```json\n{json.dumps(result, indent=2)}\n```"
+    if kind == 'string_scores':
+        result['scores'] = {k: str(v) for k, v in result['scores'].items()}
+        return json.dumps(result)
+    if kind == 'trailing_comma':
+        return json.dumps(result, indent=2)[:-2] + ',\n}'
+    del result['scores']['method']
+    del result['total_score']
+    return json.dumps(result)
+
+
+GLITCH_KINDS = ('fence', 'string_scores', 'trailing_comma', 'missing_field')
+
+
+def parse_papers(user_text: str) -> List[Dict[str, str]]:
+    """Extract (title, abstract) pairs from a screening user prompt"""
+    pattern = re.compile(r'Title:\s*(.*?)\n\s*\nAbstract:\s*(.*?)(?=\n\s*\n(?:\[|Title:)|\Z)', re.S)
+    return [{'title': t.strip(), 'abstract': a.strip()} for t, a in pattern.findall(user_text)]
+
+
+class MockAnthropicServer:
+    """Threaded local HTTP server speaking a subset of the Anthropic API"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, batch_delay: float = 0.0,
+                 latency: float = 0.0, latency_per_token: float = 0.0, jitter: float = 0.0,
+                 rate_limit_rate: float = 0.0, overload_rate: float = 0.0, retry_after: float = 0.5,
+                 cache_ttl: float = 300.0, glitch_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            host: Bind address
+            port: Bind port (0 = pick a free port)
+            batch_delay: Seconds before a submitted batch reports "ended"
+            latency: Fixed seconds per /v1/messages response
+            latency_per_token: Additional seconds per output token
+            jitter: Relative latency noise (0.2 = uniform ±20%)
+            rate_limit_rate: Share of message requests rejected with 429
+            overload_rate: Share of message requests rejected with 529
+            retry_after: Seconds sent in the retry-after header of injected errors
+            cache_ttl: Prompt-cache lifetime in seconds
+            glitch_rate: Share of single-paper responses with a formatting glitch
+            seed: Random seed for jitter and error injection
+        """
+        self.batch_delay = batch_delay
+        self.latency = latency
+        self.latency_per_token = latency_per_token
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.overload_rate = overload_rate
+        self.retry_after = retry_after
+        self.cache_ttl = cache_ttl
+        self.glitch_rate = glitch_rate
+        self.random = random.Random(seed)
+        self.batches: Dict[str, Dict] = {}
+        self.prompt_cache: Dict[str, List[float]] = {}  # key → [readable from, last used]
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload, content_type: str = 'application/json'):
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('request-id', f"req_{uuid.uuid4().hex[:24]}")
+                if status in (429, 529):
+                    self.send_header('retry-after-ms', str(int(server.retry_after * 1000)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_json(self) -> Dict:
+                length = int(self.headers.get('Content-Length', 0))
+                return json.loads(self.rfile.read(length) or b'{}')
+
+            def do_POST(self):
+                path = self.path.split('?')[0]
+                body = self._read_json()
+                if path == '/v1/messages':
+                    status, payload = server.handle_message(body)
+                    self._send_json(status, payload)
+                elif path == '/v1/messages/batches':
+                    self._send_json(200, server.create_batch(body))
+                elif path == '/v1/mock/reset':
+                    server.reset_stats()
+                    self._send_json(200, server.stats)
+                else:
+                    self._send_json(404, server.error('not_found_error', f'Unknown path {path}'))
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path == '/v1/mock/stats':
+                    self._send_json(200, server.stats)
+                    return
+                match = re.fullmatch(r'/v1/messages/batches/([\w-]+)(/results)?', path)
+                if not match or match.group(1) not in server.batches:
+                    self._send_json(404, server.error('not_found_error', f'Unknown path {path}'))
+                elif match.group(2):
+                    self._send_json(200, server.batch_results(match.group(1)), 'application/binary')
+                else:
+                    self._send_json(200, server.batch_object(match.group(1)))
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockAnthropicServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'MockAnthropicServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @staticmethod
+    def error(error_type: str, message: str) -> Dict:
+        return {'type': 'error', 'error': {'type': error_type, 'message': message}}
+
+    def reset_stats(self):
+        """Zero the request/error/token counters (prompt cache is kept)"""
+        with self.lock:
+            self.stats = {
+                'messages': 0, 'succeeded': 0, 'rate_limited': 0, 'overloaded': 0, 'glitched': 0,
+                'input_tokens': 0, 'output_tokens': 0,
+                'cache_creation_input_tokens': 0, 'cache_read_input_tokens': 0,
+            }
+
+    def cache_usage(self, params: Dict) -> Dict[str, int]:
+        """Prompt-cache token split for a request's cache_control system blocks"""
+        system = params.get('system', '')
+        blocks = system if isinstance(system, list) else [{'type': 'text', 'text': system}]
+        cached_text = ''.join(b.get('text', '') for b in blocks if isinstance(b, dict) and b.get('cache_control'))
+        uncached_text = ''.join(b.get('text', '') for b in blocks if isinstance(b, dict) and not b.get('cache_control'))
+        usage = {'cache_creation_input_tokens': 0, 'cache_read_input_tokens': 0,
+                 'system_input_tokens': len(uncached_text) // 4}
+        if not cached_text:
+            return usage
+
+        key = hashlib.sha256(f"{params.get('model')}\n{cached_text}".encode('utf-8')).hexdigest()
+        now = time.time()
+        with self.lock:
+            entry = self.prompt_cache.get(key)
+            hit = entry is not None and entry[0] <= now and now - entry[1] < self.cache_ttl
+            if hit:
+                entry[1] = now  # Reads refresh the TTL
+            elif entry is None or now - entry[1] >= self.cache_ttl:
+                # Readable once this (writing) response is delivered
+                self.prompt_cache[key] = [now + self.latency, now]
+        usage['cache_read_input_tokens' if hit else 'cache_creation_input_tokens'] = len(cached_text) // 4
+        return usage
+
+    def build_message(self, params: Dict) -> Dict:
+        """Build a Messages API response for one request body"""
+        # Follow-up turns are answered with the full result for the original paper
+        user_text = _content_text(params['messages'][0]['content'])
+        papers = parse_papers(user_text)
+        results = [score_paper(p['title'], p['abstract']) for p in papers]
+        payload = results[0] if len(results) == 1 else results
+        text = json.dumps(payload)
+
+        if len(results) == 1 and len(params['messages']) == 1 and self.glitch_rate > 0 and not params.get('tools'):
+            with self.lock:
+                glitched = self.random.random() < self.glitch_rate
+                kind = self.random.choice(GLITCH_KINDS)
+                self.stats['glitched'] += glitched
+            if glitched:
+                text = glitch_response(payload, kind)
+
+        content = [{'type': 'text', 'text': text}]
+        tool_choice = params.get('tool_choice') or {}
+        if tool_choice.get('type') == 'tool' and len(results) == 1:
+            # Compact screening: cite the first sentence as evidence
+            tool_input = {'s': payload['scores'], 'r': 'Mock assessment.', 'e': [1]}
+            text = json.dumps(tool_input)
+            content = [{'type': 'tool_use', 'id': f"toolu_{uuid.uuid4().hex[:24]}",
+                        'name': tool_choice['name'], 'input': tool_input}]
+
+        cache = self.cache_usage(params)
+        return {
+            'id': f"msg_{uuid.uuid4().hex[:24]}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': params.get('model', 'mock'),
+            'content': content,
+            'stop_reason': 'tool_use' if content[0]['type'] == 'tool_use' else 'end_turn',
+            'stop_sequence': None,
+            'usage': {
+                'input_tokens': max(1, len(user_text) // 4) + cache['system_input_tokens'],
+                'output_tokens': max(1, len(text) // 4),
+                'cache_creation_input_tokens': cache['cache_creation_input_tokens'],
+                'cache_read_input_tokens': cache['cache_read_input_tokens'],
+            },
+        }
+
+    def handle_message(self, body: Dict):
+        with self.lock:
+            self.request_count += 1
+            self.stats['messages'] += 1
+            draw = self.random.random()
+            noise = self.random.uniform(-self.jitter, self.jitter)
+
+        if draw < self.rate_limit_rate:
+            with self.lock:
+                self.stats['rate_limited'] += 1
+            return 429, self.error('rate_limit_error', 'Mock rate limit')
+        if draw < self.rate_limit_rate + self.overload_rate:
+            time.sleep(self.latency * (1 + noise))
+            with self.lock:
+                self.stats['overloaded'] += 1
+            return 529, self.error('overloaded_error', 'Mock overload')
+
+        message = self.build_message(body)
+        usage = message['usage']
+        time.sleep(max(0.0, (self.latency + self.latency_per_token * usage['output_tokens']) * (1 + noise)))
+        with self.lock:
+            self.stats['succeeded'] += 1
+            for field in ('input_tokens', 'output_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens'):
+                self.stats[field] += usage[field]
+        return 200, message
+
+    def create_batch(self, body: Dict) -> Dict:
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        with self.lock:
+            self.request_count += 1
+            self.batches[batch_id] = {
+                'created': time.time(),
+                'requests': body.get('requests', []),
+            }
+        return self.batch_object(batch_id)
+
+    def batch_object(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        ended = time.time() - batch['created'] >= self.batch_delay
+        n = len(batch['requests'])
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else n,
+                'succeeded': n if ended else 0,
+                'errored': 0, 'canceled': 0, 'expired': 0,
+            },
+            'created_at': _iso(batch['created']),
+            'expires_at': _iso(batch['created'] + timedelta(days=1).total_seconds()),
+            'ended_at': _iso(time.time()) if ended else None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def batch_results(self, batch_id: str) -> bytes:
+        lines = []
+        for request in self.batches[batch_id]['requests']:
+            lines.append(json.dumps({
+                'custom_id': request['custom_id'],
+                'result': {'type': 'succeeded', 'message': self.build_message(request['params'])},
+            }))
+        return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Anthropic Messages API")
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Bind port (default: 8765)')
+    parser.add_argument('--batch-delay', type=float, default=5.0,
+                        help='Seconds until a batch reports ended (default: 5)')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Fixed seconds per message response (default: 0)')
+    parser.add_argument('--latency-per-token', type=float, default=0.0,
+                        help='Additional seconds per output token (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='Relative latency noise, e.g. 0.2 = ±20%% (default: 0)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0,
+                        help='Share of requests rejected with 429 (default: 0)')
+    parser.add_argument('--overload-rate', type=float, default=0.0,
+                        help='Share of requests rejected with 529 (default: 0)')
+    parser.add_argument('--retry-after', type=float, default=0.5,
+                        help='retry-after seconds on injected errors (default: 0.5)')
+    parser.add_argument('--glitch-rate', type=float, default=0.0,
+                        help='Share of responses with a formatting glitch (default: 0)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    server = MockAnthropicServer(
+        args.host, args.port, batch_delay=args.batch_delay,
+        latency=args.latency, latency_per_token=args.latency_per_token, jitter=args.jitter,
+        rate_limit_rate=args.rate_limit_rate, overload_rate=args.overload_rate,
+        retry_after=args.retry_after, glitch_rate=args.glitch_rate, seed=args.seed
+    )
+    print(f"🧪 Mock Anthropic API listening on {server.base_url}")
+    print(f"   export ANTHROPIC_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+# scripts/core/prefilter.py
+
+"""
+Local keyword pre-filter for AI-PRISMA screening
+
+Scores title + abstract of every paper with BM25 against inclusion terms
+(research question, search query and PRISMA inclusion criteria, or an
+explicit term list from config.yaml) and auto-excludes only clearly
+off-topic papers before any API call is made.
+
+Threshold policy (conservative):
+- Uncalibrated: exclude only papers matching none of the terms
+- Calibrated: papers already scored by the AI (auto-include or
+  human-review) give the score distribution of relevant papers; the
+  threshold is set so that recall_target of them would have been kept
+- Frozen: the first calibration is recorded and reused by later runs.
+  Once the filter is active, the AI only sees papers above the
+  threshold, so recalibrating on them would push the cutoff up on every
+  run and erode recall unnoticed
+- Never exclude more than max_exclude_fraction of the papers
+"""
+
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have
+having he her here hers how i if in into is it its itself just me more most my no nor not of off on
+once only or other our out over own same she should so some such than that the their them then there
+these they this those through to too under until up very was we were what when where which while who
+whom why will with would you your
+study studies paper research effect effects use using based among whether impact role
+""".split())
+
+# Minimum AI-scored relevant papers before the threshold is calibrated
+MIN_CALIBRATION_PAPERS = 20
+
+
+def stem(token: str) -> str:
+    """Light suffix stripping so "chatbots"/"chatbot" and "learning"/"learn" match"""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 5 and token.endswith('ing'):
+        return token[:-3]
+    if len(token) > 4 and token.endswith('ed'):
+        return token[:-2]
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords, stemmed"""
+    if not isinstance(text, str):
+        return []
+    return [stem(t) for t in re.findall(r'[a-z0-9]+', text.lower())
+            if len(t) > 1 and t not in STOPWORDS]
+
+
+def inclusion_terms(config: Dict, research_question: str) -> List[str]:
+    """
+    Query terms for the pre-filter
+
+    Uses ai_prisma_rubric.prefilter.inclusion_terms when given; otherwise
+    the research question, search_query and prisma.inclusion_criteria.
+
+    Args:
+        config: Parsed config.yaml
+        research_question: Research question passed to screening
+
+    Returns:
+        Unique stemmed terms
+    """
+    settings = config.get('ai_prisma_rubric', {}).get('prefilter', {}) or {}
+    if settings.get('inclusion_terms'):
+        sources = list(settings['inclusion_terms'])
+    else:
+        sources = [research_question, config.get('search_query', '') or '']
+        sources += config.get('prisma', {}).get('inclusion_criteria', []) or []
+
+    terms = []
+    for source in sources:
+        terms.extend(tokenize(str(source)))
+    return list(dict.fromkeys(terms))
+
+
+def bm25_scores(texts: Iterable[str], terms: List[str], k1: float = 1.5, b: float = 0.75) -> np.ndarray:
+    """
+    BM25 score of every text against a bag of query terms
+
+    Args:
+        texts: Documents (title + abstract)
+        terms: Stemmed query terms
+        k1: Term-frequency saturation
+        b: Length normalization
+
+    Returns:
+        Float array of scores (0 for documents matching no term)
+    """
+    term_set = set(terms)
+    doc_lengths = []
+    doc_counts = []
+    document_frequency = Counter()
+    for text in texts:
+        tokens = tokenize(text)
+        doc_lengths.append(len(tokens))
+        counts = Counter(t for t in tokens if t in term_set)
+        doc_counts.append(counts)
+        document_frequency.update(counts.keys())
+
+    n_docs = len(doc_lengths)
+    scores = np.zeros(n_docs)
+    if n_docs == 0:
+        return scores
+
+    avg_length = max(sum(doc_lengths) / n_docs, 1.0)
+    idf = {t: math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) for t, df in document_frequency.items()}
+    for i, (counts, length) in enumerate(zip(doc_counts, doc_lengths)):
+        norm = k1 * (1 - b + b * length / avg_length)
+        scores[i] = sum(idf[t] * tf * (k1 + 1) / (tf + norm) for t, tf in counts.items())
+    return scores
+
+
+class KeywordPrefilter:
+    """BM25 pre-filter that removes clearly off-topic papers before AI screening"""
+
+    def __init__(self, terms: List[str], recall_target: float = 0.99,
+                 max_exclude_fraction: float = 0.5, min_score: Optional[float] = None):
+        """
+        Args:
+            terms: Stemmed inclusion terms
+            recall_target: Share of known-relevant papers the calibrated threshold must keep
+            max_exclude_fraction: Upper bound on the share of papers excluded
+            min_score: Fixed threshold (papers scoring below are excluded); overrides calibration
+        """
+        self.terms = terms
+        self.recall_target = recall_target
+        self.max_exclude_fraction = max_exclude_fraction
+        self.min_score = min_score
+        self.threshold: Optional[float] = min_score
+        self.calibrated_on = 0
+        self.calibrated_at: Optional[str] = None
+        self.frozen = False
+
+    @staticmethod
+    def paper_texts(df: pd.DataFrame) -> pd.Series:
+        abstract = df['abstract'] if 'abstract' in df.columns else pd.Series('', index=df.index)
+        return df['title'].fillna('').astype(str) + ' ' + abstract.fillna('').astype(str)
+
+    def score(self, df: pd.DataFrame) -> np.ndarray:
+        """BM25 scores of the papers' title + abstract"""
+        return bm25_scores(self.paper_texts(df), self.terms)
+
+    def calibrate(self, scores: np.ndarray, relevant: np.ndarray) -> Optional[float]:
+        """
+        Set the threshold from AI-scored papers
+
+        Args:
+            scores: BM25 scores of all papers
+            relevant: Boolean mask of papers the AI scored as relevant
+                (auto-include or human-review)
+
+        Returns:
+            Calibrated threshold, or None if too few relevant papers
+        """
+        if self.min_score is not None or self.frozen or relevant.sum() < MIN_CALIBRATION_PAPERS:
+            return None
+        self.threshold = float(np.quantile(scores[relevant], 1 - self.recall_target))
+        self.calibrated_on = int(relevant.sum())
+        self.calibrated_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+        return self.threshold
+
+    def load_calibration(self, path: Path) -> bool:
+        """
+        Reuse (freeze) a threshold recorded by an earlier run
+
+        The record only applies to the same inclusion terms and recall
+        target; delete the file to recalibrate deliberately.
+
+        Args:
+            path: Calibration record written by save_calibration
+
+        Returns:
+            True if the recorded threshold is now in force
+        """
+        path = Path(path)
+        if self.min_score is not None or not path.exists():
+            return False
+        with open(path, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+        if record.get('terms') != self.terms or record.get('recall_target') != self.recall_target:
+            return False
+        self.threshold = record['threshold']
+        self.calibrated_on = record['calibrated_on']
+        self.calibrated_at = record.get('calibrated_at')
+        self.frozen = True
+        return True
+
+    def save_calibration(self, path: Path):
+        """Record the calibrated threshold so later runs keep it"""
+        record = {
+            'threshold': self.threshold,
+            'calibrated_on': self.calibrated_on,
+            'calibrated_at': self.calibrated_at,
+            'recall_target': self.recall_target,
+            'terms': self.terms,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+
+    def split(self, df: pd.DataFrame, scores: np.ndarray,
+              protected: Optional[np.ndarray] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Split papers into (to screen, pre-filter excluded)
+
+        Args:
+            df: Papers
+            scores: BM25 scores aligned with df
+            protected: Boolean mask of papers that must never be excluded
+                (e.g. already scored by the AI)
+
+        Returns:
+            (kept, excluded) DataFrames; excluded carries prefilter_score
+        """
+        if self.threshold is None:
+            exclude = scores <= 0
+        else:
+            exclude = scores < self.threshold
+        if protected is not None:
+            exclude &= ~protected
+
+        # Cap: only the lowest-scoring papers, at most max_exclude_fraction
+        max_excluded = int(len(df) * self.max_exclude_fraction)
+        if exclude.sum() > max_excluded:
+            candidates = np.flatnonzero(exclude)
+            keep_lowest = candidates[np.argsort(scores[candidates], kind='stable')[:max_excluded]]
+            exclude = np.zeros(len(df), dtype=bool)
+            exclude[keep_lowest] = True
+
+        excluded = df[exclude].copy()
+        excluded['prefilter_score'] = scores[exclude]
+        return df[~exclude], excluded
@@ -0,0 +1,250 @@
+# scripts/core/response_schema.py
+
+"""
+Schema validation and repair of AI-PRISMA screening responses
+
+A response is decoded leniently (markdown fences, prose around the
+JSON, trailing commas, typographic quotes) and then checked against the
+rubric schema. The field checks are compiled once into a flat list,
+so validating a response costs a few dictionary lookups.
+
+Glitches with an unambiguous fix are repaired locally:
+- scores given as strings ("8", "+5", "-10 (excluded)") are parsed
+- scores outside their range are clamped; title_bonus snaps to 0 or 10
+- total_score missing or different from the sum of the scores is recomputed
+- evidence_quotes given as one string becomes a one-element list
+- reasoning missing becomes an empty string
+
+Fields that cannot be repaired (a missing or unreadable score) are
+returned as missing, so the caller can ask the model for those fields
+only instead of re-screening the paper.
+
+Compact mode asks for the result through a forced tool call with a
+minimal schema (integer scores, short reasoning, evidence as numbers of
+the abstract's sentences) and expands it into the regular result.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Rubric dimensions: (min, max) points
+SCORE_RANGES = {
+    'domain': (0, 10),
+    'intervention': (0, 10),
+    'method': (0, 5),
+    'outcomes': (0, 10),
+    'exclusion': (-20, 0),
+    'title_bonus': (0, 10),
+}
+
+_FENCE = re.compile(r'```(?:json|JSON)?\s*(.*?)```', re.S)
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_NUMBER = re.compile(r'[-+]?\d+(?:\.\d+)?')
+_SMART_QUOTES = str.maketrans({'“': '"', '”': '"', '„': '"', '‘': "'", '’': "'"})
+
+
+def decode_json(text: str) -> Any:
+    """
+    Decode the first JSON object or array in a model response
+
+    Args:
+        text: Response text (may contain fences or prose around the JSON)
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If no JSON value can be decoded
+    """
+    text = text.strip()
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+
+    starts = [i for i in (text.find('{'), text.find('[')) if i >= 0]
+    if not starts:
+        raise ValueError('No JSON object in response')
+    text = text[min(starts):]
+
+    decoder = json.JSONDecoder()
+    try:
+        return decoder.raw_decode(text)[0]
+    except ValueError:
+        pass
+    repaired = _TRAILING_COMMA.sub(r'\1', text.translate(_SMART_QUOTES))
+    return decoder.raw_decode(repaired)[0]
+
+
+def _coerce_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        match = _NUMBER.search(value)
+        if match:
+            return float(match.group())
+    return None
+
+
+class ResponseSchema:
+    """Compiled validator for one screening result object"""
+
+    def __init__(self, score_ranges: Dict[str, Tuple[int, int]] = SCORE_RANGES):
+        """
+        Args:
+            score_ranges: Rubric dimension → (min, max) points
+        """
+        self.score_fields = [(name, low, high) for name, (low, high) in score_ranges.items()]
+
+    def validate(self, item: Any) -> Tuple[Dict[str, Any], List[str], int]:
+        """
+        Repair a decoded result in place and report what is still missing
+
+        Args:
+            item: Decoded JSON value for one paper
+
+        Returns:
+            (result, missing field paths such as "scores.method", number of repairs)
+        """
+        if not isinstance(item, dict):
+            return {}, ['scores.' + name for name, _, _ in self.score_fields] + ['reasoning'], 0
+
+        repairs = 0
+        missing = []
+        scores = item.get('scores')
+        if not isinstance(scores, dict):
+            scores = {}
+            item['scores'] = scores
+
+        for name, low, high in self.score_fields:
+            value = _coerce_number(scores.get(name))
+            if value is None:
+                missing.append(f'scores.{name}')
+                continue
+            fixed = int(round(min(max(value, low), high)))
+            if name == 'title_bonus':
+                fixed = high if fixed >= (low + high) / 2 else low
+            if fixed != scores[name]:
+                scores[name] = fixed
+                repairs += 1
+
+        if not missing:
+            total = sum(scores[name] for name, _, _ in self.score_fields)
+            if item.get('total_score') != total:
+                item['total_score'] = total
+                repairs += 1
+
+        quotes = item.get('evidence_quotes')
+        if isinstance(quotes, str):
+            item['evidence_quotes'] = [quotes]
+            repairs += 1
+        elif not isinstance(quotes, list):
+            item['evidence_quotes'] = []
+
+        if not isinstance(item.get('reasoning'), str):
+            item['reasoning'] = '' if item.get('reasoning') is None else str(item['reasoning'])
+            repairs += 1
+
+        return item, missing, repairs
+
+    def merge(self, item: Dict[str, Any], completion: Any, missing: List[str]):
+        """
+        Copy re-asked fields from a follow-up answer into a result
+
+        Args:
+            item: Result with missing fields
+            completion: Decoded follow-up answer ({"scores": {...}} or flat {"method": 3})
+            missing: Field paths that were asked for
+        """
+        if not isinstance(completion, dict):
+            return
+        scores = completion.get('scores') if isinstance(completion.get('scores'), dict) else completion
+        for path in missing:
+            if path.startswith('scores.'):
+                name = path.split('.', 1)[1]
+                if name in scores:
+                    item.setdefault('scores', {})[name] = scores[name]
+            elif path in completion:
+                item[path] = completion[path]
+
+
+def compact_tool(score_ranges: Dict[str, Tuple[int, int]] = SCORE_RANGES) -> Dict[str, Any]:
+    """
+    Tool definition for compact screening output
+
+    Args:
+        score_ranges: Rubric dimension → (min, max) points
+
+    Returns:
+        Messages API tool (use with tool_choice forcing it)
+    """
+    return {
+        'name': 'record_screening',
+        'description': 'Record the rubric scores for the paper.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                's': {
+                    'type': 'object',
+                    'description': 'Scores: ' + ', '.join(f'{name} {low}..{high}' for name, (low, high) in score_ranges.items()),
+                    'properties': {
+                        name: {'type': 'integer', 'minimum': low, 'maximum': high}
+                        for name, (low, high) in score_ranges.items()
+                    },
+                    'required': list(score_ranges),
+                    'additionalProperties': False,
+                },
+                'r': {'type': 'string', 'description': 'Reasoning, at most 25 words'},
+                'e': {
+                    'type': 'array',
+                    'description': 'Numbers of the abstract sentences supporting the scores',
+                    'items': {'type': 'integer', 'minimum': 1},
+                },
+            },
+            'required': ['s', 'r', 'e'],
+            'additionalProperties': False,
+        },
+    }
+
+
+def expand_compact(tool_input: Any, sentences: List[str]) -> Dict[str, Any]:
+    """
+    Regular result dictionary from a compact tool call
+
+    Evidence sentence numbers are resolved to the sentences themselves;
+    numbers outside the abstract are kept in evidence_invalid.
+
+    Args:
+        tool_input: Input of the record_screening tool call
+        sentences: The abstract's sentences as numbered in the prompt
+
+    Returns:
+        Result with scores, reasoning, evidence_quotes, evidence_invalid
+    """
+    if not isinstance(tool_input, dict):
+        return {}
+    quotes, invalid = [], []
+    evidence = tool_input.get('e') or []
+    for number in evidence if isinstance(evidence, list) else [evidence]:
+        index = _coerce_number(number)
+        if index is not None and 1 <= index <= len(sentences) and index == int(index):
+            quotes.append(sentences[int(index) - 1])
+        else:
+            invalid.append(number)
+    return {
+        'scores': tool_input.get('s') if isinstance(tool_input.get('s'), dict) else {},
+        'reasoning': tool_input.get('r'),
+        'evidence_quotes': quotes,
+        'evidence_invalid': invalid,
+    }
+
+
+def followup_prompt(missing: List[str]) -> str:
+    """User message asking only for the missing fields of the previous answer"""
+    names = ', '.join(f'"{path}"' for path in missing)
+    return (f"Your previous answer is missing or has unreadable values for: {names}. "
+            f"Reply with only a JSON object containing those fields "
+            f"(scores as {{\"scores\": {{\"<dimension>\": <integer>}}}}), nothing else.")
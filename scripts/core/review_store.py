@@ -0,0 +1,390 @@
+# scripts/core/review_store.py
+
+"""
+SQLite store of human review decisions (Stage 3b)
+
+One row per (paper, reviewer), committed as soon as the reviewer decides,
+so recording a decision is one small write no matter how many papers were
+reviewed before, and resuming a session only reads indexed keys.
+
+Several reviewers can work on one project at the same time. Each session
+claims a batch of papers from the shared queue with a single INSERT ...
+SELECT statement, which SQLite applies atomically, so two sessions never
+get the same paper without any locking in the scripts. Claims are leases:
+papers of a session that died go back to the queue when the lease runs
+out. With dual review a paper needs two independent decisions; a 1-1
+split is queued once more for a tie-breaking review.
+
+human_review_decisions.csv (one merged row per paper, majority decision)
+and human_review_by_reviewer.csv are exported from the store on demand.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+
+# Seconds a claimed paper stays reserved for its reviewer (renewed on every decision)
+DEFAULT_CLAIM_SECONDS = 30 * 60
+
+_DECISIONS_TABLE = (
+    'CREATE TABLE {if_not_exists}review_decisions ('
+    ' paper_id TEXT NOT NULL,'
+    ' reviewer TEXT NOT NULL,'
+    ' human_decision TEXT NOT NULL,'
+    ' reviewed_at TEXT NOT NULL,'
+    ' record TEXT NOT NULL,'
+    ' updated_at REAL NOT NULL,'
+    ' PRIMARY KEY (paper_id, reviewer))'
+)
+
+# Decisions per queued paper so far (join as d; NULL counts for undecided papers)
+_DECISION_COUNTS = (
+    "SELECT paper_id,"
+    " SUM(human_decision = 'include') AS includes,"
+    " SUM(human_decision = 'exclude') AS excludes"
+    " FROM review_decisions GROUP BY paper_id"
+)
+
+_DECIDED = "(IFNULL(d.includes, 0) + IFNULL(d.excludes, 0))"
+
+# Reviews a paper needs: its reviews_needed, or one more after a tie
+_TARGET_REVIEWS = (
+    f"CASE WHEN IFNULL(d.includes, 0) = IFNULL(d.excludes, 0) AND {_DECIDED} > 0"
+    f" THEN {_DECIDED} + 1 ELSE q.reviews_needed END"
+)
+
+
+def _json_default(value):
+    """Serialize numpy scalars (pandas row values) as plain Python values"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class ReviewStore:
+    """Per-reviewer human review decisions and the shared claim queue"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Database file (e.g. data/02_screening/human_review.sqlite3)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=FULL')
+        self._migrate()
+        self.conn.execute(_DECISIONS_TABLE.format(if_not_exists='IF NOT EXISTS '))
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS review_queue ('
+            ' paper_id TEXT PRIMARY KEY,'
+            ' position INTEGER NOT NULL,'
+            ' reviews_needed INTEGER NOT NULL DEFAULT 1)'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS review_claims ('
+            ' paper_id TEXT NOT NULL,'
+            ' reviewer TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' PRIMARY KEY (paper_id, reviewer))'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS review_claims_reviewer ON review_claims (reviewer)')
+        self.conn.commit()
+
+    def _migrate(self):
+        """Move single-reviewer decisions (keyed by paper_id only) to the per-reviewer table"""
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(review_decisions)')]
+        if not columns or 'reviewer' in columns:
+            return
+        self.conn.execute('ALTER TABLE review_decisions RENAME TO review_decisions_single')
+        self.conn.execute(_DECISIONS_TABLE.format(if_not_exists=''))
+        self.conn.execute(
+            "INSERT INTO review_decisions SELECT paper_id, '', human_decision, reviewed_at, record, updated_at"
+            " FROM review_decisions_single"
+        )
+        self.conn.execute('DROP TABLE review_decisions_single')
+        self.conn.commit()
+
+    def enqueue(self, paper_ids: Iterable[str], reviews_needed: int = 1):
+        """
+        Add papers to the shared review queue (papers already queued keep their place)
+
+        Args:
+            paper_ids: Paper keys in review order
+            reviews_needed: Independent decisions per paper (2 = dual review);
+                never lowers what an earlier session asked for
+        """
+        with self.lock:
+            start = self.conn.execute('SELECT COALESCE(MAX(position), -1) + 1 FROM review_queue').fetchone()[0]
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO review_queue (paper_id, position, reviews_needed) VALUES (?, ?, ?)',
+                [(paper_id, start + i, reviews_needed) for i, paper_id in enumerate(paper_ids)]
+            )
+            self.conn.execute(
+                'UPDATE review_queue SET reviews_needed = ? WHERE reviews_needed < ?',
+                (reviews_needed, reviews_needed)
+            )
+            self.conn.commit()
+
+    def claim(self, reviewer: str, n: int, claim_seconds: float = DEFAULT_CLAIM_SECONDS) -> List[str]:
+        """
+        Claim up to n more papers for a reviewer
+
+        A paper is claimable while its decisions plus live claims by other
+        reviewers are fewer than the reviews it needs, and this reviewer has
+        not decided it yet. The claim is a single statement, so concurrent
+        sessions never over-assign a paper.
+
+        Args:
+            reviewer: Reviewer name
+            n: Papers to add to the reviewer's open claims
+            claim_seconds: Lease length
+
+        Returns:
+            All papers currently claimed by the reviewer, in queue order
+        """
+        now = time.time()
+        with self.lock:
+            self.conn.execute('DELETE FROM review_claims WHERE expires_at <= ?', (now,))
+            self.conn.execute(
+                'INSERT INTO review_claims (paper_id, reviewer, expires_at)'
+                ' SELECT q.paper_id, :reviewer, :expires_at'
+                ' FROM review_queue q'
+                f' LEFT JOIN ({_DECISION_COUNTS}) d ON d.paper_id = q.paper_id'
+                ' WHERE NOT EXISTS (SELECT 1 FROM review_decisions r'
+                '                   WHERE r.paper_id = q.paper_id AND r.reviewer = :reviewer)'
+                '   AND NOT EXISTS (SELECT 1 FROM review_claims c'
+                '                   WHERE c.paper_id = q.paper_id AND c.reviewer = :reviewer)'
+                f'   AND {_DECIDED} + (SELECT COUNT(*) FROM review_claims c WHERE c.paper_id = q.paper_id)'
+                f'       < {_TARGET_REVIEWS}'
+                ' ORDER BY q.position LIMIT :n',
+                {'reviewer': reviewer, 'expires_at': now + claim_seconds, 'n': n}
+            )
+            self.conn.commit()
+            rows = self.conn.execute(
+                'SELECT c.paper_id FROM review_claims c JOIN review_queue q ON q.paper_id = c.paper_id'
+                ' WHERE c.reviewer = ? ORDER BY q.position',
+                (reviewer,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def release(self, reviewer: str):
+        """Return all of a reviewer's open claims to the queue"""
+        with self.lock:
+            self.conn.execute('DELETE FROM review_claims WHERE reviewer = ?', (reviewer,))
+            self.conn.commit()
+
+    def record(self, paper_id: str, reviewer: str, record: Dict,
+               claim_seconds: float = DEFAULT_CLAIM_SECONDS):
+        """
+        Store one decision and commit it (a re-review by the same reviewer replaces it)
+
+        Also drops the reviewer's claim on the paper and renews the lease on
+        the rest of their batch.
+
+        Args:
+            paper_id: Paper key used by 03b_human_review.py
+            reviewer: Reviewer name
+            record: Full decision row (exported as one CSV row)
+            claim_seconds: New lease length for the reviewer's other claims
+        """
+        payload = json.dumps(record, default=_json_default, ensure_ascii=False)
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO review_decisions'
+                ' (paper_id, reviewer, human_decision, reviewed_at, record, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (paper_id, reviewer, record['human_decision'], record['reviewed_at'], payload, now)
+            )
+            self.conn.execute(
+                'DELETE FROM review_claims WHERE paper_id = ? AND reviewer = ?', (paper_id, reviewer)
+            )
+            self.conn.execute(
+                'UPDATE review_claims SET expires_at = ? WHERE reviewer = ?', (now + claim_seconds, reviewer)
+            )
+            self.conn.commit()
+
+    def rekey(self, mapping: Dict[str, str]) -> int:
+        """
+        Rename paper keys, e.g. legacy title_year keys to screening paper_ids
+
+        Keys already present under their new name are left as they are.
+
+        Args:
+            mapping: Old key → new key
+
+        Returns:
+            Number of decisions renamed
+        """
+        pairs = [(new, old) for old, new in mapping.items() if old != new]
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "UPDATE OR IGNORE review_decisions SET paper_id = ?1, record = json_set(record, '$.paper_id', ?1)"
+                ' WHERE paper_id = ?2',
+                pairs
+            )
+            renamed = self.conn.total_changes - before
+            self.conn.executemany('UPDATE OR IGNORE review_queue SET paper_id = ? WHERE paper_id = ?', pairs)
+            self.conn.executemany('UPDATE OR IGNORE review_claims SET paper_id = ? WHERE paper_id = ?', pairs)
+            self.conn.commit()
+        return renamed
+
+    def import_records(self, df: pd.DataFrame, reviewer: str = '') -> int:
+        """
+        Import decisions from an earlier human_review_decisions.csv
+
+        Args:
+            df: Decision rows with a paper_id column
+            reviewer: Reviewer to attribute them to
+
+        Returns:
+            Number of rows imported (decisions already in the store are kept)
+        """
+        rows = []
+        for record in df.to_dict('records'):
+            payload = json.dumps(record, default=_json_default, ensure_ascii=False)
+            rows.append((str(record['paper_id']), reviewer, str(record.get('human_decision', '')),
+                         str(record.get('reviewed_at', '')), payload, time.time()))
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO review_decisions'
+                ' (paper_id, reviewer, human_decision, reviewed_at, record, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            self.conn.commit()
+            return self.conn.total_changes - before
+
+    def reviewed_ids(self, reviewer: Optional[str] = None) -> Set[str]:
+        """Paper IDs with a decision (by anyone, or by one reviewer)"""
+        with self.lock:
+            if reviewer is None:
+                rows = self.conn.execute('SELECT DISTINCT paper_id FROM review_decisions')
+            else:
+                rows = self.conn.execute('SELECT paper_id FROM review_decisions WHERE reviewer = ?', (reviewer,))
+            return {row[0] for row in rows}
+
+    def decisions(self) -> pd.DataFrame:
+        """All decisions of all reviewers in review order, with a reviewer column"""
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT reviewer, record FROM review_decisions ORDER BY reviewed_at, rowid'
+            ).fetchall()
+        return pd.DataFrame([dict(json.loads(record), reviewer=reviewer) for reviewer, record in rows])
+
+    def incomplete_ids(self) -> Set[str]:
+        """Queued papers with some decisions but fewer than they need (second review or tie-break pending)"""
+        with self.lock:
+            rows = self.conn.execute(
+                f'SELECT q.paper_id FROM review_queue q JOIN ({_DECISION_COUNTS}) d ON d.paper_id = q.paper_id'
+                f' WHERE {_DECIDED} < {_TARGET_REVIEWS}'
+            )
+            return {row[0] for row in rows}
+
+    def merged_decisions(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        One row per paper with a final (majority) decision
+
+        The row is the latest decision agreeing with the majority, plus
+        n_reviews, reviewers and reviewers_agree. Queued papers are left out
+        until they have all the reviews they need, so with dual review a
+        paper with one decision is not final, and a tie waits for its
+        tie-breaking review.
+
+        Args:
+            df: Output of decisions() (read from the store if None)
+
+        Returns:
+            DataFrame in review order
+        """
+        df = self.decisions() if df is None else df
+        if not df.empty:
+            df = df[~df['paper_id'].astype(str).isin(self.incomplete_ids())]
+        if df.empty:
+            return df
+        includes = (df['human_decision'] == 'include').groupby(df['paper_id']).transform('sum')
+        n_reviews = df.groupby('paper_id')['human_decision'].transform('size')
+        majority = pd.Series('include', index=df.index).where(includes * 2 > n_reviews, 'exclude')
+        tie = includes * 2 == n_reviews
+
+        df = df.assign(
+            n_reviews=n_reviews,
+            reviewers=df.groupby('paper_id')['reviewer'].transform(lambda r: ';'.join(r.astype(str))),
+            reviewers_agree=(includes == 0) | (includes == n_reviews),
+        )
+        chosen = df[~tie & (df['human_decision'] == majority)]
+        return chosen.drop_duplicates('paper_id', keep='last').drop(columns='reviewer').reset_index(drop=True)
+
+    def status(self) -> Dict:
+        """Queue progress and per-reviewer counts across all sessions"""
+        now = time.time()
+        with self.lock:
+            queued = self.conn.execute('SELECT COUNT(*) FROM review_queue').fetchone()[0]
+            done, ties = self.conn.execute(
+                'SELECT'
+                f' IFNULL(SUM({_DECIDED} >= {_TARGET_REVIEWS}), 0),'
+                ' IFNULL(SUM(d.includes = d.excludes AND d.includes > 0), 0)'
+                f' FROM review_queue q JOIN ({_DECISION_COUNTS}) d ON d.paper_id = q.paper_id'
+            ).fetchone()
+            decisions = dict(self.conn.execute(
+                'SELECT reviewer, COUNT(*) FROM review_decisions GROUP BY reviewer'
+            ).fetchall())
+            claims = dict(self.conn.execute(
+                'SELECT reviewer, COUNT(*) FROM review_claims WHERE expires_at > ? GROUP BY reviewer', (now,)
+            ).fetchall())
+        return {
+            'queued': queued,
+            'completed': done,
+            'awaiting_tie_break': ties,
+            'reviewers': {
+                reviewer: {'decisions': decisions.get(reviewer, 0), 'claimed': claims.get(reviewer, 0)}
+                for reviewer in sorted(set(decisions) | set(claims))
+            },
+        }
+
+    def export_csv(self, path: Path, by_reviewer_path: Optional[Path] = None) -> int:
+        """
+        Write the merged decisions (and optionally every reviewer's rows) as CSV
+
+        Files are replaced atomically, so concurrent sessions can export at
+        any time.
+
+        Args:
+            path: Merged output (e.g. human_review_decisions.csv)
+            by_reviewer_path: Per-reviewer output (e.g. human_review_by_reviewer.csv)
+
+        Returns:
+            Number of papers with a final decision
+        """
+        df = self.decisions()
+        if df.empty:
+            return 0
+        merged = self.merged_decisions(df)
+        for table, target in ((merged, path), (df, by_reviewer_path)):
+            if target is None:
+                continue
+            tmp = Path(f"{target}.{os.getpid()}.tmp")
+            table.to_csv(tmp, index=False)
+            os.replace(tmp, target)
+        return len(merged)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM review_decisions').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,117 @@
+# scripts/core/screening_cache.py
+
+"""
+Content-addressed cache of AI-PRISMA screening responses
+
+Responses are keyed by a hash of (system prompt, research question, title,
+abstract, model, request format), so re-runs and overlapping projects on
+the same machine skip the API for papers that were already scored. The
+raw model response text is stored; decisions are re-derived from it with
+the current thresholds, which are kept out of the system prompt, so
+changing thresholds never needs a re-screen.
+
+The cache is a single SQLite database in WAL mode, safe to share between
+concurrent screening processes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+def default_cache_path() -> Path:
+    """Machine-wide cache location ($SCHOLARAG_CACHE_DIR or ~/.cache/scholarag)"""
+    cache_dir = os.getenv('SCHOLARAG_CACHE_DIR') or Path.home() / '.cache' / 'scholarag'
+    return Path(cache_dir) / 'screening_cache.sqlite3'
+
+
+def screening_cache_key(system_prompt: str, research_question: str, title: str, abstract: str, model: str,
+                        request_format: str = 'json') -> str:
+    """
+    Content hash identifying one screening request
+
+    Args:
+        system_prompt: Rubric system prompt
+        research_question: Research question
+        title: Paper title
+        abstract: Paper abstract
+        model: Model name
+        request_format: Answer format ('json', or the compact tool schema), so
+            compact answers are never served to full-JSON runs
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [system_prompt, research_question, str(title).strip(), str(abstract).strip(), model, request_format],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ScreeningCache:
+    """SQLite-backed map from screening_cache_key to model response text"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: Database file (default: default_cache_path())
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS screening_results ('
+            ' key TEXT PRIMARY KEY,'
+            ' model TEXT NOT NULL,'
+            ' response TEXT NOT NULL,'
+            ' created_at REAL NOT NULL)'
+        )
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response text for key, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT response FROM screening_results WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response (last write wins)"""
+        with self.lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO screening_results (key, model, response, created_at) VALUES (?, ?, ?, ?)',
+                (key, model, response, time.time())
+            )
+            self.conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        """Membership test that does not count as a hit or miss"""
+        with self.lock:
+            return self.conn.execute(
+                'SELECT 1 FROM screening_results WHERE key = ?', (key,)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM screening_results').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,238 @@
+# scripts/core/screening_journal.py
+
+"""
+Append-only screening checkpoint journal keyed by canonical paper ID
+
+Results are appended as JSON lines to <name>.jsonl; <name>.index holds one
+"paper_id<TAB>byte offset" line per appended record, so resuming only
+reads the (small) index to learn which papers are done. A re-screened
+paper simply gets a newer record; the index points at the latest one.
+
+Every record is written (and flushed to the OS) as soon as it is
+appended, so a crashed process loses nothing. fsync is group-committed:
+the journal is synced once fsync_every records have accumulated, and a
+timer armed by the first unsynced record syncs it fsync_interval seconds
+later even if no further record arrives (a long backoff, a drained
+queue). A power loss therefore takes at most the records of the last
+fsync_interval seconds (plus the fsync itself), without paying one fsync
+per result. sync()/close() force it.
+
+If a run dies between the journal and the index write, the journal tail
+beyond the last indexed offset is re-indexed on open; index entries
+pointing past the end of the journal (index synced, journal not) are
+dropped.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+
+# Group commit: fsync after this many records or seconds, whichever comes first
+DEFAULT_FSYNC_EVERY = 50
+DEFAULT_FSYNC_INTERVAL = 0.2
+
+
+class ScreeningJournal:
+    """Append-only JSONL journal of screening results with a paper_id index"""
+
+    def __init__(self, path: Path, fsync_every: int = DEFAULT_FSYNC_EVERY,
+                 fsync_interval: float = DEFAULT_FSYNC_INTERVAL):
+        """
+        Args:
+            path: Journal file (.jsonl); the index is stored next to it (.index)
+            fsync_every: Sync after this many unsynced records
+            fsync_interval: Sync when the oldest unsynced record is this many seconds old
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix('.index')
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.offsets: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.unsynced = 0
+        self.sync_timer: Optional[threading.Timer] = None
+        self.data_file = None
+        self.index_file = None
+        self._load_index()
+
+    def _load_index(self):
+        data_end = 0
+        if self.path.exists():
+            # Drop a torn final record so the next append starts on a fresh line
+            with open(self.path, 'rb+') as f:
+                data_end = f.seek(0, os.SEEK_END)
+                if data_end > 0:
+                    f.seek(data_end - 1)
+                    if f.read(1) != b'\n':
+                        f.seek(0)
+                        data_end = f.read().rfind(b'\n') + 1
+                        f.truncate(data_end)
+
+        indexed_end = 0
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    paper_id, _, offset = line.rstrip('\n').partition('\t')
+                    if not offset:
+                        continue  # Torn last line
+                    if int(offset) >= data_end:
+                        continue  # Record lost with an unsynced journal tail
+                    self.offsets[paper_id] = int(offset)
+                    indexed_end = max(indexed_end, int(offset))
+
+        if not self.path.exists():
+            return
+
+        # Re-index records written after the last indexed one (crash recovery)
+        missing = []
+        with open(self.path, 'rb') as f:
+            f.seek(indexed_end)
+            offset = indexed_end
+            for line in f:
+                if offset > indexed_end or not self.offsets:
+                    try:
+                        record = json.loads(line)
+                        missing.append((record['paper_id'], offset))
+                    except (ValueError, KeyError):
+                        pass
+                offset += len(line)
+        if missing:
+            self._write_index(missing)
+
+    def _write_index(self, entries: List):
+        if self.index_file is None:
+            self.index_file = open(self.index_path, 'a', encoding='utf-8')
+        for paper_id, offset in entries:
+            self.index_file.write(f"{paper_id}\t{offset}\n")
+            self.offsets[paper_id] = offset
+        self.index_file.flush()
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self.offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def done_ids(self) -> Set[str]:
+        """Paper IDs with at least one recorded result"""
+        return set(self.offsets)
+
+    def append(self, records: Iterable[Dict]):
+        """
+        Append results (each must carry a paper_id)
+
+        The records reach the OS immediately; fsync follows the group
+        commit policy (fsync_every records, or a timer fsync_interval
+        seconds after the first unsynced record).
+
+        Args:
+            records: Result rows as dictionaries
+        """
+        records = list(records)
+        if not records:
+            return
+
+        lines = [(json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+                 for record in records]
+        with self.lock:
+            if self.data_file is None:
+                self.data_file = open(self.path, 'ab')
+            offset = self.data_file.tell()
+            entries = []
+            for record, line in zip(records, lines):
+                entries.append((record['paper_id'], offset))
+                offset += len(line)
+            self.data_file.write(b''.join(lines))
+            self.data_file.flush()
+            self._write_index(entries)
+
+            self.unsynced += len(records)
+            if self.unsynced >= self.fsync_every:
+                self._sync()
+            elif self.sync_timer is None:
+                self.sync_timer = threading.Timer(self.fsync_interval, self._timed_sync)
+                self.sync_timer.daemon = True
+                self.sync_timer.start()
+
+    def _timed_sync(self):
+        with self.lock:
+            if self.unsynced:
+                self._sync()
+
+    def _sync(self):
+        # Journal before index: an index entry must never outlive its record
+        if self.data_file is not None:
+            os.fsync(self.data_file.fileno())
+        if self.index_file is not None:
+            os.fsync(self.index_file.fileno())
+        self.unsynced = 0
+        if self.sync_timer is not None:
+            self.sync_timer.cancel()
+            self.sync_timer = None
+
+    def sync(self):
+        """fsync all appended records now"""
+        with self.lock:
+            if self.unsynced:
+                self._sync()
+
+    def close(self):
+        """Sync and close the journal files (a later append reopens them)"""
+        with self.lock:
+            if self.unsynced:
+                self._sync()
+            for f in (self.data_file, self.index_file):
+                if f is not None:
+                    f.close()
+            self.data_file = self.index_file = None
+
+    def __enter__(self) -> 'ScreeningJournal':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read(self, paper_ids: Iterable[str]) -> List[Dict]:
+        """
+        Latest records for the given papers (seeks by index, no full scan)
+
+        Args:
+            paper_ids: Paper IDs to read (unknown IDs are skipped)
+
+        Returns:
+            List of result records
+        """
+        offsets = sorted(self.offsets[p] for p in paper_ids if p in self.offsets)
+        records = []
+        if offsets:
+            with open(self.path, 'rb') as f:
+                for offset in offsets:
+                    f.seek(offset)
+                    records.append(json.loads(f.readline()))
+        return records
+
+    def load(self) -> pd.DataFrame:
+        """
+        Latest result for every paper
+
+        Returns:
+            DataFrame indexed by paper_id
+        """
+        live = set(self.offsets.values())
+        records = []
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    if offset in live:
+                        records.append(json.loads(line))
+                    offset += len(line)
+
+        if not records:
+            return pd.DataFrame(columns=['paper_id']).set_index('paper_id')
+        return pd.DataFrame.from_records(records).set_index('paper_id')
@@ -0,0 +1,185 @@
+# scripts/core/screening_scheduler.py
+
+"""
+Prioritized AI-PRISMA screening queue with active learning
+
+Papers are screened in rounds, most-likely-relevant first:
+1. Cold start: BM25 score against the inclusion terms (core.prefilter)
+2. After each round a logistic model over hashed title/abstract words
+   (plus the BM25 prior) is refit on the AI decisions so far
+3. Optional stopping rule: because the queue is ordered by estimated
+   relevance, the relevant rate of the last round bounds the rate in
+   the unscreened tail; screening stops once
+   found / (found + last_round_rate * unscreened) >= recall_target
+
+"Relevant" means the AI scored the paper auto-include or human-review.
+"""
+
+import zlib
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.prefilter import tokenize
+
+
+RELEVANT_DECISIONS = ('auto-include', 'human-review')
+
+
+def hashed_features(texts: pd.Series, n_features: int) -> List[np.ndarray]:
+    """
+    Unique hashed word and word-bigram feature ids per text
+
+    Args:
+        texts: Documents
+        n_features: Hash space size
+
+    Returns:
+        List of int arrays (one per document)
+    """
+    features = []
+    for text in texts:
+        tokens = tokenize(text)
+        grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        ids = {zlib.crc32(g.encode('utf-8')) % n_features for g in grams}
+        features.append(np.fromiter(ids, dtype=np.int64, count=len(ids)))
+    return features
+
+
+class RelevanceModel:
+    """Logistic regression over hashed features plus a standardized prior score"""
+
+    def __init__(self, features: List[np.ndarray], prior: np.ndarray, n_features: int,
+                 learning_rate: float = 0.1, l2: float = 1e-4):
+        self.features = features
+        self.n_features = n_features
+        self.learning_rate = learning_rate
+        self.l2 = l2
+
+        std = prior.std()
+        self.prior = (prior - prior.mean()) / std if std > 0 else np.zeros(len(prior))
+        self.weights = np.zeros(n_features)
+        self.prior_weight = 1.0
+        self.bias = 0.0
+
+        # Flattened features for vectorized scoring of all documents
+        lengths = np.array([len(f) for f in features], dtype=np.int64)
+        self.flat = np.concatenate(features) if features else np.zeros(0, dtype=np.int64)
+        self.doc_of_feature = np.repeat(np.arange(len(features)), lengths)
+
+    def logits(self) -> np.ndarray:
+        """Relevance logit of every document"""
+        text_scores = np.bincount(self.doc_of_feature, weights=self.weights[self.flat], minlength=len(self.features))
+        return text_scores + self.prior_weight * self.prior + self.bias
+
+    def fit(self, positions: np.ndarray, labels: np.ndarray, epochs: int = 5, seed: int = 0):
+        """
+        SGD on the labelled documents (positives up-weighted to balance classes)
+
+        Args:
+            positions: Document positions with AI labels
+            labels: 1 = relevant, 0 = not relevant
+        """
+        n_pos = labels.sum()
+        n_neg = len(labels) - n_pos
+        if n_pos == 0 or n_neg == 0:
+            return
+        pos_weight = n_neg / n_pos
+        rng = np.random.default_rng(seed)
+
+        for _ in range(epochs):
+            for i in rng.permutation(len(positions)):
+                doc, y = positions[i], labels[i]
+                idx = self.features[doc]
+                logit = self.weights[idx].sum() + self.prior_weight * self.prior[doc] + self.bias
+                p = 1.0 / (1.0 + np.exp(-logit))
+                g = (p - y) * (pos_weight if y else 1.0) * self.learning_rate
+                self.weights[idx] -= g + self.learning_rate * self.l2 * self.weights[idx]
+                self.prior_weight -= g * self.prior[doc]
+                self.bias -= g
+
+
+class PriorityScheduler:
+    """Round-based screening order with an estimated-recall stopping rule"""
+
+    def __init__(self, texts: pd.Series, prior: np.ndarray, recall_target: Optional[float] = None,
+                 round_size: int = 200, min_screened_fraction: float = 0.1, n_features: int = 2 ** 18):
+        """
+        Args:
+            texts: Title + abstract of every paper
+            prior: Cold-start relevance score (e.g. BM25) aligned with texts
+            recall_target: Stop once estimated recall reaches this (None = never stop early)
+            round_size: Papers screened between model updates
+            min_screened_fraction: Never stop before this share has been screened
+            n_features: Hash space for word features
+        """
+        self.model = RelevanceModel(hashed_features(texts, n_features), np.asarray(prior, dtype=float), n_features)
+        self.recall_target = recall_target
+        self.round_size = round_size
+        self.min_screened_fraction = min_screened_fraction
+
+        self.n_papers = len(texts)
+        self.screened = np.zeros(self.n_papers, dtype=bool)
+        self.labels = np.zeros(self.n_papers, dtype=np.int8)
+        self.last_round_rate: Optional[float] = None
+        self.rounds = 0
+
+    @property
+    def found(self) -> int:
+        return int(self.labels[self.screened].sum())
+
+    @property
+    def remaining(self) -> int:
+        return int((~self.screened).sum())
+
+    def estimated_recall(self) -> Optional[float]:
+        """found / (found + estimated relevant papers left), None before the first round"""
+        if self.last_round_rate is None:
+            return None
+        expected_left = self.last_round_rate * self.remaining
+        total = self.found + expected_left
+        return self.found / total if total > 0 else 1.0
+
+    def record(self, positions: np.ndarray, relevant: np.ndarray, prioritized: bool = True):
+        """
+        Add AI decisions and refit the model
+
+        Args:
+            positions: Paper positions screened
+            relevant: Boolean relevance per position
+            prioritized: Positions came from next_round (updates the tail rate);
+                False for results from earlier runs in arbitrary order
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        relevant = np.asarray(relevant, dtype=bool)
+        if len(positions) == 0:
+            return
+        self.screened[positions] = True
+        self.labels[positions] = relevant
+        if prioritized:
+            self.last_round_rate = float(relevant.mean())
+            self.rounds += 1
+
+        labelled = np.flatnonzero(self.screened)
+        self.model.fit(labelled, self.labels[labelled].astype(float), seed=self.rounds)
+
+    def next_round(self) -> np.ndarray:
+        """Positions of the next round_size unscreened papers, most relevant first"""
+        candidates = np.flatnonzero(~self.screened)
+        if len(candidates) == 0:
+            return candidates
+        logits = self.model.logits()[candidates]
+        order = np.argsort(-logits, kind='stable')[:self.round_size]
+        return candidates[order]
+
+    def should_stop(self) -> bool:
+        """True once the estimated recall reaches recall_target"""
+        if self.remaining == 0:
+            return True
+        if self.recall_target is None or self.found == 0:
+            return False
+        if self.screened.mean() < self.min_screened_fraction:
+            return False
+        recall = self.estimated_recall()
+        return recall is not None and recall >= self.recall_target
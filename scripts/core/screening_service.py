@@ -0,0 +1,359 @@
+# scripts/core/screening_service.py
+
+"""
+Shared local screening service: one rate-limit budget for all projects
+
+Screening processes of several projects point their Anthropic client at
+this service (03_screen_papers.py --service URL) instead of the API.
+The service forwards their Messages API requests upstream through a
+FairScheduler that
+
+- caps in-flight requests (and optionally requests per minute) globally,
+- serves projects round-robin, so a project with 10,000 queued papers
+  cannot starve one with 200,
+- turns a 429/529 from upstream into a global cool-down (honouring
+  retry-after) and retries the request itself, so the processes do not
+  each hammer the limit with their own back-off.
+
+Projects are identified by the X-Screening-Project request header
+(percent-encoded project path).
+Results are still written by each screening process into its own
+data/02_screening directory (journal, cache, CSVs), so a job's output
+is identical to a stand-alone run.
+
+Jobs can also be submitted to the service (POST /v1/jobs), which then
+runs 03_screen_papers.py for the project with --service pointing back
+at itself. GET /v1/service/stats reports per-project counters.
+
+Usage:
+    with ScreeningService(max_concurrency=32) as service:
+        subprocess.run([..., '03_screen_papers.py', '--service', service.base_url, ...])
+"""
+
+import http.client
+import json
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+
+
+PROJECT_HEADER = 'X-Screening-Project'
+
+# Upstream statuses retried by the service after a global cool-down
+RETRY_STATUSES = (429, 529)
+
+# Hop-by-hop / re-encoded headers that must not be copied between connections
+_SKIP_HEADERS = {'host', 'content-length', 'connection', 'transfer-encoding', 'content-encoding',
+                 'keep-alive', PROJECT_HEADER.lower()}
+
+
+class FairScheduler:
+    """Global concurrency / request-rate budget shared round-robin across projects"""
+
+    def __init__(self, max_concurrency: int = 32, max_requests_per_minute: Optional[float] = None):
+        """
+        Args:
+            max_concurrency: Upstream requests in flight across all projects
+            max_requests_per_minute: Upstream request rate across all projects (None = unlimited)
+        """
+        self.max_concurrency = max_concurrency
+        self.interval = 60.0 / max_requests_per_minute if max_requests_per_minute else 0.0
+        self.condition = threading.Condition()
+        self.queues: 'OrderedDict[str, deque]' = OrderedDict()
+        self.active = 0
+        self.next_start = 0.0
+        self.cooldown_until = 0.0
+
+    def _dispatch(self):
+        """Grant waiting tickets round-robin while budget is left (lock held)"""
+        granted = False
+        while self.active < self.max_concurrency and self.queues:
+            now = time.monotonic()
+            if now < self.cooldown_until or now < self.next_start:
+                break
+            project, queue = next(iter(self.queues.items()))
+            ticket = queue.popleft()
+            # Rotate: the project goes to the back of the line
+            del self.queues[project]
+            if queue:
+                self.queues[project] = queue
+            ticket['granted'] = True
+            self.active += 1
+            self.next_start = max(now, self.next_start) + self.interval
+            granted = True
+        if granted:
+            self.condition.notify_all()
+
+    def acquire(self, project: str):
+        """Block until the project's request may be sent upstream"""
+        ticket = {'granted': False}
+        with self.condition:
+            self.queues.setdefault(project, deque()).append(ticket)
+            while True:
+                self._dispatch()
+                if ticket['granted']:
+                    return
+                wait = max(self.cooldown_until, self.next_start) - time.monotonic()
+                self.condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self):
+        """Return a slot after the upstream response arrived"""
+        with self.condition:
+            self.active -= 1
+            self._dispatch()
+            self.condition.notify_all()
+
+    def cool_down(self, seconds: float):
+        """Hold all new upstream requests for the given time (after a 429/529)"""
+        with self.condition:
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + seconds)
+
+    def waiting(self) -> Dict[str, int]:
+        """Queued requests per project"""
+        with self.condition:
+            return {project: len(queue) for project, queue in self.queues.items()}
+
+
+def retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait after a 429/529 (retry-after-ms / retry-after, else exponential)"""
+    for name, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+        value = headers.get(name)
+        if value:
+            try:
+                return max(float(value) * scale, 0.0)
+            except ValueError:
+                pass
+    return min(2.0 ** attempt, 30.0)
+
+
+class ScreeningService:
+    """Threaded local HTTP service forwarding Messages API calls under a fair global budget"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 upstream: str = 'https://api.anthropic.com', max_concurrency: int = 32,
+                 max_requests_per_minute: Optional[float] = None, max_retries: int = 6,
+                 timeout: float = 600.0):
+        """
+        Args:
+            host: Bind address
+            port: Bind port (0 = pick a free port)
+            upstream: Anthropic API base URL requests are forwarded to
+            max_concurrency: Upstream requests in flight across all projects
+            max_requests_per_minute: Upstream request rate across all projects
+            max_retries: Service-side retries of a 429/529 before passing it on
+            timeout: Upstream request timeout in seconds
+        """
+        self.upstream = urlsplit(upstream.rstrip('/'))
+        self.scheduler = FairScheduler(max_concurrency, max_requests_per_minute)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.connections = threading.local()  # One keep-alive upstream connection per handler thread
+        self.lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.jobs: Dict[str, Dict] = {}
+
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+                self.send_response(status)
+                for name, value in (headers or {'Content-Type': 'application/json'}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_json(self, status: int, payload):
+                self._send(status, json.dumps(payload, default=str).encode('utf-8'))
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+            def do_POST(self):
+                path = self.path.split('?')[0]
+                body = self._body()
+                if path == '/v1/jobs':
+                    try:
+                        self._send_json(200, service.submit_job(**json.loads(body or b'{}')))
+                    except (TypeError, ValueError) as e:
+                        self._send_json(400, {'type': 'error', 'error': {'type': 'invalid_request_error',
+                                                                         'message': str(e)}})
+                    return
+                self._send(*service.forward('POST', self.path, self.headers, body))
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path == '/v1/service/stats':
+                    self._send_json(200, service.snapshot())
+                elif path == '/v1/jobs':
+                    self._send_json(200, service.job_list())
+                else:
+                    self._send(*service.forward('GET', self.path, self.headers, None))
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'ScreeningService':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'ScreeningService':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def count(self, project: str, key: str, n: int = 1):
+        with self.lock:
+            counters = self.stats.setdefault(project, {'requests': 0, 'forwarded': 0, 'retried': 0, 'failed': 0})
+            counters[key] += n
+
+    def upstream_request(self, method: str, path: str, headers: Dict[str, str], body: Optional[bytes]):
+        """
+        One upstream HTTP exchange on this thread's keep-alive connection
+
+        Returns:
+            (status, body, response headers)
+        """
+        for reuse in (True, False):
+            connection = getattr(self.connections, 'connection', None)
+            if connection is None:
+                connection_class = (http.client.HTTPSConnection if self.upstream.scheme == 'https'
+                                    else http.client.HTTPConnection)
+                connection = connection_class(self.upstream.netloc, timeout=self.timeout)
+                self.connections.connection = connection
+            try:
+                connection.request(method, self.upstream.path + path, body=body, headers=headers)
+                response = connection.getresponse()
+                return response.status, response.read(), dict(response.getheaders())
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                self.connections.connection = None
+                if not reuse:
+                    raise
+
+    def forward(self, method: str, path: str, headers, body: Optional[bytes]):
+        """
+        Send one client request upstream
+
+        Messages API calls wait for the fair scheduler and are retried
+        after a global cool-down on 429/529; other calls (batches,
+        polling) pass straight through.
+
+        Returns:
+            (status, body, response headers)
+        """
+        project = unquote(headers.get(PROJECT_HEADER) or 'default')
+        upstream_headers = {name: value for name, value in headers.items()
+                            if name.lower() not in _SKIP_HEADERS and name.lower() != 'accept-encoding'}
+        scheduled = method == 'POST' and path.split('?')[0] == '/v1/messages'
+        self.count(project, 'requests')
+
+        attempt = 0
+        while True:
+            if scheduled:
+                self.scheduler.acquire(project)
+            try:
+                status, content, response_headers = self.upstream_request(method, path, upstream_headers, body)
+            except (http.client.HTTPException, OSError) as e:
+                self.count(project, 'failed')
+                message = {'type': 'error', 'error': {'type': 'api_error', 'message': f'Upstream error: {e}'}}
+                return 502, json.dumps(message).encode('utf-8'), {'Content-Type': 'application/json'}
+            finally:
+                if scheduled:
+                    self.scheduler.release()
+
+            self.count(project, 'forwarded')
+            response_headers = {name.lower(): value for name, value in response_headers.items()}
+            if scheduled and status in RETRY_STATUSES and attempt < self.max_retries:
+                self.scheduler.cool_down(retry_delay(response_headers, attempt))
+                self.count(project, 'retried')
+                attempt += 1
+                continue
+
+            if status >= 400:
+                self.count(project, 'failed')
+            return status, content, {name: value for name, value in response_headers.items()
+                                     if name not in _SKIP_HEADERS}
+
+    def snapshot(self) -> Dict:
+        """Per-project counters, queue lengths and global budget"""
+        with self.lock:
+            projects = {project: dict(counters) for project, counters in self.stats.items()}
+        return {
+            'max_concurrency': self.scheduler.max_concurrency,
+            'active': self.scheduler.active,
+            'waiting': self.scheduler.waiting(),
+            'projects': projects,
+            'jobs': len(self.jobs),
+        }
+
+    def submit_job(self, project: str, question: str, args: Optional[List[str]] = None) -> Dict:
+        """
+        Run 03_screen_papers.py for a project through this service
+
+        Args:
+            project: Project directory
+            question: Research question
+            args: Extra 03_screen_papers.py arguments (e.g. ["--mode", "sync"])
+
+        Returns:
+            Job description (id, project, status, log file)
+        """
+        project_path = Path(project).resolve()
+        if not project_path.exists():
+            raise ValueError(f'Project path does not exist: {project_path}')
+        log_file = project_path / "data" / "02_screening" / "service_job.log"
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        command = [
+            sys.executable, str(Path(__file__).resolve().parent.parent / '03_screen_papers.py'),
+            '--project', str(project_path), '--question', question, '--service', self.base_url,
+            *(args or []),
+        ]
+        with open(log_file, 'ab') as log:
+            process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+
+        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        with self.lock:
+            self.jobs[job_id] = {
+                'id': job_id, 'project': str(project_path), 'process': process,
+                'log': str(log_file), 'submitted_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+        return self.job_info(job_id)
+
+    def job_info(self, job_id: str) -> Dict:
+        job = self.jobs[job_id]
+        returncode = job['process'].poll()
+        status = 'running' if returncode is None else ('finished' if returncode == 0 else 'failed')
+        return {key: value for key, value in job.items() if key != 'process'} | {
+            'status': status, 'returncode': returncode,
+        }
+
+    def job_list(self) -> List[Dict]:
+        with self.lock:
+            job_ids = list(self.jobs)
+        return [self.job_info(job_id) for job_id in job_ids]
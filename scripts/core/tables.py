@@ -0,0 +1,102 @@
+# scripts/core/tables.py
+
+"""
+Screening output tables in CSV or columnar (Parquet) format
+
+Writers pick the format; readers take the stage's base path
+(e.g. data/02_screening/human_review_queue.csv) and load whichever
+variant exists, the newer one if both do. With Parquet, readers can
+load only the columns they need, so long text columns (abstract,
+reasoning, evidence) are never parsed for a count or a decision
+lookup.
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+
+TABLE_FORMATS = ('csv', 'parquet')
+
+
+def write_table(df: pd.DataFrame, path: Path, fmt: str = 'csv') -> Path:
+    """
+    Write a table as CSV or Parquet
+
+    Args:
+        df: Table to write
+        path: Output path (the suffix is replaced to match fmt)
+        fmt: "csv" or "parquet" (falls back to CSV without pyarrow)
+
+    Returns:
+        Path actually written
+    """
+    path = Path(path)
+    if fmt == 'parquet':
+        try:
+            parquet_path = path.with_suffix('.parquet')
+            df.to_parquet(parquet_path, index=False)
+            return parquet_path
+        except ImportError:
+            pass
+    csv_path = path.with_suffix('.csv')
+    df.to_csv(csv_path, index=False)
+    return csv_path
+
+
+def table_path(path: Path) -> Optional[Path]:
+    """
+    Existing CSV/Parquet variant of a table (the newer one if both exist)
+
+    Args:
+        path: Table path with either suffix
+
+    Returns:
+        Path or None if neither exists
+    """
+    path = Path(path)
+    candidates = [p for p in (path.with_suffix('.parquet'), path.with_suffix('.csv')) if p.exists()]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def read_table(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a table written by write_table
+
+    Args:
+        path: Table path with either suffix
+        columns: Load only these columns (missing ones are skipped)
+
+    Returns:
+        DataFrame
+
+    Raises:
+        FileNotFoundError: If neither variant exists
+    """
+    found = table_path(path)
+    if found is None:
+        raise FileNotFoundError(f"No CSV or Parquet table at {Path(path).with_suffix('')}")
+    if found.suffix == '.parquet':
+        if columns is None:
+            return pd.read_parquet(found)
+        import pyarrow.parquet as pq
+        available = set(pq.read_schema(found).names)
+        return pd.read_parquet(found, columns=[c for c in columns if c in available])
+    if columns is None:
+        return pd.read_csv(found)
+    wanted = set(columns)
+    return pd.read_csv(found, usecols=lambda c: c in wanted)
+
+
+def count_rows(path: Path) -> int:
+    """Number of rows in a table (Parquet: from the footer, no data read)"""
+    found = table_path(path)
+    if found is None:
+        return 0
+    if found.suffix == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(found).metadata.num_rows
+    return len(pd.read_csv(found, usecols=[0]))
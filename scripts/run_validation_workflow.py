@@ -26,6 +26,9 @@ import sys
 import subprocess
 import random
 
+from core.identifiers import review_paper_ids
+from core.tables import read_table, table_path
+
 
 class ValidationWorkflow:
     """Orchestrate complete validation workflow"""
@@ -45,13 +48,13 @@ class ValidationWorkflow:
 
     def check_prerequisites(self):
         """Check that AI screening has been completed"""
-        if not self.ai_decisions_file.exists():
+        if table_path(self.ai_decisions_file) is None:
             print("❌ Error: AI screening not found")
             print(f"   Expected: {self.ai_decisions_file}")
             print("   Run screening first: python scripts/03_screen_papers.py")
             sys.exit(1)
 
-        print(f"✓ Found AI screening results: {self.ai_decisions_file}")
+        print(f"✓ Found AI screening results: {table_path(self.ai_decisions_file)}")
 
     def create_validation_sample(self):
         """Create stratified random sample for validation"""
@@ -59,12 +62,12 @@ class ValidationWorkflow:
         print(f"\n📋 Creating validation sample...")
 
         # Load AI decisions
-        df_ai = pd.read_csv(self.ai_decisions_file)
+        df_ai = read_table(self.ai_decisions_file)
         print(f"   Total papers: {len(df_ai)}")
 
         # Check if we should sample from human review queue or all papers
-        if self.human_review_queue_file.exists():
-            df_queue = pd.read_csv(self.human_review_queue_file)
+        if table_path(self.human_review_queue_file) is not None:
+            df_queue = read_table(self.human_review_queue_file)
             print(f"   Human review queue: {len(df_queue)} papers (borderline scores)")
 
             # Sample from queue (priority)
@@ -118,12 +121,8 @@ class ValidationWorkflow:
 
             df_sample = pd.concat(samples, ignore_index=True)
 
-        # Add paper_id if not present (needed for Cohen's Kappa)
-        if 'paper_id' not in df_sample.columns:
-            df_sample['paper_id'] = df_sample.apply(
-                lambda row: f"{row['title']}_{row.get('year', 'unknown')}",
-                axis=1
-            )
+        # Same paper key as 03b_human_review.py (needed for Cohen's Kappa)
+        df_sample['paper_id'] = review_paper_ids(df_sample)
 
         # Save sample
         df_sample.to_csv(self.sample_file, index=False)
@@ -176,20 +175,18 @@ class ValidationWorkflow:
         # Prepare AI decisions for validation
         # Read human decisions to get paper_ids
         df_human = pd.read_csv(self.human_decisions_file)
-        paper_ids = set(df_human['paper_id'])
-
-        # Read AI decisions and filter to matching papers
-        df_ai = pd.read_csv(self.ai_decisions_file)
+        paper_ids = set(review_paper_ids(df_human))
 
-        # Add paper_id if not present
-        if 'paper_id' not in df_ai.columns:
-            df_ai['paper_id'] = df_ai.apply(
-                lambda row: f"{row['title']}_{row.get('year', 'unknown')}",
-                axis=1
-            )
+        # Read AI decisions and key them the way 03b_human_review.py does
+        df_ai = read_table(self.ai_decisions_file)
+        df_ai['paper_id'] = review_paper_ids(df_ai)
 
         # Filter to validation sample
         df_ai_sample = df_ai[df_ai['paper_id'].isin(paper_ids)].copy()
+        unmatched = len(paper_ids) - df_ai_sample['paper_id'].nunique()
+        if unmatched:
+            print(f"   ⚠️  {unmatched} human decisions match no screened paper")
+            print(f"      Re-key older decisions: python scripts/03b_human_review.py --project {self.project_path} --export")
 
         # Create ai_decision column from decision
         df_ai_sample['ai_decision'] = df_ai_sample['decision'].apply(
@@ -89,6 +89,14 @@ TEST_PAPERS = [
         "expected_decision": "human-review",
         "expected_score_range": (25, 40),
         "reasoning": "Not chatbots but VR, but still relevant to speaking proficiency in language learning"
+    },
+    {
+        "title": "Conversational Agents for Oral Practice in EFL Classrooms",
+        "abstract": "",
+        "expected_decision": "auto-exclude",
+        "expected_score_range": (0, 0),
+        "reasoning": "No abstract: excluded without an API call, and must stay auto-exclude even though "
+                     "score 0 is not below the auto_exclude threshold of 0 (regression check)"
     }
 ]
 